@@ -11,22 +11,30 @@ Usage:
 
 import os
 import sys
-from streamlit.web import cli as stcli
+
+# Set once the launcher has prepared sys.path/PYTHONPATH for this process tree
+BOOTSTRAP_ENV_VAR = "PCGS_LAUNCHER_BOOTSTRAPPED"
 
 
 def main():
     # Determine repo root (directory containing this file)
     repo_root = os.path.dirname(os.path.abspath(__file__))
 
-    # Ensure the "src" directory is on PYTHONPATH so `pcgs_app` is importable
     src_dir = os.path.join(repo_root, "src")
-    if src_dir not in sys.path:
-        sys.path.insert(0, src_dir)
 
-    # Also set the environment variable so child processes (Streamlit) inherit it
-    existing_pythonpath = os.environ.get("PYTHONPATH", "")
-    if src_dir not in existing_pythonpath:
-        os.environ["PYTHONPATH"] = src_dir + os.pathsep + existing_pythonpath
+    # Path setup only needs to happen once per process tree; child processes
+    # inherit both the sentinel and the PYTHONPATH set below.
+    if os.environ.get(BOOTSTRAP_ENV_VAR) != "1":
+        # Ensure the "src" directory is on PYTHONPATH so `pcgs_app` is importable
+        if src_dir not in sys.path:
+            sys.path.insert(0, src_dir)
+
+        # Also set the environment variable so child processes (Streamlit) inherit it
+        existing_pythonpath = os.environ.get("PYTHONPATH", "")
+        if src_dir not in existing_pythonpath.split(os.pathsep):
+            os.environ["PYTHONPATH"] = os.pathsep.join(filter(None, [src_dir, existing_pythonpath]))
+
+        os.environ[BOOTSTRAP_ENV_VAR] = "1"
 
     # Path to the V2 Streamlit entry point (app shell that uses app_root.get_app_tabs)
     app_path = os.path.join(src_dir, "pcgs_app", "main_shell.py")
@@ -34,7 +42,9 @@ def main():
     # Construct the command
     sys.argv = ["streamlit", "run", app_path, "--server.headless", "true"]
 
-    # Run Streamlit
+    # Run Streamlit (imported here so the launcher itself starts instantly)
+    from streamlit.web import cli as stcli
+
     sys.exit(stcli.main())
 
 
@@ -1,15 +1,14 @@
-import streamlit as st
-
-# New v2 console tab
-from pcgs_app.ui.tabs.tab_create_course import render_tab_create_course
-
-
 def main() -> None:
     """
     Dev entry-point for the Prometheus V2 Create Course console.
 
     This does NOT affect the legacy UI – it's just a sandbox runner.
     """
+    import streamlit as st
+
+    # New v2 console tab
+    from pcgs_app.ui.tabs.tab_create_course import render_tab_create_course
+
     st.set_page_config(
         page_title="Prometheus V2 – Create Course (Dev)",
         layout="wide",
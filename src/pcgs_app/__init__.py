@@ -7,8 +7,21 @@ service integrations, and UI scaffolding so that future modules can grow
 independently while remaining connected through clear interfaces.
 """
 
-from . import core, logic, services, ui  # noqa: F401
+import importlib
 
 __all__ = ["core", "logic", "services", "ui"]
 
 
+def __getattr__(name):
+    """Import subpackages on first attribute access (PEP 562)."""
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
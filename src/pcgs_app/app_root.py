@@ -7,23 +7,36 @@ implementation details. In Phase 1 this simply returns placeholder tab
 renderers; later it will coordinate state, routing, and permissions.
 """
 
-from typing import Callable, Dict, List
+import importlib
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Tuple
 
-from .ui.tabs import (
-    tab_content,
-    tab_create_course,
-    tab_exports,
-    tab_lessons,
-    tab_planner,
-    tab_scalar,
-)
+TabDescriptor = Mapping[str, Any]
 
-TabDescriptor = Dict[str, Callable[[], None]]
 
+def _lazy_renderer(module_name: str, attr: str) -> Callable[[], None]:
+    """
+    Return a renderer that imports its tab module on first invocation.
 
-def get_app_tabs() -> List[TabDescriptor]:
+    Only one tab is active per rerun, so deferring the import keeps the shell
+    from loading every tab tree at startup.
     """
-    Return the ordered list of tab descriptors for the Streamlit shell.
+
+    def _render() -> None:
+        module = importlib.import_module(f"{__package__}.ui.tabs.{module_name}")
+        getattr(module, attr)()
+
+    return _render
+
+
+@lru_cache(maxsize=1)
+def get_app_tabs() -> Tuple[TabDescriptor, ...]:
+    """
+    Return the ordered tab descriptors for the Streamlit shell.
+
+    The descriptors are static, so they are built once and returned as a
+    read-only tuple of read-only mappings on every subsequent rerun.
 
     Each descriptor defines:
     - id: stable identifier for routing/state
@@ -33,37 +46,37 @@ def get_app_tabs() -> List[TabDescriptor]:
 
     # TODO: Derive this list dynamically once navigation metadata is stored in
     # a configuration layer and permissions are enforced.
-    return [
-        {
+    return (
+        MappingProxyType({
             "id": "create",
             "label": "Create & Review",
-            "renderer": tab_create_course.render_tab_create_course,
-        },
-        {
+            "renderer": _lazy_renderer("tab_create_course", "render_tab_create_course"),
+        }),
+        MappingProxyType({
             "id": "scalar",
             "label": "Produce & Manage Scalar",
-            "renderer": tab_scalar.render_tab_scalar,
-        },
-        {
+            "renderer": _lazy_renderer("tab_scalar", "render_tab_scalar"),
+        }),
+        MappingProxyType({
             "id": "content",
             "label": "Manage Content",
-            "renderer": tab_content.render_tab_content,
-        },
-        {
+            "renderer": _lazy_renderer("tab_content", "render_tab_content"),
+        }),
+        MappingProxyType({
             "id": "lessons",
             "label": "Build Lessons",
-            "renderer": tab_lessons.render_tab_lessons,
-        },
-        {
+            "renderer": _lazy_renderer("tab_lessons", "render_tab_lessons"),
+        }),
+        MappingProxyType({
             "id": "planner",
             "label": "Planner",
-            "renderer": tab_planner.render_tab_planner,
-        },
-        {
+            "renderer": _lazy_renderer("tab_planner", "render_tab_planner"),
+        }),
+        MappingProxyType({
             "id": "exports",
             "label": "Generate Courseware",
-            "renderer": tab_exports.render_tab_exports,
-        },
-    ]
+            "renderer": _lazy_renderer("tab_exports", "render_tab_exports"),
+        }),
+    )
 
 
@@ -7,10 +7,28 @@ implementation. Over time the app layer can introduce adapters, validators,
 and compatibility helpers without forcing the UI or services to refactor.
 """
 
-from pcgs_core import __version__  # noqa: F401
-
-from . import config, models, storage  # noqa: F401
+import importlib
 
 __all__ = ["__version__", "config", "models", "storage"]
 
+_LAZY_SUBMODULES = {"config", "models", "storage"}
+
+
+def __getattr__(name):
+    """Resolve re-exports on first access so `pcgs_app.core.auth` stays cheap."""
+    if name == "__version__":
+        from pcgs_core import __version__
+
+        globals()[name] = __version__
+        return __version__
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
@@ -5,8 +5,16 @@ Defines placeholders for future user/session management. The legacy
 Prometheus1 implementation handled authentication implicitly via Streamlit
 session state; in v2 we will centralise role-based access controls and session
 management within the app layer.
+
+This module sits on the rerun import path, so keep it import-free at module
+level; storage/session dependencies should be imported inside the functions
+that need them.
 """
 
+__all__ = ["get_current_user", "require_role"]
+
+_AUTHZ_NOT_IMPLEMENTED = "Authorization checks not yet implemented."
+
 
 def get_current_user():
     """
@@ -25,6 +33,6 @@ def require_role(role: str) -> None:
 
     # TODO: Re-implement the legacy "Admin vs Developer" restrictions with a
     # proper policy engine and audit logging.
-    raise NotImplementedError("Authorization checks not yet implemented.")
+    raise NotImplementedError(_AUTHZ_NOT_IMPLEMENTED)
 
 
@@ -7,8 +7,17 @@ enhancements (theme selection, workspace contexts) can hook in here without
 modifying the lower-level config module immediately.
 """
 
-from pcgs_core.config import Config, load_config  # noqa: F401
+import importlib
 
 __all__ = ["Config", "load_config"]
 
 
+def __getattr__(name):
+    """Resolve re-exports from `pcgs_core.config` on first access (PEP 562)."""
+    if name in __all__:
+        value = getattr(importlib.import_module("pcgs_core.config"), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
@@ -7,8 +7,17 @@ This makes it easier to introduce compatibility shims or extended metadata in
 the future without rewriting existing modules.
 """
 
-from pcgs_core.models import Course, Lesson, Timetable, User  # noqa: F401
+import importlib
 
 __all__ = ["Course", "Lesson", "Timetable", "User"]
 
 
+def __getattr__(name):
+    """Resolve re-exports from `pcgs_core.models` on first access (PEP 562)."""
+    if name in __all__:
+        value = getattr(importlib.import_module("pcgs_core.models"), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
@@ -21,9 +21,13 @@ These models serialize to Dict for storage in Course.scalar (List[Dict[str, Any]
 to maintain compatibility with existing storage layer.
 """
 
+import re
+import sys
 from dataclasses import dataclass, field, asdict
 from enum import Enum
-from typing import Any, Dict, List, Literal, Optional
+from itertools import chain
+from operator import attrgetter
+from typing import Any, Dict, FrozenSet, Iterable, List, Literal, Optional, Tuple
 
 
 class ScalarLevel(str, Enum):
@@ -42,7 +46,7 @@ class ScalarLevel(str, Enum):
 
 # Excel column mapping for each scalar level
 # (serial_column, text_column) - 0-indexed from column A
-EXCEL_COLUMN_MAP: Dict[ScalarLevel, tuple] = {
+EXCEL_COLUMN_MAP: Dict[ScalarLevel, Tuple[int, int]] = {
     ScalarLevel.CLO: (1, 2),                    # B, C
     ScalarLevel.TOPIC: (3, 4),                  # D, E
     ScalarLevel.SUBTOPIC: (5, 6),               # F, G
@@ -50,11 +54,28 @@ EXCEL_COLUMN_MAP: Dict[ScalarLevel, tuple] = {
     ScalarLevel.PERFORMANCE_CRITERIA: (9, 10),  # J, K
 }
 
+# Flattened (level, serial_column, text_column) rows for import loops
+EXCEL_LEVEL_COLUMNS: Tuple[Tuple[ScalarLevel, int, int], ...] = tuple(
+    (level, serial_col, text_col)
+    for level, (serial_col, text_col) in EXCEL_COLUMN_MAP.items()
+)
+
+# Number of columns a template row spans (A through K)
+EXCEL_COLUMN_COUNT = max(max(s, t) for _, s, t in EXCEL_LEVEL_COLUMNS) + 1
+
 # Row where data starts (0-indexed, so row 6 = index 5)
 EXCEL_DATA_START_ROW = 5
 
+# C-level sort key for ordering entries within a level
+_ORDER_KEY = attrgetter("order_index")
+
+# Value -> member lookup used when deserializing stored levels, and the
+# interned reverse mapping used when serializing
+_LEVEL_BY_VALUE: Dict[str, ScalarLevel] = {level.value: level for level in ScalarLevel}
+_LEVEL_VALUE: Dict[ScalarLevel, str] = {level: sys.intern(level.value) for level in ScalarLevel}
 
-@dataclass
+
+@dataclass(slots=True)
 class ScalarEntry:
     """
     A single entry in the course scalar.
@@ -78,6 +99,13 @@ class ScalarEntry:
     parent_serial: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    def __post_init__(self) -> None:
+        # Serials repeat heavily across a scalar ("1", "1.1", ...); share them
+        if type(self.serial) is str:
+            self.serial = sys.intern(self.serial)
+        if type(self.parent_serial) is str:
+            self.parent_serial = sys.intern(self.parent_serial)
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         Serialize to dictionary for storage in Course.scalar.
@@ -86,12 +114,13 @@ class ScalarEntry:
             Dict with all fields, level converted to string value.
         """
         return {
-            "level": self.level.value,
+            "level": _LEVEL_VALUE[self.level],
             "serial": self.serial,
             "text": self.text,
             "order_index": self.order_index,
             "parent_serial": self.parent_serial,
-            "metadata": self.metadata,
+            # Copied so stored dicts never alias the live entry's metadata
+            "metadata": dict(self.metadata),
         }
     
     @classmethod
@@ -105,27 +134,24 @@ class ScalarEntry:
         Returns:
             ScalarEntry instance
         """
-        level_value = data.get("level", "CLO")
-        try:
-            level = ScalarLevel(level_value)
-        except ValueError:
-            # Fallback for legacy data
-            level = ScalarLevel.CLO
+        get = data.get
+        # Direct member lookup; unknown legacy values fall back to CLO
+        level = _LEVEL_BY_VALUE.get(get("level", "CLO"), ScalarLevel.CLO)
         
         return cls(
-            level=level,
-            serial=data.get("serial", ""),
-            text=data.get("text", ""),
-            order_index=data.get("order_index", 0),
-            parent_serial=data.get("parent_serial"),
-            metadata=data.get("metadata", {}),
+            level,
+            get("serial", ""),
+            get("text", ""),
+            get("order_index", 0),
+            get("parent_serial"),
+            dict(get("metadata") or ()),
         )
     
     def __str__(self) -> str:
-        return f"{self.serial}: {self.text[:50]}..." if len(self.text) > 50 else f"{self.serial}: {self.text}"
+        text = self.text
+        return f"{self.serial}: {text:.50}{'...' if len(text) > 50 else ''}"
 
 
-@dataclass
 class ScalarCollection:
     """
     Container for all scalar entries in a course, organized by level.
@@ -135,32 +161,87 @@ class ScalarCollection:
     - Counting entries per level
     - Serializing/deserializing the full scalar
     - Auto-renumbering after modifications
+    
+    Entries are stored in per-level buckets (plus a serial -> entry map per
+    level), so level queries and removals only touch the affected level.
+    `entries` is a read-only snapshot grouped in ScalarLevel order. Change
+    serials through the methods below (or call `_index_serials()`) so the
+    serial maps stay in sync.
+    
+    `version` increases on every mutation so callers can cache derived views;
+    call `mark_modified()` after editing an entry's fields in place.
     """
-    entries: List[ScalarEntry] = field(default_factory=list)
+    __slots__ = ("_by_level", "_serial_index", "_version")
+    
+    def __init__(self, entries: Optional[Iterable[ScalarEntry]] = None) -> None:
+        self._by_level: Dict[ScalarLevel, List[ScalarEntry]] = {level: [] for level in ScalarLevel}
+        self._serial_index: Dict[ScalarLevel, Dict[str, ScalarEntry]] = {
+            level: {} for level in ScalarLevel
+        }
+        for entry in entries or ():
+            self._by_level[entry.level].append(entry)
+            self._serial_index[entry.level].setdefault(entry.serial, entry)
+        self._version = 0
+    
+    @property
+    def version(self) -> int:
+        """Mutation counter, bumped by every method that changes entries."""
+        return self._version
+    
+    def mark_modified(self) -> None:
+        """Record an in-place edit made outside the collection's methods."""
+        self._version += 1
+    
+    @property
+    def entries(self) -> List[ScalarEntry]:
+        """All entries grouped by level (a snapshot; mutate via methods)."""
+        return list(chain.from_iterable(self._by_level.values()))
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ScalarCollection):
+            return NotImplemented
+        return self._by_level == other._by_level
+    
+    def __repr__(self) -> str:
+        return f"ScalarCollection(entries={self.entries!r})"
+    
+    def _index_serials(self, level: ScalarLevel) -> None:
+        """Rebuild the serial map for one level (first occurrence wins)."""
+        index: Dict[str, ScalarEntry] = {}
+        for entry in self._by_level[level]:
+            index.setdefault(entry.serial, entry)
+        self._serial_index[level] = index
     
     def get_by_level(self, level: ScalarLevel) -> List[ScalarEntry]:
         """Get all entries for a specific level, sorted by order_index."""
-        return sorted(
-            [e for e in self.entries if e.level == level],
-            key=lambda e: e.order_index
-        )
+        return sorted(self._by_level[level], key=_ORDER_KEY)
+    
+    def get_entry(self, level: ScalarLevel, serial: str) -> Optional[ScalarEntry]:
+        """Look up an entry by level and serial (first match if duplicated)."""
+        return self._serial_index[level].get(serial)
+    
+    def has_serial(self, level: ScalarLevel, serial: str) -> bool:
+        """Check whether a serial is already used within a level."""
+        return serial in self._serial_index[level]
     
     def count_by_level(self, level: ScalarLevel) -> int:
         """Count entries for a specific level."""
-        return len([e for e in self.entries if e.level == level])
+        return len(self._by_level[level])
     
     def get_counts(self) -> Dict[ScalarLevel, int]:
         """Get counts for all levels."""
-        return {level: self.count_by_level(level) for level in ScalarLevel}
+        return {level: len(bucket) for level, bucket in self._by_level.items()}
     
     def add_entry(self, entry: ScalarEntry) -> None:
         """
         Add an entry, auto-assigning order_index if not set.
         """
+        bucket = self._by_level[entry.level]
         if entry.order_index == 0:
-            level_entries = self.get_by_level(entry.level)
-            entry.order_index = len(level_entries) + 1
-        self.entries.append(entry)
+            entry.order_index = len(bucket) + 1
+        bucket.append(entry)
+        self._serial_index[entry.level].setdefault(entry.serial, entry)
+        self._version += 1
     
     def remove_entry(self, level: ScalarLevel, serial: str) -> bool:
         """
@@ -169,11 +250,33 @@ class ScalarCollection:
         Returns:
             True if entry was found and removed, False otherwise.
         """
-        for i, entry in enumerate(self.entries):
-            if entry.level == level and entry.serial == serial:
-                self.entries.pop(i)
-                return True
-        return False
+        entry = self._serial_index[level].get(serial)
+        if entry is None:
+            return False
+        _remove_by_identity(self._by_level[level], entry)
+        # Re-index so a duplicate serial (possible after Excel import) surfaces
+        self._index_serials(level)
+        self._version += 1
+        return True
+    
+    def discard_entry(self, entry: ScalarEntry) -> bool:
+        """
+        Remove this exact entry object, even if another entry shares its serial.
+        
+        Returns:
+            True if the entry was in the collection, False otherwise.
+        """
+        if not _remove_by_identity(self._by_level[entry.level], entry):
+            return False
+        self._index_serials(entry.level)
+        self._version += 1
+        return True
+    
+    def set_entry_serial(self, entry: ScalarEntry, new_serial: str) -> None:
+        """Change the serial of this exact entry object and re-index its level."""
+        entry.serial = new_serial
+        self._index_serials(entry.level)
+        self._version += 1
     
     def update_entry(self, level: ScalarLevel, serial: str, 
                      new_serial: Optional[str] = None, 
@@ -184,14 +287,16 @@ class ScalarCollection:
         Returns:
             True if entry was found and updated, False otherwise.
         """
-        for entry in self.entries:
-            if entry.level == level and entry.serial == serial:
-                if new_serial is not None:
-                    entry.serial = new_serial
-                if new_text is not None:
-                    entry.text = new_text
-                return True
-        return False
+        entry = self._serial_index[level].get(serial)
+        if entry is None:
+            return False
+        if new_serial is not None and new_serial != serial:
+            entry.serial = new_serial
+            self._index_serials(level)
+        if new_text is not None:
+            entry.text = new_text
+        self._version += 1
+        return True
     
     def reorder_level(self, level: ScalarLevel, serials_in_order: List[str]) -> None:
         """
@@ -202,10 +307,12 @@ class ScalarCollection:
             level: The level to reorder
             serials_in_order: List of serials in the desired order
         """
-        level_entries = {e.serial: e for e in self.entries if e.level == level}
+        index = self._serial_index[level]
         for idx, serial in enumerate(serials_in_order, start=1):
-            if serial in level_entries:
-                level_entries[serial].order_index = idx
+            entry = index.get(serial)
+            if entry is not None:
+                entry.order_index = idx
+        self._version += 1
     
     def renumber_level(self, level: ScalarLevel, prefix: str = "") -> None:
         """
@@ -220,40 +327,83 @@ class ScalarCollection:
         - Topics: 1.1, 1.2, ... (if prefix="1.")
         - Or simple: 1, 2, 3 if no prefix
         """
-        level_entries = self.get_by_level(level)
-        for idx, entry in enumerate(level_entries, start=1):
-            if prefix:
+        # Sort the bucket in place so no throwaway sorted copy is created
+        bucket = self._by_level[level]
+        bucket.sort(key=_ORDER_KEY)
+        if prefix:
+            for idx, entry in enumerate(bucket, start=1):
                 entry.serial = f"{prefix}{idx}"
-            else:
+                entry.order_index = idx
+        else:
+            for idx, entry in enumerate(bucket, start=1):
                 entry.serial = str(idx)
-            entry.order_index = idx
+                entry.order_index = idx
+        self._index_serials(level)
+        self._version += 1
     
     def to_list(self) -> List[Dict[str, Any]]:
         """
         Serialize all entries to list of dicts for Course.scalar storage.
         """
-        return [entry.to_dict() for entry in self.entries]
+        return [entry.to_dict() for entry in chain.from_iterable(self._by_level.values())]
     
     @classmethod
     def from_list(cls, data: List[Dict[str, Any]]) -> "ScalarCollection":
         """
         Reconstruct ScalarCollection from Course.scalar storage.
         """
-        entries = [ScalarEntry.from_dict(d) for d in data]
+        # Inlined ScalarEntry.from_dict with locals bound once for the loop
+        make_entry = ScalarEntry
+        level_for = _LEVEL_BY_VALUE.get
+        fallback = ScalarLevel.CLO
+        # Serials are interned by ScalarEntry; repeated texts share one
+        # object per load through a local pool
+        text_pool: Dict[str, str] = {}
+        share_text = text_pool.setdefault
+        entries = []
+        append = entries.append
+        for item in data:
+            get = item.get
+            text = get("text", "")
+            append(make_entry(
+                level_for(get("level", "CLO"), fallback),
+                get("serial", ""),
+                share_text(text, text) if type(text) is str else text,
+                get("order_index", 0),
+                get("parent_serial"),
+                # Each entry owns its metadata; the source may be reloaded
+                dict(get("metadata") or ()),
+            ))
         return cls(entries=entries)
     
     def clear(self) -> None:
         """Clear all entries."""
-        self.entries.clear()
+        for bucket in self._by_level.values():
+            bucket.clear()
+        for index in self._serial_index.values():
+            index.clear()
+        self._version += 1
     
     def clear_level(self, level: ScalarLevel) -> None:
         """Clear all entries of a specific level."""
-        self.entries = [e for e in self.entries if e.level != level]
+        self._by_level[level] = []
+        self._serial_index[level] = {}
+        self._version += 1
+
+
+def _remove_by_identity(items: List[ScalarEntry], target: ScalarEntry) -> bool:
+    """Remove `target` itself (not an equal-valued duplicate) from `items`."""
+    for i, item in enumerate(items):
+        if item is target:
+            del items[i]
+            return True
+    return False
 
 
 # Bloom's Taxonomy verbs for CLO validation
-# These are commonly accepted performance verbs at various cognitive levels
-BLOOMS_VERBS = {
+# These are commonly accepted performance verbs at various cognitive levels.
+# Each verb is listed once, under the first level it belongs to.
+_BLOOMS_VERB_LIST = (
     # Remember
     "DEFINE", "DESCRIBE", "IDENTIFY", "LABEL", "LIST", "MATCH", "NAME",
     "OUTLINE", "RECALL", "RECOGNIZE", "REPRODUCE", "SELECT", "STATE",
@@ -272,22 +422,55 @@ BLOOMS_VERBS = {
     # Analyze
     "ANALYSE", "ANALYZE", "APPRAISE", "BREAKDOWN", "CATEGORIZE",
     "CRITICIZE", "DEBATE", "DIAGRAM", "DIFFERENTIATE", "DISCRIMINATE",
-    "EXAMINE", "EXPERIMENT", "INFER", "INSPECT", "INVESTIGATE",
+    "EXPERIMENT", "INFER", "INSPECT", "INVESTIGATE",
     "ORGANIZE", "QUESTION", "RELATE", "RESEARCH", "SEPARATE", "TEST",
     
     # Evaluate
-    "APPRAISE", "ARGUE", "ASSESS", "CHOOSE", "CONCLUDE", "CRITIQUE",
+    "ARGUE", "ASSESS", "CHOOSE", "CONCLUDE", "CRITIQUE",
     "DECIDE", "DEFEND", "EVALUATE", "JUDGE", "JUSTIFY", "MEASURE",
     "PRIORITIZE", "RANK", "RATE", "RECOMMEND", "REVIEW", "SCORE",
-    "SELECT", "SUPPORT", "VALIDATE", "VALUE", "VERIFY",
+    "SUPPORT", "VALIDATE", "VALUE", "VERIFY",
     
     # Create
-    "ARRANGE", "ASSEMBLE", "BUILD", "COMBINE", "COMPOSE", "CONSTRUCT",
+    "ARRANGE", "ASSEMBLE", "BUILD", "COMBINE", "COMPOSE",
     "CREATE", "DESIGN", "DEVELOP", "DEVISE", "FORMULATE", "GENERATE",
     "HYPOTHESIZE", "INTEGRATE", "INVENT", "MAKE", "ORIGINATE", "PLAN",
-    "PRODUCE", "PROPOSE", "REARRANGE", "RECONSTRUCT", "REORGANIZE",
+    "PROPOSE", "REARRANGE", "RECONSTRUCT", "REORGANIZE",
     "REVISE", "REWRITE", "SYNTHESIZE", "WRITE",
-}
+)
+
+BLOOMS_VERBS: FrozenSet[str] = frozenset(_BLOOMS_VERB_LIST)
+
+# Leading word with any trailing punctuation split off, in one anchored match
+_LEADING_WORD_RE = re.compile(r"\s*(\S+?)[.,;:]*(?:\s|$)")
+
+
+def correct_blooms_verb(text: str) -> Tuple[Optional[str], str]:
+    """
+    Find a leading Bloom's verb and capitalize it in place.
+    
+    Args:
+        text: The CLO text to check
+        
+    Returns:
+        Tuple of (verb, corrected_text); verb is the detected verb
+        (uppercase) or None, in which case the text is returned unchanged
+    """
+    if not text:
+        return (None, text)
+    
+    # Only the leading word matters, so avoid splitting the whole paragraph
+    match = _LEADING_WORD_RE.match(text)
+    if match is None:
+        return (None, text)
+    
+    first_word = match.group(1).upper()
+    if first_word not in BLOOMS_VERBS:
+        return (None, text)
+    
+    # Capitalize the verb in place, keeping surrounding text intact
+    start, end = match.span(1)
+    return (first_word, text[:start] + first_word.capitalize() + text[end:])
 
 
 def check_blooms_verb(text: str) -> tuple:
@@ -303,19 +486,6 @@ def check_blooms_verb(text: str) -> tuple:
         - verb: The detected verb (uppercase) or None
         - corrected_text: Text with the verb capitalized if found
     """
-    if not text or not text.strip():
-        return (False, None, text)
-    
-    words = text.strip().split()
-    if not words:
-        return (False, None, text)
-    
-    first_word = words[0].upper().rstrip(".,;:")
-    
-    if first_word in BLOOMS_VERBS:
-        # Capitalize the verb and reconstruct text
-        corrected = first_word.capitalize() + text[len(words[0]):]
-        return (True, first_word, corrected)
-    
-    return (False, None, text)
+    verb, corrected = correct_blooms_verb(text)
+    return (verb is not None, verb, corrected)
 
@@ -6,8 +6,17 @@ depend on a stable contract even as the underlying persistence strategy in
 `pcgs_core.storage` evolves (local JSON, SQLite, Postgres, etc.).
 """
 
-from pcgs_core.storage import list_courses, load_course, save_course  # noqa: F401
+import importlib
 
 __all__ = ["save_course", "load_course", "list_courses"]
 
 
+def __getattr__(name):
+    """Resolve re-exports from `pcgs_core.storage` on first access (PEP 562)."""
+    if name in __all__:
+        value = getattr(importlib.import_module("pcgs_core.storage"), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
@@ -0,0 +1,265 @@
+"""
+Generated normalised variant -> Lex lookup.
+
+DO NOT EDIT: regenerate with ``python tools/gen_variant_index.py``.
+"""
+
+from typing import Any, Dict
+
+
+def build_variant_index(Lex: Any) -> Dict[str, Any]:
+    """Return the variant index keyed by normalised term."""
+    return {
+        "courseinformation": Lex.C_INFO,
+        "courseinfo": Lex.C_INFO,
+        "coursedetails": Lex.C_INFO,
+        "metadata": Lex.C_INFO,
+        "cinfo": Lex.C_INFO,
+        "coursetitle": Lex.C_NAME,
+        "coursename": Lex.C_NAME,
+        "title": Lex.REF_TITLE,
+        "name": Lex.C_NAME,
+        "cname": Lex.C_NAME,
+        "courselevel": Lex.C_LEVEL,
+        "level": Lex.C_LEVEL,
+        "difficultylevel": Lex.EX_DIFF,
+        "clevel": Lex.C_LEVEL,
+        "thematicarea": Lex.C_THEME,
+        "thematic": Lex.C_THEME,
+        "theme": Lex.C_THEME,
+        "category": Lex.C_THEME,
+        "ctheme": Lex.C_THEME,
+        "duration": Lex.C_DURATION,
+        "courseduration": Lex.C_DURATION,
+        "length": Lex.C_DURATION,
+        "cduration": Lex.C_DURATION,
+        "coursecode": Lex.C_CODE,
+        "code": Lex.C_CODE,
+        "identifier": Lex.C_CODE,
+        "ccode": Lex.C_CODE,
+        "developername": Lex.C_DEV,
+        "developer": Lex.C_DEV,
+        "coursedeveloper": Lex.C_DEV,
+        "author": Lex.REF_AUTHOR,
+        "cdev": Lex.C_DEV,
+        "coursedescription": Lex.C_DESC,
+        "description": Lex.C_DESC,
+        "overview": Lex.C_DESC,
+        "summary": Lex.C_DESC,
+        "cdesc": Lex.C_DESC,
+        "courselearningobjective": Lex.CLO,
+        "clo": Lex.CLO,
+        "clos": Lex.CLO,
+        "lo": Lex.CLO,
+        "los": Lex.CLO,
+        "learningobjective": Lex.CLO,
+        "learningobjectives": Lex.CLO,
+        "courselearningobjectives": Lex.CLO,
+        "scalarmanager": Lex.SCALEMGR,
+        "scalar": Lex.SCALEMGR,
+        "scalartable": Lex.SCALEMGR,
+        "scalarindex": Lex.SCALEMGR,
+        "scalemgr": Lex.SCALEMGR,
+        "lessontitle": Lex.SC_LESSON,
+        "lesson": Lex.SC_LESSON,
+        "lessonname": Lex.SC_LESSON,
+        "sclesson": Lex.SC_LESSON,
+        "topic": Lex.EX_TOPIC,
+        "lessontopic": Lex.SC_TOPIC,
+        "moduletopic": Lex.SC_TOPIC,
+        "sctopic": Lex.SC_TOPIC,
+        "subtopic": Lex.SC_SUBTOPIC,
+        "element": Lex.SC_SUBTOPIC,
+        "scsubtopic": Lex.SC_SUBTOPIC,
+        "performancecriterion": Lex.SC_PC,
+        "performancecriteria": Lex.SC_PC,
+        "pc": Lex.SC_PC,
+        "pcs": Lex.SC_PC,
+        "performancemeasure": Lex.SC_PC,
+        "scpc": Lex.SC_PC,
+        "contentmanager": Lex.CONTMGR,
+        "contenthub": Lex.CONTMGR,
+        "resourcesmanager": Lex.CONTMGR,
+        "contmgr": Lex.CONTMGR,
+        "resource": Lex.CT_RESOURCE,
+        "file": Lex.CT_RESOURCE,
+        "document": Lex.CT_RESOURCE,
+        "attachment": Lex.CT_RESOURCE,
+        "link": Lex.REF_URL,
+        "media": Lex.CT_RESOURCE,
+        "ctresource": Lex.CT_RESOURCE,
+        "tag": Lex.SL_LABEL,
+        "label": Lex.SL_LABEL,
+        "descriptor": Lex.CT_TAG,
+        "cttag": Lex.CT_TAG,
+        "contentnote": Lex.CT_NOTE,
+        "note": Lex.CT_NOTE,
+        "annotation": Lex.CT_NOTE,
+        "comment": Lex.CT_NOTE,
+        "ctnote": Lex.CT_NOTE,
+        "lessonmanager": Lex.LSNMGR,
+        "lessonsmanager": Lex.LSNMGR,
+        "lessonbuilder": Lex.LSNMGR,
+        "lsnmgr": Lex.LSNMGR,
+        "slidetitle": Lex.SL_TITLE,
+        "titleblock": Lex.TPL_TITLE_BLOCK,
+        "slideheader": Lex.SL_TITLE,
+        "sltitle": Lex.SL_TITLE,
+        "slidesubtitle": Lex.SL_SUBTITLE,
+        "subtitle": Lex.SL_SUBTITLE,
+        "slsubtitle": Lex.SL_SUBTITLE,
+        "heading": Lex.SL_HEADING,
+        "sectionheader": Lex.SL_HEADING,
+        "h1": Lex.SL_HEADING,
+        "slheading": Lex.SL_HEADING,
+        "subheading": Lex.SL_SUBHEADING,
+        "h2": Lex.SL_SUBHEADING,
+        "slsubheading": Lex.SL_SUBHEADING,
+        "bodytext": Lex.SL_BODY,
+        "body": Lex.SL_BODY,
+        "paragraph": Lex.SL_BODY,
+        "text": Lex.SL_BODY,
+        "slbody": Lex.SL_BODY,
+        "bulletlist": Lex.SL_BULLETS,
+        "bullets": Lex.SL_BULLETS,
+        "bulletpoints": Lex.SL_BULLETS,
+        "list": Lex.SL_BULLETS,
+        "slbullets": Lex.SL_BULLETS,
+        "image": Lex.SL_IMAGE,
+        "picture": Lex.SL_IMAGE,
+        "photo": Lex.SL_IMAGE,
+        "graphic": Lex.SL_IMAGE,
+        "slimage": Lex.SL_IMAGE,
+        "quote": Lex.SL_QUOTE,
+        "pullquote": Lex.SL_QUOTE,
+        "highlightquote": Lex.SL_QUOTE,
+        "slquote": Lex.SL_QUOTE,
+        "marker": Lex.SL_LABEL,
+        "sllabel": Lex.SL_LABEL,
+        "table": Lex.SL_TABLE,
+        "datatable": Lex.SL_TABLE,
+        "grid": Lex.SL_TABLE,
+        "sltable": Lex.SL_TABLE,
+        "referenceentry": Lex.REF_ENTRY,
+        "reference": Lex.REF_ENTRY,
+        "bibliographyentry": Lex.REF_ENTRY,
+        "source": Lex.REF_ENTRY,
+        "refentry": Lex.REF_ENTRY,
+        "authors": Lex.REF_AUTHOR,
+        "refauthor": Lex.REF_AUTHOR,
+        "referencetitle": Lex.REF_TITLE,
+        "reftitle": Lex.REF_TITLE,
+        "publicationyear": Lex.REF_YEAR,
+        "year": Lex.REF_YEAR,
+        "date": Lex.REF_YEAR,
+        "refyear": Lex.REF_YEAR,
+        "referenceurl": Lex.REF_URL,
+        "url": Lex.REF_URL,
+        "doi": Lex.REF_URL,
+        "webaddress": Lex.REF_URL,
+        "refurl": Lex.REF_URL,
+        "referencetype": Lex.REF_TYPE,
+        "type": Lex.REF_TYPE,
+        "sourcetype": Lex.REF_TYPE,
+        "format": Lex.REF_TYPE,
+        "reftype": Lex.REF_TYPE,
+        "examquestion": Lex.EX_Q,
+        "question": Lex.EX_Q,
+        "mcq": Lex.EX_Q,
+        "item": Lex.EX_Q,
+        "exq": Lex.EX_Q,
+        "answeroption": Lex.EX_OPT,
+        "option": Lex.EX_OPT,
+        "choice": Lex.EX_OPT,
+        "exopt": Lex.EX_OPT,
+        "correctanswer": Lex.EX_KEY,
+        "key": Lex.EX_KEY,
+        "answerkey": Lex.EX_KEY,
+        "exkey": Lex.EX_KEY,
+        "explanation": Lex.EX_EXP,
+        "rationale": Lex.EX_EXP,
+        "feedback": Lex.EX_EXP,
+        "exexp": Lex.EX_EXP,
+        "difficulty": Lex.EX_DIFF,
+        "exdiff": Lex.EX_DIFF,
+        "questiontopic": Lex.EX_TOPIC,
+        "extopic": Lex.EX_TOPIC,
+        "prometheusknowledgeengine": Lex.PKE_ENGINE,
+        "pke": Lex.PKE_ENGINE,
+        "prometheusai": Lex.PKE_ENGINE,
+        "aiengine": Lex.PKE_ENGINE,
+        "pkeengine": Lex.PKE_ENGINE,
+        "pketerminal": Lex.PKE_TERM,
+        "aiterminal": Lex.PKE_TERM,
+        "aichatwindow": Lex.PKE_TERM,
+        "pketerm": Lex.PKE_TERM,
+        "pkeresponse": Lex.PKE_RESP,
+        "airesponse": Lex.PKE_RESP,
+        "pkeresp": Lex.PKE_RESP,
+        "templatemap": Lex.TPL_MAP,
+        "layoutmap": Lex.TPL_MAP,
+        "fieldmap": Lex.TPL_MAP,
+        "tplmap": Lex.TPL_MAP,
+        "exportengine": Lex.EXP_ENGINE,
+        "generator": Lex.EXP_ENGINE,
+        "exporter": Lex.EXP_ENGINE,
+        "expengine": Lex.EXP_ENGINE,
+        "sessionstate": Lex.SS_STATE,
+        "uistate": Lex.SS_STATE,
+        "state": Lex.SS_STATE,
+        "ssstate": Lex.SS_STATE,
+        "uipanel": Lex.UI_PANEL,
+        "panel": Lex.UI_PANEL,
+        "window": Lex.UI_PANEL,
+        "card": Lex.UI_PANEL,
+        "uiconnector": Lex.UI_CONNECT,
+        "connector": Lex.UI_CONNECT,
+        "flowline": Lex.UI_CONNECT,
+        "nodeconnection": Lex.UI_CONNECT,
+        "uiconnect": Lex.UI_CONNECT,
+        "templatetitleblock": Lex.TPL_TITLE_BLOCK,
+        "ppttitle": Lex.TPL_TITLE_BLOCK,
+        "slidetitleplaceholder": Lex.TPL_TITLE_BLOCK,
+        "tpltitleblock": Lex.TPL_TITLE_BLOCK,
+        "templatesubtitleblock": Lex.TPL_SUBTITLE_BLOCK,
+        "subtitleblock": Lex.TPL_SUBTITLE_BLOCK,
+        "pptsubtitle": Lex.TPL_SUBTITLE_BLOCK,
+        "tplsubtitleblock": Lex.TPL_SUBTITLE_BLOCK,
+        "templatebodytext": Lex.TPL_BODY,
+        "bodyblock": Lex.TPL_BODY,
+        "contentblock": Lex.TPL_BODY,
+        "textplaceholder": Lex.TPL_BODY,
+        "tplbody": Lex.TPL_BODY,
+        "templatebulletblock": Lex.TPL_BULLETS,
+        "bulletblock": Lex.TPL_BULLETS,
+        "bulletsplaceholder": Lex.TPL_BULLETS,
+        "tplbullets": Lex.TPL_BULLETS,
+        "templatetableblock": Lex.TPL_TABLE,
+        "tableblock": Lex.TPL_TABLE,
+        "tableplaceholder": Lex.TPL_TABLE,
+        "tpltable": Lex.TPL_TABLE,
+        "templateimageblock": Lex.TPL_IMAGE,
+        "imageblock": Lex.TPL_IMAGE,
+        "pictureplaceholder": Lex.TPL_IMAGE,
+        "tplimage": Lex.TPL_IMAGE,
+        "templateslidenumber": Lex.TPL_SLIDE_NO,
+        "slidenumber": Lex.TPL_SLIDE_NO,
+        "slideno": Lex.TPL_SLIDE_NO,
+        "tplslideno": Lex.TPL_SLIDE_NO,
+        "footerleft": Lex.TPL_FOOTER_LEFT,
+        "leftfooter": Lex.TPL_FOOTER_LEFT,
+        "tplfooterleft": Lex.TPL_FOOTER_LEFT,
+        "footercentre": Lex.TPL_FOOTER_MID,
+        "footermiddle": Lex.TPL_FOOTER_MID,
+        "footercenter": Lex.TPL_FOOTER_MID,
+        "tplfootermid": Lex.TPL_FOOTER_MID,
+        "footerright": Lex.TPL_FOOTER_RIGHT,
+        "rightfooter": Lex.TPL_FOOTER_RIGHT,
+        "tplfooterright": Lex.TPL_FOOTER_RIGHT,
+        "headerleft": Lex.TPL_HEADER_LEFT,
+        "leftheader": Lex.TPL_HEADER_LEFT,
+        "tplheaderleft": Lex.TPL_HEADER_LEFT,
+        "headerright": Lex.TPL_HEADER_RIGHT,
+        "rightheader": Lex.TPL_HEADER_RIGHT,
+        "tplheaderright": Lex.TPL_HEADER_RIGHT,
+    }
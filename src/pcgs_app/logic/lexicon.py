@@ -6,12 +6,14 @@ Single source of truth for Prometheus terminology and IDs.
 
 This module exposes:
 
-- Lex: Enum of canonical Lexicon IDs (C_INFO, CLO, SCALEMGR, etc.).
+- Lex: canonical Lexicon ID sentinels (C_INFO, CLO, SCALEMGR, etc.).
 - LexiconEntry: dataclass describing each term.
 - LEXICON: mapping of Lex -> LexiconEntry.
 - normalise_term(): map any user-facing label to a canonical Lex ID.
 - get_entry(): retrieve LexiconEntry by ID or variant term.
 - is_term(): convenience predicate for comparisons.
+- match_any(): predicate against several Lex IDs at once.
+- LEX_TO_NORMALISED: mapping of Lex -> normalised keys that resolve to it.
 
 Golden rule:
 ------------
@@ -21,9 +23,10 @@ fields using Lex IDs (Lex.C_NAME, Lex.CLO, etc.), *never* raw strings.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from enum import Enum
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, FrozenSet, Optional, Tuple
 
 
 # --------------------------------------------------------------------------- #
@@ -31,209 +34,169 @@ from typing import Dict, List, Optional
 # --------------------------------------------------------------------------- #
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LexiconEntry:
     """Metadata for a single lexicon item."""
 
     id: str
     primary_term: str
-    variants: List[str]
+    variants: Tuple[str, ...]
     category: str
     notes: str = ""
 
 
-class Lex(str, Enum):
+class Lex(str):
     """Canonical Lexicon IDs.
 
-    Use Lex.* everywhere in code instead of hard-coded strings.
+    Use Lex.* everywhere in code instead of hard-coded strings. Members are
+    plain str sentinels created once at import, so they compare by identity
+    and hash like their ID string without Enum machinery.
     """
 
-    # Course-level metadata
-    C_INFO = "C_INFO"
-    C_NAME = "C_NAME"
-    C_LEVEL = "C_LEVEL"
-    C_THEME = "C_THEME"
-    C_DURATION = "C_DURATION"
-    C_CODE = "C_CODE"
-    C_DEV = "C_DEV"
-    C_DESC = "C_DESC"
-
-    # Learning objectives
-    CLO = "CLO"
-
-    # Scalar manager and structural IDs
-    SCALEMGR = "SCALEMGR"
-    SC_LESSON = "SC_LESSON"
-    SC_TOPIC = "SC_TOPIC"
-    SC_SUBTOPIC = "SC_SUBTOPIC"
-    SC_PC = "SC_PC"
-
-    # Content manager
-    CONTMGR = "CONTMGR"
-    CT_RESOURCE = "CT_RESOURCE"
-    CT_TAG = "CT_TAG"
-    CT_NOTE = "CT_NOTE"
-
-    # Lesson manager & slide structure
-    LSNMGR = "LSNMGR"
-    SL_TITLE = "SL_TITLE"
-    SL_SUBTITLE = "SL_SUBTITLE"
-    SL_HEADING = "SL_HEADING"
-    SL_SUBHEADING = "SL_SUBHEADING"
-    SL_BODY = "SL_BODY"
-    SL_BULLETS = "SL_BULLETS"
-    SL_IMAGE = "SL_IMAGE"
-    SL_QUOTE = "SL_QUOTE"
-    SL_LABEL = "SL_LABEL"
-    SL_TABLE = "SL_TABLE"
-
-    # References
-    REF_ENTRY = "REF_ENTRY"
-    REF_AUTHOR = "REF_AUTHOR"
-    REF_TITLE = "REF_TITLE"
-    REF_YEAR = "REF_YEAR"
-    REF_URL = "REF_URL"
-    REF_TYPE = "REF_TYPE"
-
-    # Assessments
-    EX_Q = "EX_Q"
-    EX_OPT = "EX_OPT"
-    EX_KEY = "EX_KEY"
-    EX_EXP = "EX_EXP"
-    EX_DIFF = "EX_DIFF"
-    EX_TOPIC = "EX_TOPIC"
-
-    # Prometheus-specific system terms
-    PKE_ENGINE = "PKE_ENGINE"
-    PKE_TERM = "PKE_TERM"
-    PKE_RESP = "PKE_RESP"
-    TPL_MAP = "TPL_MAP"
-    EXP_ENGINE = "EXP_ENGINE"
-    SS_STATE = "SS_STATE"
-    UI_PANEL = "UI_PANEL"
-    UI_CONNECT = "UI_CONNECT"
-
-    # Template / layout blocks for exports
-    TPL_TITLE_BLOCK = "TPL_TITLE_BLOCK"
-    TPL_SUBTITLE_BLOCK = "TPL_SUBTITLE_BLOCK"
-    TPL_BODY = "TPL_BODY"
-    TPL_BULLETS = "TPL_BULLETS"
-    TPL_TABLE = "TPL_TABLE"
-    TPL_IMAGE = "TPL_IMAGE"
-    TPL_SLIDE_NO = "TPL_SLIDE_NO"
-    TPL_FOOTER_LEFT = "TPL_FOOTER_LEFT"
-    TPL_FOOTER_MID = "TPL_FOOTER_MID"
-    TPL_FOOTER_RIGHT = "TPL_FOOTER_RIGHT"
-    TPL_HEADER_LEFT = "TPL_HEADER_LEFT"
-    TPL_HEADER_RIGHT = "TPL_HEADER_RIGHT"
+    # Position of the ID in _ENTRIES; set once at import, read through ord
+    __slots__ = ("_ord",)
+
+    # Populated below with one sentinel per row of _ENTRIES
+    __members__: Dict[str, "Lex"] = {}
+
+    @property
+    def ord(self) -> int:
+        """Index of the ID in _ENTRIES; indexes _LEXICON_BY_ORD."""
+        return self._ord
+
+    @property
+    def name(self) -> str:
+        return str.__str__(self)
+
+    @property
+    def value(self) -> str:
+        return str.__str__(self)
+
+    def __repr__(self) -> str:
+        return f"Lex.{str.__str__(self)}"
+
+    # Sentinels are compared by identity, so copies and unpickled values must
+    # resolve back to the member object itself, as Enum members did
+    def __reduce__(self):
+        name = str.__str__(self)
+        if Lex.__members__.get(name) is self:
+            return (getattr, (Lex, name))
+        return (Lex, (name,))
+
+    def __copy__(self) -> "Lex":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, object]) -> "Lex":
+        return self
 
 
 # --------------------------------------------------------------------------- #
 # Lexicon definition
 # --------------------------------------------------------------------------- #
 
-
-LEXICON: Dict[Lex, LexiconEntry] = {
+# One row per Lex ID: (id, primary_term, variants, category, notes). The Lex
+# sentinels and LEXICON entries are both built from this single table.
+_ENTRIES: Tuple[Tuple[str, str, Tuple[str, ...], str, str], ...] = (
     # -------------------- Course-level metadata ---------------------------- #
-    Lex.C_INFO: LexiconEntry(
-        id="C_INFO",
-        primary_term="Course Information",
-        variants=[
+    (
+        "C_INFO",
+        "Course Information",
+        (
             "course information",
             "course info",
             "course details",
             "metadata",
-        ],
-        category="course",
-        notes="Logical container for all course-level metadata.",
-    ),
-    Lex.C_NAME: LexiconEntry(
-        id="C_NAME",
-        primary_term="Course Title",
-        variants=[
+        ),
+        "course",
+        "Logical container for all course-level metadata.",
+    ),
+    (
+        "C_NAME",
+        "Course Title",
+        (
             "course title",
             "course name",
             "title",
             "name",
-        ],
-        category="course",
-        notes="Display name of the course.",
-    ),
-    Lex.C_LEVEL: LexiconEntry(
-        id="C_LEVEL",
-        primary_term="Course Level",
-        variants=[
+        ),
+        "course",
+        "Display name of the course.",
+    ),
+    (
+        "C_LEVEL",
+        "Course Level",
+        (
             "course level",
             "level",
             "difficulty level",
-        ],
-        category="course",
-        notes="Basic / Intermediate / Advanced / Executive / Custom.",
-    ),
-    Lex.C_THEME: LexiconEntry(
-        id="C_THEME",
-        primary_term="Thematic Area",
-        variants=[
+        ),
+        "course",
+        "Basic / Intermediate / Advanced / Executive / Custom.",
+    ),
+    (
+        "C_THEME",
+        "Thematic Area",
+        (
             "thematic",
             "theme",
             "thematic area",
             "category",
-        ],
-        category="course",
-        notes="High-level subject or stream.",
-    ),
-    Lex.C_DURATION: LexiconEntry(
-        id="C_DURATION",
-        primary_term="Duration",
-        variants=[
+        ),
+        "course",
+        "High-level subject or stream.",
+    ),
+    (
+        "C_DURATION",
+        "Duration",
+        (
             "duration",
             "course duration",
             "length",
-        ],
-        category="course",
-        notes="Recommended representation: integer days or '3 Days'.",
-    ),
-    Lex.C_CODE: LexiconEntry(
-        id="C_CODE",
-        primary_term="Course Code",
-        variants=[
+        ),
+        "course",
+        "Recommended representation: integer days or '3 Days'.",
+    ),
+    (
+        "C_CODE",
+        "Course Code",
+        (
             "course code",
             "code",
             "identifier",
-        ],
-        category="course",
-        notes="Optional external identifier.",
-    ),
-    Lex.C_DEV: LexiconEntry(
-        id="C_DEV",
-        primary_term="Developer Name",
-        variants=[
+        ),
+        "course",
+        "Optional external identifier.",
+    ),
+    (
+        "C_DEV",
+        "Developer Name",
+        (
             "developer",
             "developer name",
             "course developer",
             "author",
-        ],
-        category="course",
-        notes="Name of the person or team responsible for the course.",
-    ),
-    Lex.C_DESC: LexiconEntry(
-        id="C_DESC",
-        primary_term="Course Description",
-        variants=[
+        ),
+        "course",
+        "Name of the person or team responsible for the course.",
+    ),
+    (
+        "C_DESC",
+        "Course Description",
+        (
             "course description",
             "description",
             "overview",
             "summary",
-        ],
-        category="course",
-        notes="Narrative summary; may be PKE-generated.",
+        ),
+        "course",
+        "Narrative summary; may be PKE-generated.",
     ),
 
     # -------------------- Learning objectives ----------------------------- #
-    Lex.CLO: LexiconEntry(
-        id="CLO",
-        primary_term="Course Learning Objective",
-        variants=[
+    (
+        "CLO",
+        "Course Learning Objective",
+        (
             "clo",
             "clos",
             "lo",
@@ -242,619 +205,649 @@ LEXICON: Dict[Lex, LexiconEntry] = {
             "learning objectives",
             "course learning objective",
             "course learning objectives",
-        ],
-        category="structure",
-        notes="CLO_n identifiers (CLO_1, CLO_2, etc.) derive from this root.",
+        ),
+        "structure",
+        "CLO_n identifiers (CLO_1, CLO_2, etc.) derive from this root.",
     ),
 
     # -------------------- Scalar manager & structure ---------------------- #
-    Lex.SCALEMGR: LexiconEntry(
-        id="SCALEMGR",
-        primary_term="Scalar Manager",
-        variants=[
+    (
+        "SCALEMGR",
+        "Scalar Manager",
+        (
             "scalar",
             "scalar manager",
             "scalar table",
             "scalar index",
-        ],
-        category="structure",
-        notes="Master structure for lesson, topic, subtopic, and PCs.",
-    ),
-    Lex.SC_LESSON: LexiconEntry(
-        id="SC_LESSON",
-        primary_term="Lesson Title",
-        variants=[
+        ),
+        "structure",
+        "Master structure for lesson, topic, subtopic, and PCs.",
+    ),
+    (
+        "SC_LESSON",
+        "Lesson Title",
+        (
             "lesson",
             "lesson title",
             "lesson name",
-        ],
-        category="structure",
-        notes="First-level element in the scalar.",
-    ),
-    Lex.SC_TOPIC: LexiconEntry(
-        id="SC_TOPIC",
-        primary_term="Topic",
-        variants=[
+        ),
+        "structure",
+        "First-level element in the scalar.",
+    ),
+    (
+        "SC_TOPIC",
+        "Topic",
+        (
             "topic",
             "lesson topic",
             "module topic",
-        ],
-        category="structure",
-        notes="Indexed as 1.1, 1.2, etc.",
-    ),
-    Lex.SC_SUBTOPIC: LexiconEntry(
-        id="SC_SUBTOPIC",
-        primary_term="Subtopic",
-        variants=[
+        ),
+        "structure",
+        "Indexed as 1.1, 1.2, etc.",
+    ),
+    (
+        "SC_SUBTOPIC",
+        "Subtopic",
+        (
             "subtopic",
             "sub-topic",
             "element",
-        ],
-        category="structure",
-        notes="Indexed as 1.1.1, 1.1.2, etc.",
-    ),
-    Lex.SC_PC: LexiconEntry(
-        id="SC_PC",
-        primary_term="Performance Criterion",
-        variants=[
+        ),
+        "structure",
+        "Indexed as 1.1.1, 1.1.2, etc.",
+    ),
+    (
+        "SC_PC",
+        "Performance Criterion",
+        (
             "performance criterion",
             "performance criteria",
             "pc",
             "pcs",
             "performance measure",
-        ],
-        category="structure",
-        notes="Usually associated with CLOs, topics, or subtopics.",
+        ),
+        "structure",
+        "Usually associated with CLOs, topics, or subtopics.",
     ),
 
     # -------------------- Content manager -------------------------------- #
-    Lex.CONTMGR: LexiconEntry(
-        id="CONTMGR",
-        primary_term="Content Manager",
-        variants=[
+    (
+        "CONTMGR",
+        "Content Manager",
+        (
             "content manager",
             "content hub",
             "resources manager",
-        ],
-        category="content",
-        notes="Hub for resource ingestion and organisation.",
-    ),
-    Lex.CT_RESOURCE: LexiconEntry(
-        id="CT_RESOURCE",
-        primary_term="Resource",
-        variants=[
+        ),
+        "content",
+        "Hub for resource ingestion and organisation.",
+    ),
+    (
+        "CT_RESOURCE",
+        "Resource",
+        (
             "resource",
             "file",
             "document",
             "attachment",
             "link",
             "media",
-        ],
-        category="content",
-        notes="Unit of content (URL, image, PDF, etc.).",
-    ),
-    Lex.CT_TAG: LexiconEntry(
-        id="CT_TAG",
-        primary_term="Tag",
-        variants=[
+        ),
+        "content",
+        "Unit of content (URL, image, PDF, etc.).",
+    ),
+    (
+        "CT_TAG",
+        "Tag",
+        (
             "tag",
             "label",
             "descriptor",
-        ],
-        category="content",
-        notes="Used for search and filtering.",
-    ),
-    Lex.CT_NOTE: LexiconEntry(
-        id="CT_NOTE",
-        primary_term="Content Note",
-        variants=[
+        ),
+        "content",
+        "Used for search and filtering.",
+    ),
+    (
+        "CT_NOTE",
+        "Content Note",
+        (
             "note",
             "annotation",
             "comment",
-        ],
-        category="content",
-        notes="Free-text notes tied to a resource.",
+        ),
+        "content",
+        "Free-text notes tied to a resource.",
     ),
 
     # -------------------- Lesson manager & slides ------------------------- #
-    Lex.LSNMGR: LexiconEntry(
-        id="LSNMGR",
-        primary_term="Lesson Manager",
-        variants=[
+    (
+        "LSNMGR",
+        "Lesson Manager",
+        (
             "lesson manager",
             "lessons manager",
             "lesson builder",
-        ],
-        category="lessons",
-        notes="Assembly of lessons, slides, notes, and timing.",
-    ),
-    Lex.SL_TITLE: LexiconEntry(
-        id="SL_TITLE",
-        primary_term="Slide Title",
-        variants=[
+        ),
+        "lessons",
+        "Assembly of lessons, slides, notes, and timing.",
+    ),
+    (
+        "SL_TITLE",
+        "Slide Title",
+        (
             "slide title",
             "title block",
             "slide header",
-        ],
-        category="slide",
-        notes="Primary title text on a slide.",
-    ),
-    Lex.SL_SUBTITLE: LexiconEntry(
-        id="SL_SUBTITLE",
-        primary_term="Slide Subtitle",
-        variants=[
+        ),
+        "slide",
+        "Primary title text on a slide.",
+    ),
+    (
+        "SL_SUBTITLE",
+        "Slide Subtitle",
+        (
             "subtitle",
             "slide subtitle",
-        ],
-        category="slide",
-        notes="Secondary subtitle text on a slide.",
-    ),
-    Lex.SL_HEADING: LexiconEntry(
-        id="SL_HEADING",
-        primary_term="Heading",
-        variants=[
+        ),
+        "slide",
+        "Secondary subtitle text on a slide.",
+    ),
+    (
+        "SL_HEADING",
+        "Heading",
+        (
             "heading",
             "section header",
             "h1",
-        ],
-        category="slide",
-        notes="Main in-slide section heading.",
-    ),
-    Lex.SL_SUBHEADING: LexiconEntry(
-        id="SL_SUBHEADING",
-        primary_term="Subheading",
-        variants=[
+        ),
+        "slide",
+        "Main in-slide section heading.",
+    ),
+    (
+        "SL_SUBHEADING",
+        "Subheading",
+        (
             "subheading",
             "sub-heading",
             "h2",
-        ],
-        category="slide",
-        notes="Secondary in-slide heading.",
-    ),
-    Lex.SL_BODY: LexiconEntry(
-        id="SL_BODY",
-        primary_term="Body Text",
-        variants=[
+        ),
+        "slide",
+        "Secondary in-slide heading.",
+    ),
+    (
+        "SL_BODY",
+        "Body Text",
+        (
             "body",
             "body text",
             "paragraph",
             "text",
-        ],
-        category="slide",
-        notes="Narrative body text.",
-    ),
-    Lex.SL_BULLETS: LexiconEntry(
-        id="SL_BULLETS",
-        primary_term="Bullet List",
-        variants=[
+        ),
+        "slide",
+        "Narrative body text.",
+    ),
+    (
+        "SL_BULLETS",
+        "Bullet List",
+        (
             "bullets",
             "bullet list",
             "bullet points",
             "list",
-        ],
-        category="slide",
-        notes="One or more bullet items.",
-    ),
-    Lex.SL_IMAGE: LexiconEntry(
-        id="SL_IMAGE",
-        primary_term="Image",
-        variants=[
+        ),
+        "slide",
+        "One or more bullet items.",
+    ),
+    (
+        "SL_IMAGE",
+        "Image",
+        (
             "image",
             "picture",
             "photo",
             "graphic",
-        ],
-        category="slide",
-        notes="Single image on a slide.",
-    ),
-    Lex.SL_QUOTE: LexiconEntry(
-        id="SL_QUOTE",
-        primary_term="Quote",
-        variants=[
+        ),
+        "slide",
+        "Single image on a slide.",
+    ),
+    (
+        "SL_QUOTE",
+        "Quote",
+        (
             "quote",
             "pull quote",
             "highlight quote",
-        ],
-        category="slide",
-        notes="Quotation or highlighted statement.",
-    ),
-    Lex.SL_LABEL: LexiconEntry(
-        id="SL_LABEL",
-        primary_term="Label",
-        variants=[
+        ),
+        "slide",
+        "Quotation or highlighted statement.",
+    ),
+    (
+        "SL_LABEL",
+        "Label",
+        (
             "label",
             "tag",
             "marker",
-        ],
-        category="slide",
-        notes="Short text label for diagram elements, etc.",
-    ),
-    Lex.SL_TABLE: LexiconEntry(
-        id="SL_TABLE",
-        primary_term="Table",
-        variants=[
+        ),
+        "slide",
+        "Short text label for diagram elements, etc.",
+    ),
+    (
+        "SL_TABLE",
+        "Table",
+        (
             "table",
             "data table",
             "grid",
-        ],
-        category="slide",
-        notes="Tabular data element.",
+        ),
+        "slide",
+        "Tabular data element.",
     ),
 
     # -------------------- References ------------------------------------- #
-    Lex.REF_ENTRY: LexiconEntry(
-        id="REF_ENTRY",
-        primary_term="Reference Entry",
-        variants=[
+    (
+        "REF_ENTRY",
+        "Reference Entry",
+        (
             "reference",
             "reference entry",
             "bibliography entry",
             "source",
-        ],
-        category="reference",
-        notes="Single reference row.",
-    ),
-    Lex.REF_AUTHOR: LexiconEntry(
-        id="REF_AUTHOR",
-        primary_term="Author",
-        variants=[
+        ),
+        "reference",
+        "Single reference row.",
+    ),
+    (
+        "REF_AUTHOR",
+        "Author",
+        (
             "author",
             "authors",
-        ],
-        category="reference",
-        notes="Primary author list.",
-    ),
-    Lex.REF_TITLE: LexiconEntry(
-        id="REF_TITLE",
-        primary_term="Reference Title",
-        variants=[
+        ),
+        "reference",
+        "Primary author list.",
+    ),
+    (
+        "REF_TITLE",
+        "Reference Title",
+        (
             "title",
             "reference title",
-        ],
-        category="reference",
-        notes="Title of the work.",
-    ),
-    Lex.REF_YEAR: LexiconEntry(
-        id="REF_YEAR",
-        primary_term="Publication Year",
-        variants=[
+        ),
+        "reference",
+        "Title of the work.",
+    ),
+    (
+        "REF_YEAR",
+        "Publication Year",
+        (
             "year",
             "publication year",
             "date",
-        ],
-        category="reference",
-        notes="Year of publication.",
-    ),
-    Lex.REF_URL: LexiconEntry(
-        id="REF_URL",
-        primary_term="Reference URL",
-        variants=[
+        ),
+        "reference",
+        "Year of publication.",
+    ),
+    (
+        "REF_URL",
+        "Reference URL",
+        (
             "url",
             "link",
             "doi",
             "web address",
-        ],
-        category="reference",
-        notes="Resolvable URL or DOI.",
-    ),
-    Lex.REF_TYPE: LexiconEntry(
-        id="REF_TYPE",
-        primary_term="Reference Type",
-        variants=[
+        ),
+        "reference",
+        "Resolvable URL or DOI.",
+    ),
+    (
+        "REF_TYPE",
+        "Reference Type",
+        (
             "type",
             "source type",
             "format",
-        ],
-        category="reference",
-        notes="Book, journal, website, etc.",
+        ),
+        "reference",
+        "Book, journal, website, etc.",
     ),
 
     # -------------------- Assessments ------------------------------------ #
-    Lex.EX_Q: LexiconEntry(
-        id="EX_Q",
-        primary_term="Exam Question",
-        variants=[
+    (
+        "EX_Q",
+        "Exam Question",
+        (
             "question",
             "exam question",
             "mcq",
             "item",
-        ],
-        category="assessment",
-        notes="Single assessment question.",
-    ),
-    Lex.EX_OPT: LexiconEntry(
-        id="EX_OPT",
-        primary_term="Answer Option",
-        variants=[
+        ),
+        "assessment",
+        "Single assessment question.",
+    ),
+    (
+        "EX_OPT",
+        "Answer Option",
+        (
             "answer option",
             "option",
             "choice",
-        ],
-        category="assessment",
-        notes="Single MCQ option.",
-    ),
-    Lex.EX_KEY: LexiconEntry(
-        id="EX_KEY",
-        primary_term="Correct Answer",
-        variants=[
+        ),
+        "assessment",
+        "Single MCQ option.",
+    ),
+    (
+        "EX_KEY",
+        "Correct Answer",
+        (
             "correct answer",
             "key",
             "answer key",
-        ],
-        category="assessment",
-        notes="Identifier of the correct option.",
-    ),
-    Lex.EX_EXP: LexiconEntry(
-        id="EX_EXP",
-        primary_term="Explanation",
-        variants=[
+        ),
+        "assessment",
+        "Identifier of the correct option.",
+    ),
+    (
+        "EX_EXP",
+        "Explanation",
+        (
             "explanation",
             "rationale",
             "feedback",
-        ],
-        category="assessment",
-        notes="Optional explanation or feedback.",
-    ),
-    Lex.EX_DIFF: LexiconEntry(
-        id="EX_DIFF",
-        primary_term="Difficulty",
-        variants=[
+        ),
+        "assessment",
+        "Optional explanation or feedback.",
+    ),
+    (
+        "EX_DIFF",
+        "Difficulty",
+        (
             "difficulty",
             "difficulty level",
-        ],
-        category="assessment",
-        notes="Simple difficulty tag (e.g. Easy/Med/Hard).",
-    ),
-    Lex.EX_TOPIC: LexiconEntry(
-        id="EX_TOPIC",
-        primary_term="Question Topic",
-        variants=[
+        ),
+        "assessment",
+        "Simple difficulty tag (e.g. Easy/Med/Hard).",
+    ),
+    (
+        "EX_TOPIC",
+        "Question Topic",
+        (
             "question topic",
             "topic",
-        ],
-        category="assessment",
-        notes="Link back to a scalar topic/subtopic.",
+        ),
+        "assessment",
+        "Link back to a scalar topic/subtopic.",
     ),
 
     # -------------------- Prometheus system terms ------------------------ #
-    Lex.PKE_ENGINE: LexiconEntry(
-        id="PKE_ENGINE",
-        primary_term="Prometheus Knowledge Engine",
-        variants=[
+    (
+        "PKE_ENGINE",
+        "Prometheus Knowledge Engine",
+        (
             "pke",
             "prometheus ai",
             "ai engine",
-        ],
-        category="system",
-        notes="Logical label for all AI-assisted operations.",
-    ),
-    Lex.PKE_TERM: LexiconEntry(
-        id="PKE_TERM",
-        primary_term="PKE Terminal",
-        variants=[
+        ),
+        "system",
+        "Logical label for all AI-assisted operations.",
+    ),
+    (
+        "PKE_TERM",
+        "PKE Terminal",
+        (
             "ai terminal",
             "pke terminal",
             "ai chat window",
-        ],
-        category="system",
-        notes="The gold interaction band on the main UI.",
-    ),
-    Lex.PKE_RESP: LexiconEntry(
-        id="PKE_RESP",
-        primary_term="PKE Response",
-        variants=[
+        ),
+        "system",
+        "The gold interaction band on the main UI.",
+    ),
+    (
+        "PKE_RESP",
+        "PKE Response",
+        (
             "pke response",
             "ai response",
-        ],
-        category="system",
-        notes="Block of text returned by the PKE.",
-    ),
-    Lex.TPL_MAP: LexiconEntry(
-        id="TPL_MAP",
-        primary_term="Template Map",
-        variants=[
+        ),
+        "system",
+        "Block of text returned by the PKE.",
+    ),
+    (
+        "TPL_MAP",
+        "Template Map",
+        (
             "template map",
             "layout map",
             "field map",
-        ],
-        category="system",
-        notes="Mapping between Lex IDs and template placeholders.",
-    ),
-    Lex.EXP_ENGINE: LexiconEntry(
-        id="EXP_ENGINE",
-        primary_term="Export Engine",
-        variants=[
+        ),
+        "system",
+        "Mapping between Lex IDs and template placeholders.",
+    ),
+    (
+        "EXP_ENGINE",
+        "Export Engine",
+        (
             "export engine",
             "generator",
             "exporter",
-        ],
-        category="system",
-        notes="Generic term for PPTX/DOCX/XLSX generators.",
-    ),
-    Lex.SS_STATE: LexiconEntry(
-        id="SS_STATE",
-        primary_term="Session State",
-        variants=[
+        ),
+        "system",
+        "Generic term for PPTX/DOCX/XLSX generators.",
+    ),
+    (
+        "SS_STATE",
+        "Session State",
+        (
             "session state",
             "ui state",
             "state",
-        ],
-        category="system",
-        notes="Shared state across UI tabs.",
-    ),
-    Lex.UI_PANEL: LexiconEntry(
-        id="UI_PANEL",
-        primary_term="UI Panel",
-        variants=[
+        ),
+        "system",
+        "Shared state across UI tabs.",
+    ),
+    (
+        "UI_PANEL",
+        "UI Panel",
+        (
             "panel",
             "window",
             "card",
-        ],
-        category="system",
-        notes="Logical UI region in the layout.",
-    ),
-    Lex.UI_CONNECT: LexiconEntry(
-        id="UI_CONNECT",
-        primary_term="UI Connector",
-        variants=[
+        ),
+        "system",
+        "Logical UI region in the layout.",
+    ),
+    (
+        "UI_CONNECT",
+        "UI Connector",
+        (
             "connector",
             "flow line",
             "node connection",
-        ],
-        category="system",
-        notes="Visual connector between panels/nodes.",
+        ),
+        "system",
+        "Visual connector between panels/nodes.",
     ),
 
     # -------------------- Template / layout terms ------------------------ #
-    Lex.TPL_TITLE_BLOCK: LexiconEntry(
-        id="TPL_TITLE_BLOCK",
-        primary_term="Template Title Block",
-        variants=[
+    (
+        "TPL_TITLE_BLOCK",
+        "Template Title Block",
+        (
             "title block",
             "ppt title",
             "slide title placeholder",
-        ],
-        category="template",
-        notes="Placeholder in template for slide titles.",
-    ),
-    Lex.TPL_SUBTITLE_BLOCK: LexiconEntry(
-        id="TPL_SUBTITLE_BLOCK",
-        primary_term="Template Subtitle Block",
-        variants=[
+        ),
+        "template",
+        "Placeholder in template for slide titles.",
+    ),
+    (
+        "TPL_SUBTITLE_BLOCK",
+        "Template Subtitle Block",
+        (
             "subtitle block",
             "ppt subtitle",
-        ],
-        category="template",
-        notes="Placeholder for slide subtitles.",
-    ),
-    Lex.TPL_BODY: LexiconEntry(
-        id="TPL_BODY",
-        primary_term="Template Body Text",
-        variants=[
+        ),
+        "template",
+        "Placeholder for slide subtitles.",
+    ),
+    (
+        "TPL_BODY",
+        "Template Body Text",
+        (
             "body block",
             "content block",
             "text placeholder",
-        ],
-        category="template",
-        notes="General body text placeholder.",
-    ),
-    Lex.TPL_BULLETS: LexiconEntry(
-        id="TPL_BULLETS",
-        primary_term="Template Bullet Block",
-        variants=[
+        ),
+        "template",
+        "General body text placeholder.",
+    ),
+    (
+        "TPL_BULLETS",
+        "Template Bullet Block",
+        (
             "bullet block",
             "bullets placeholder",
-        ],
-        category="template",
-        notes="Bullet text placeholder.",
-    ),
-    Lex.TPL_TABLE: LexiconEntry(
-        id="TPL_TABLE",
-        primary_term="Template Table Block",
-        variants=[
+        ),
+        "template",
+        "Bullet text placeholder.",
+    ),
+    (
+        "TPL_TABLE",
+        "Template Table Block",
+        (
             "table block",
             "table placeholder",
-        ],
-        category="template",
-        notes="Tabular placeholder region.",
-    ),
-    Lex.TPL_IMAGE: LexiconEntry(
-        id="TPL_IMAGE",
-        primary_term="Template Image Block",
-        variants=[
+        ),
+        "template",
+        "Tabular placeholder region.",
+    ),
+    (
+        "TPL_IMAGE",
+        "Template Image Block",
+        (
             "image block",
             "picture placeholder",
-        ],
-        category="template",
-        notes="Image placeholder region.",
-    ),
-    Lex.TPL_SLIDE_NO: LexiconEntry(
-        id="TPL_SLIDE_NO",
-        primary_term="Template Slide Number",
-        variants=[
+        ),
+        "template",
+        "Image placeholder region.",
+    ),
+    (
+        "TPL_SLIDE_NO",
+        "Template Slide Number",
+        (
             "slide number",
             "slide no",
-        ],
-        category="template",
-        notes="Slide number display field.",
-    ),
-    Lex.TPL_FOOTER_LEFT: LexiconEntry(
-        id="TPL_FOOTER_LEFT",
-        primary_term="Footer Left",
-        variants=[
+        ),
+        "template",
+        "Slide number display field.",
+    ),
+    (
+        "TPL_FOOTER_LEFT",
+        "Footer Left",
+        (
             "footer left",
             "left footer",
-        ],
-        category="template",
-        notes="Left footer text placeholder.",
-    ),
-    Lex.TPL_FOOTER_MID: LexiconEntry(
-        id="TPL_FOOTER_MID",
-        primary_term="Footer Centre",
-        variants=[
+        ),
+        "template",
+        "Left footer text placeholder.",
+    ),
+    (
+        "TPL_FOOTER_MID",
+        "Footer Centre",
+        (
             "footer middle",
             "footer centre",
             "footer center",
-        ],
-        category="template",
-        notes="Middle footer text placeholder.",
-    ),
-    Lex.TPL_FOOTER_RIGHT: LexiconEntry(
-        id="TPL_FOOTER_RIGHT",
-        primary_term="Footer Right",
-        variants=[
+        ),
+        "template",
+        "Middle footer text placeholder.",
+    ),
+    (
+        "TPL_FOOTER_RIGHT",
+        "Footer Right",
+        (
             "footer right",
             "right footer",
-        ],
-        category="template",
-        notes="Right footer text placeholder.",
-    ),
-    Lex.TPL_HEADER_LEFT: LexiconEntry(
-        id="TPL_HEADER_LEFT",
-        primary_term="Header Left",
-        variants=[
+        ),
+        "template",
+        "Right footer text placeholder.",
+    ),
+    (
+        "TPL_HEADER_LEFT",
+        "Header Left",
+        (
             "header left",
             "left header",
-        ],
-        category="template",
-        notes="Left header placeholder.",
-    ),
-    Lex.TPL_HEADER_RIGHT: LexiconEntry(
-        id="TPL_HEADER_RIGHT",
-        primary_term="Header Right",
-        variants=[
+        ),
+        "template",
+        "Left header placeholder.",
+    ),
+    (
+        "TPL_HEADER_RIGHT",
+        "Header Right",
+        (
             "header right",
             "right header",
-        ],
-        category="template",
-        notes="Right header placeholder.",
+        ),
+        "template",
+        "Right header placeholder.",
     ),
-}
+)
+
+LEXICON: Dict[Lex, LexiconEntry] = {}
 
+# Short terms recur across entries ("title", "topic", ...); interning them
+# leaves one shared object per spelling. Free-text notes are left as-is.
+for _ord, (_id, _primary, _variants, _category, _notes) in enumerate(_ENTRIES):
+    _member = Lex(_id)
+    _member._ord = _ord
+    setattr(Lex, _id, _member)
+    Lex.__members__[_id] = _member
+    LEXICON[_member] = LexiconEntry(
+        sys.intern(_id),
+        sys.intern(_primary),
+        tuple(map(sys.intern, _variants)),
+        sys.intern(_category),
+        _notes,
+    )
+del _ord, _id, _primary, _variants, _category, _notes, _member
 
-# Build a fast lookup from normalised variant -> Lex ID
-_VARIANT_INDEX: Dict[str, Lex] = {}
+# Entries by Lex ordinal; get_entry indexes this instead of hashing into LEXICON
+_LEXICON_BY_ORD: Tuple[LexiconEntry, ...] = tuple(LEXICON.values())
+
+
+# Deletion table for the separators ignored by variant lookup
+_STRIP_TABLE = str.maketrans("", "", " _-:.")
 
 
 def _normalise_key(value: str) -> str:
     """Normalise a human string for variant lookup.
 
-    Lowercase, strip spaces, underscores, hyphens, and colons.
+    Lowercase, strip spaces, underscores, hyphens, colons, and dots in a
+    single translate pass.
     """
-    v = value.strip().lower()
-    for ch in (" ", "_", "-", ":", "."):
-        v = v.replace(ch, "")
-    return v
+    return value.strip().lower().translate(_STRIP_TABLE)
+
 
+# Fast lookup from normalised variant -> Lex ID. The table is generated from
+# LEXICON by tools/gen_variant_index.py; rerun it after editing any entry.
+from pcgs_app.logic._variant_index_generated import build_variant_index  # noqa: E402
+
+# Keys are interned so lookups can short-circuit on pointer equality; literal
+# keys that are not identifier-like would otherwise be distinct objects.
+_VARIANT_INDEX: Dict[str, Lex] = {
+    sys.intern(key): lex_id for key, lex_id in build_variant_index(Lex).items()
+}
 
-for lex_id, entry in LEXICON.items():
-    # Primary term
-    _VARIANT_INDEX[_normalise_key(entry.primary_term)] = lex_id
-    # Variants
-    for v in entry.variants:
-        _VARIANT_INDEX[_normalise_key(v)] = lex_id
-    # Also index the raw ID string itself
-    _VARIANT_INDEX[_normalise_key(entry.id)] = lex_id
+# Reverse lookup: every normalised key that resolves to a given Lex ID, so
+# predicates against a fixed ID are a single set membership test.
+_keys_by_lex: Dict[Lex, set] = {}
+for _key, _lex_id in _VARIANT_INDEX.items():
+    _keys_by_lex.setdefault(_lex_id, set()).add(_key)
+LEX_TO_NORMALISED: Dict[Lex, FrozenSet[str]] = {
+    lex_id: frozenset(keys) for lex_id, keys in _keys_by_lex.items()
+}
+del _keys_by_lex, _key, _lex_id
 
 
 # --------------------------------------------------------------------------- #
@@ -862,9 +855,13 @@ for lex_id, entry in LEXICON.items():
 # --------------------------------------------------------------------------- #
 
 
+@lru_cache(maxsize=1024)
 def normalise_term(term_or_id: str) -> Optional[Lex]:
     """Return the canonical Lex ID for a raw label or ID string.
 
+    Results are memoised per input string, so callers must pass a str (or
+    another hashable string value) rather than arbitrary objects.
+
     Examples:
         normalise_term("Course Name") -> Lex.C_NAME
         normalise_term("clo 1")       -> Lex.CLO (root)
@@ -876,17 +873,27 @@ def normalise_term(term_or_id: str) -> Optional[Lex]:
 
 def get_entry(term_or_id: str | Lex) -> Optional[LexiconEntry]:
     """Return the LexiconEntry for a given Lex ID or user-facing term."""
-    if isinstance(term_or_id, Lex):
+    if not isinstance(term_or_id, Lex):
+        term_or_id = normalise_term(str(term_or_id))
+        if term_or_id is None:
+            return None
+    try:
+        return _LEXICON_BY_ORD[term_or_id.ord]
+    except AttributeError:
+        # A Lex built outside the table has no ordinal
         return LEXICON.get(term_or_id)
-    lex = normalise_term(str(term_or_id))
-    if lex is None:
-        return None
-    return LEXICON.get(lex)
 
 
 def is_term(term_or_id: str | Lex, expected: Lex) -> bool:
     """True if the given value resolves to the expected Lex ID."""
     if isinstance(term_or_id, Lex):
         return term_or_id is expected
-    lex = normalise_term(str(term_or_id))
-    return lex is expected
+    return _normalise_key(str(term_or_id)) in LEX_TO_NORMALISED.get(expected, ())
+
+
+def match_any(value: str | Lex, *expected: Lex) -> bool:
+    """True if the given value resolves to any of the expected Lex IDs."""
+    if isinstance(value, Lex):
+        return value in expected
+    key = _normalise_key(str(value))
+    return any(key in LEX_TO_NORMALISED.get(lex_id, ()) for lex_id in expected)
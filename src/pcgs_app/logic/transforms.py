@@ -8,14 +8,53 @@ prevents drift and provides a single mapping source.
 
 from typing import Any, Dict
 
+from pcgs_app.logic.lexicon import LEXICON, Lex, _normalise_key
+
+# Course form fields, resolved against these entries only. The global variant
+# index cannot be used here: shared terms such as "title" belong to other
+# entries there (Lex.REF_TITLE).
+COURSE_FORM_FIELDS = (
+    Lex.C_NAME,
+    Lex.C_LEVEL,
+    Lex.C_THEME,
+    Lex.C_DURATION,
+    Lex.C_CODE,
+    Lex.C_DEV,
+)
+
+# Normalised form key -> Lex ID, covering each field's ID, label and variants
+_FORM_TO_MODEL: Dict[str, Lex] = {
+    _normalise_key(term): lex_id
+    for lex_id in COURSE_FORM_FIELDS
+    for term in (LEXICON[lex_id].id, LEXICON[lex_id].primary_term, *LEXICON[lex_id].variants)
+}
+
 
 def course_form_to_model(payload: Dict[str, Any]) -> Dict[str, Any]:
     """
     Convert UI form payloads into a structure accepted by pcgs_core workflows.
-    """
 
-    # TODO: Map form field names to dataclass fields, normalise values, and
-    # attach metadata from lexicon tokens.
-    return payload.copy()
+    Course field names are rewritten to their Lex ID in a single pass;
+    unrecognised keys are carried through unchanged.
 
+    Raises:
+        ValueError: If two payload keys name the same course field (e.g.
+            "thematic" and "category"), rather than letting the last one win
+    """
 
+    # TODO: Map form field names to dataclass fields and attach metadata from
+    # lexicon tokens.
+    model: Dict[Any, Any] = {}
+    sources: Dict[Lex, Any] = {}
+    for key, value in payload.items():
+        lex_id = _FORM_TO_MODEL.get(_normalise_key(key)) if isinstance(key, str) else None
+        if lex_id is None:
+            model[key] = value
+            continue
+        if lex_id in sources:
+            raise ValueError(
+                f"Form keys {sources[lex_id]!r} and {key!r} both map to {lex_id!r}"
+            )
+        sources[lex_id] = key
+        model[lex_id] = value
+    return model
@@ -8,7 +8,8 @@ will eventually replace the monolithic Streamlit handlers from Prometheus1.
 
 from typing import Any, Dict
 
-from pcgs_core import workflows as core_workflows
+# pcgs_core.workflows is imported inside each function so importing the logic
+# package does not pull in the core models until a workflow actually runs.
 
 
 def create_course(user_id: str, course_data: Dict[str, Any]):
@@ -17,6 +18,8 @@ def create_course(user_id: str, course_data: Dict[str, Any]):
     """
 
     # TODO: Inject validators, lexicon enrichment, and persistence events.
+    from pcgs_core import workflows as core_workflows
+
     return core_workflows.create_new_course(user_id=user_id, course_data=course_data)
 
 
@@ -27,6 +30,8 @@ def generate_scalar(course) -> None:
 
     # TODO: Re-implement legacy scalar builder flow with deterministic state
     # transitions and template-backed exports.
+    from pcgs_core import workflows as core_workflows
+
     return core_workflows.build_scalar_for_course(course=course)
 
 
@@ -36,6 +41,8 @@ def generate_lessons(course) -> None:
     """
 
     # TODO: Add batching, PKE retries, and user overrides.
+    from pcgs_core import workflows as core_workflows
+
     return core_workflows.build_lessons_for_course(course=course)
 
 
@@ -46,6 +53,8 @@ def generate_timetable(course) -> None:
 
     # TODO: Port the legacy planner logic (lesson sequencing, Rabdan day plan)
     # into a reusable scheduling service.
+    from pcgs_core import workflows as core_workflows
+
     return core_workflows.build_timetable_for_course(course=course)
 
 
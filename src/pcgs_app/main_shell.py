@@ -13,6 +13,8 @@ or via the launcher:
 
 import os
 import sys
+from functools import lru_cache
+from typing import Any, Tuple
 
 # ---------------------------------------------------------------------------
 # Bootstrap: ensure "src" is on sys.path so pcgs_app is importable.
@@ -24,17 +26,26 @@ _src_dir = os.path.dirname(os.path.dirname(_this_file))  # src/pcgs_app -> src
 if _src_dir not in sys.path:
     sys.path.insert(0, _src_dir)
 
-import streamlit as st
 
-from pcgs_app.app_root import get_app_tabs
-from pcgs_app.ui.theme.streamlit_theme import apply_base_theme
-from pcgs_app.ui.theme.tokens import get_default_tokens
+@lru_cache(maxsize=1)
+def _load_tabs() -> Tuple[Tuple[Any, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """Return (tabs, labels, ids) once per process; the tab registry is static."""
+    from pcgs_app.app_root import get_app_tabs
+
+    tabs = get_app_tabs()
+    return tabs, tuple(t["label"] for t in tabs), tuple(t["id"] for t in tabs)
 
 
 def main() -> None:
     """
     Render the V2 Prometheus app shell with sidebar navigation and tab routing.
     """
+    # Heavy UI imports are deferred so importing this module stays cheap
+    import streamlit as st
+
+    from pcgs_app.ui.theme.streamlit_theme import apply_base_theme
+    from pcgs_app.ui.theme.tokens import get_default_tokens
+
     st.set_page_config(
         page_title="Prometheus Course Generation System 2.0",
         page_icon="🔥",
@@ -45,14 +56,13 @@ def main() -> None:
     # Apply neon theme globally
     apply_base_theme(get_default_tokens())
 
-    tabs = get_app_tabs()
-    tab_labels = [t["label"] for t in tabs]
-    tab_ids = [t["id"] for t in tabs]
+    tabs, tab_labels, tab_ids = _load_tabs()
 
     # Check for programmatic navigation request (e.g. from Create Course manager tiles)
     nav_request = st.session_state.pop("pcgs_navigate_to_tab", None)
     if nav_request and nav_request in tab_ids:
         st.session_state["pcgs_active_tab"] = nav_request
+        st.session_state["pcgs_sidebar_nav"] = tab_labels[tab_ids.index(nav_request)]
 
     # Determine current tab
     current_tab_id = st.session_state.get("pcgs_active_tab", tab_ids[0])
@@ -60,13 +70,14 @@ def main() -> None:
         current_tab_id = tab_ids[0]
     current_index = tab_ids.index(current_tab_id)
 
-    # Sidebar navigation
+    # Sidebar navigation; the radio's selection lives in session state so
+    # navigation requests can move it
+    st.session_state.setdefault("pcgs_sidebar_nav", tab_labels[current_index])
     st.sidebar.title("PCGS 2.0")
     st.sidebar.markdown("---")
     selected_label = st.sidebar.radio(
         "Navigation",
         tab_labels,
-        index=current_index,
         key="pcgs_sidebar_nav",
     )
 
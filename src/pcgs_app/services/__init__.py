@@ -5,8 +5,19 @@ Abstracts importers, exporters, PKE clients, and deployment hooks so that the
 application logic can remain agnostic of specific implementations.
 """
 
-from . import cloud, exporter, generator, importer, pke  # noqa: F401
+import importlib
 
 __all__ = ["cloud", "exporter", "generator", "importer", "pke"]
 
 
+def __getattr__(name):
+    """Import service subpackages on first attribute access (PEP 562)."""
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
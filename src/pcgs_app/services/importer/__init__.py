@@ -5,8 +5,8 @@ Stubs for modular import flows (scalar spreadsheets, lesson workbooks, etc.).
 Legacy logic intermixed these flows with UI callbacks; v2 will keep them here.
 """
 
-from . import lessons_importer, scalar_importer  # noqa: F401
+from . import lessons_importer, scalar_importer, xlsx_reader  # noqa: F401
 
-__all__ = ["scalar_importer", "lessons_importer"]
+__all__ = ["scalar_importer", "lessons_importer", "xlsx_reader"]
 
 
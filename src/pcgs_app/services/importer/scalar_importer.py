@@ -1,21 +1,134 @@
 """
 Scalar Importer
 
-Placeholder for importing course scalar structures from spreadsheets/legacy
-sources. This module will supersede the Prometheus1 `import_course_structure`
-excel routines while enforcing schema validation and audit logging.
+Builds scalar collections from the course scalar Excel template. Streamed
+template rows are turned into entries by ``collect_scalar_rows``, which
+``scalar_service.import_scalar_from_excel`` uses for every reader;
+``load_scalar_from_excel`` applies the same cell rules column-wise with
+pandas, so both produce the same entries for the same workbook.
 """
 
-from typing import Any, List
+from io import BytesIO
+from typing import Any, BinaryIO, Dict, Iterable, List, Tuple, Union
 
+from pcgs_app.core.scalar_models import (
+    EXCEL_COLUMN_COUNT,
+    EXCEL_DATA_START_ROW,
+    EXCEL_LEVEL_COLUMNS,
+    ScalarCollection,
+    ScalarEntry,
+    ScalarLevel,
+)
+from pcgs_app.services.importer.xlsx_reader import active_sheet_index
 
-def import_scalar_from_workbook(path: str) -> List[Any]:
+
+def collect_scalar_rows(rows: Iterable[Tuple[Any, ...]]) -> Tuple[ScalarCollection, Dict[ScalarLevel, int]]:
+    """
+    Build a collection from template rows (value tuples starting at row 6).
+    
+    Returns:
+        Tuple of (collection, per-level entry counts)
+    """
+    collection = ScalarCollection()
+    add_entry = collection.add_entry
+    # Repeated cell texts (common in performance criteria) share one string
+    share_text = {}.setdefault
+    # Positional counters avoid an enum-keyed dict lookup per cell pair
+    columns = tuple(enumerate(EXCEL_LEVEL_COLUMNS))
+    level_counts = [0] * len(columns)
+    
+    for row in rows:
+        # Process each scalar level
+        for i, (level, serial_col, text_col) in columns:
+            serial = str(v).strip() if (v := row[serial_col]) else ""
+            text = str(v).strip() if (v := row[text_col]) else ""
+            
+            # Only add if we have meaningful content
+            if serial or text:
+                count = level_counts[i] = level_counts[i] + 1
+                add_entry(ScalarEntry(
+                    level=level,
+                    serial=serial or str(count),
+                    text=share_text(text, text),
+                    order_index=count,
+                ))
+    
+    counts = {level: 0 for level in ScalarLevel}
+    counts.update((level, count) for (level, _, _), count in zip(EXCEL_LEVEL_COLUMNS, level_counts))
+    return collection, counts
+
+
+def load_scalar_from_excel(source: Union[str, BinaryIO]) -> ScalarCollection:
     """
-    Load scalar data from the provided workbook path.
+    Load a scalar collection from an Excel template in column batches.
+
+    The active sheet is read once with pandas and its cells are cleaned
+    column-wise by the same rules as ``collect_scalar_rows`` (falsy cells are
+    blank, everything else is stringified and stripped). Each level then masks
+    its (serial, text) column pair and builds its entries in one pass, so the
+    result matches ``scalar_service.import_scalar_from_excel(content,
+    validate=False)``. Bloom's verb corrections are not applied here; pass the
+    result to ``scalar_service.apply_blooms_corrections`` when they are wanted.
+
+    Args:
+        source: Workbook path or binary file-like object
+
+    Returns:
+        ScalarCollection with entries ordered level by level
     """
+    import pandas as pd
 
-    # TODO: Re-implement `import_course_structure_from_excel` behaviour using a
-    # streaming parser plus transform/validation hooks.
-    raise NotImplementedError("Scalar importer not yet implemented.")
+    if isinstance(source, str):
+        with open(source, "rb") as handle:
+            content = handle.read()
+    else:
+        content = source.read()
 
+    frame = pd.read_excel(
+        BytesIO(content),
+        sheet_name=active_sheet_index(content),
+        header=None,
+        skiprows=EXCEL_DATA_START_ROW,
+        dtype=object,
+    )
+    # Pad narrow sheets so every template column exists
+    frame = frame.reindex(columns=range(EXCEL_COLUMN_COUNT)).astype(object)
+    cells = frame.where(frame.notna(), "")
+    cells = cells.where(cells.astype(bool), "").astype(str)
+    values = cells.apply(lambda col: col.str.strip()).to_numpy(dtype=object)
+
+    entries: List[ScalarEntry] = []
+    for level, serial_col, text_col in EXCEL_LEVEL_COLUMNS:
+        pairs = values[:, [serial_col, text_col]]
+        mask = (pairs[:, 0] != "") | (pairs[:, 1] != "")
+        entries.extend(
+            ScalarEntry(
+                level=level,
+                serial=serial or str(idx),
+                text=text,
+                order_index=idx,
+            )
+            for idx, (serial, text) in enumerate(pairs[mask].tolist(), start=1)
+        )
+    return ScalarCollection(entries=entries)
+
+
+def import_scalar_from_workbook(path: str) -> List[Dict[str, Any]]:
+    """
+    Load scalar data from the provided workbook path as storage dicts.
+
+    Goes through ``scalar_service.import_scalar_from_excel`` (streaming
+    reader, no Bloom's corrections), which is faster than the pandas loader
+    because pandas parses the whole workbook with openpyxl first.
+
+    Raises:
+        ValueError: If the workbook cannot be read
+    """
+    # Imported here: scalar_service imports collect_scalar_rows from this module
+    from pcgs_app.services.scalar_service import import_scalar_from_excel
 
+    with open(path, "rb") as handle:
+        success, message, collection = import_scalar_from_excel(handle.read(), validate=False)
+    if not success:
+        raise ValueError(message)
+    return collection.to_list()
@@ -0,0 +1,378 @@
+"""
+Streaming XLSX Reader
+
+Minimal row reader for .xlsx packages that walks the active worksheet's XML
+with iterparse instead of building an openpyxl workbook. Only cached cell
+values are read; merged cells and styles are ignored, except that date and
+time number formats are resolved so those cells come back as the datetime,
+time or timedelta openpyxl would report.
+
+When the optional python-calamine package is installed,
+``read_sheet_rows_calamine`` parses the sheet natively in one call.
+"""
+
+import posixpath
+import re
+import zipfile
+from datetime import date, datetime, time, timedelta
+from io import BytesIO
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from xml.etree.ElementTree import ParseError, iterparse
+
+try:  # Optional native reader; resolved once so misses don't rescan sys.path
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_SHARED_STRINGS_TYPE = "/sharedStrings"
+_STYLES_TYPE = "/styles"
+
+# Excel day 0 for the default (1900) and Mac (1904) date systems
+_WINDOWS_EPOCH = datetime(1899, 12, 30)
+_MAC_EPOCH = datetime(1904, 1, 1)
+
+# Built-in number formats (ECMA-376 18.8.30) that display dates or times
+_BUILTIN_DATE_FORMATS: Dict[int, str] = {
+    14: "mm-dd-yy",
+    15: "d-mmm-yy",
+    16: "d-mmm",
+    17: "mmm-yy",
+    18: "h:mm AM/PM",
+    19: "h:mm:ss AM/PM",
+    20: "h:mm",
+    21: "h:mm:ss",
+    22: "m/d/yy h:mm",
+    45: "mm:ss",
+    46: "[h]:mm:ss",
+    47: "mmss.0",
+}
+
+# Format classification rules, as in openpyxl.styles.numbers
+_FORMAT_LITERAL_RE = re.compile(r'".*?"|\[(?!hh?\]|mm?\]|ss?\])[^\]]*\]')
+_DATE_TOKEN_RE = re.compile(r"(?<![_\\])[dmhysDMHYS]")
+_ELAPSED_TIME_RE = re.compile(r"\[hh?\](:mm(:ss(\.0*)?)?)?|\[mm?\](:ss(\.0*)?)?|\[ss?\](\.0*)?")
+
+
+def _local(tag: str) -> str:
+    """Strip the namespace from an element tag."""
+    return tag.rpartition("}")[2]
+
+
+def _column_index(ref: str) -> int:
+    """Convert a cell reference like "K12" to a 0-based column index."""
+    index = 0
+    for ch in ref:
+        if not ch.isalpha():
+            break
+        index = index * 26 + (ord(ch.upper()) - 64)
+    return index - 1
+
+
+def _read_relationships(archive: zipfile.ZipFile) -> Dict[str, Tuple[str, str]]:
+    """Return workbook relationship id -> (type, part path)."""
+    rels: Dict[str, Tuple[str, str]] = {}
+    with archive.open("xl/_rels/workbook.xml.rels") as handle:
+        for _, elem in iterparse(handle):
+            if elem.tag == f"{_PKG_REL_NS}Relationship":
+                target = elem.get("Target", "")
+                if target.startswith("/"):
+                    path = target.lstrip("/")
+                else:
+                    path = posixpath.normpath(posixpath.join("xl", target))
+                rels[elem.get("Id", "")] = (elem.get("Type", ""), path)
+    return rels
+
+
+def _read_sheet_order(archive: zipfile.ZipFile) -> Tuple[int, List[str], bool]:
+    """
+    Return (active sheet position, sheet relationship ids in tab order,
+    whether dates use the 1904 system).
+    """
+    active_tab = 0
+    sheet_ids: List[str] = []
+    date1904 = False
+    with archive.open("xl/workbook.xml") as handle:
+        for _, elem in iterparse(handle):
+            tag = _local(elem.tag)
+            if tag == "workbookView" and elem.get("activeTab"):
+                active_tab = int(elem.get("activeTab"))
+            elif tag == "sheet":
+                sheet_ids.append(elem.get(f"{_REL_NS}id", ""))
+            elif tag == "workbookPr":
+                date1904 = elem.get("date1904") in ("1", "true")
+    if not sheet_ids:
+        raise KeyError("workbook has no sheets")
+    if active_tab >= len(sheet_ids):
+        active_tab = 0
+    return active_tab, sheet_ids, date1904
+
+
+def active_sheet_index(file_content: bytes) -> int:
+    """
+    Return the tab position of the active sheet, or 0 if it cannot be read
+    (e.g. legacy .xls content).
+    """
+    try:
+        with zipfile.ZipFile(BytesIO(file_content)) as archive:
+            return _read_sheet_order(archive)[0]
+    except (zipfile.BadZipFile, KeyError, ValueError, ParseError):
+        return 0
+
+
+def _read_shared_strings(archive: zipfile.ZipFile, rels: Dict[str, Tuple[str, str]]) -> List[str]:
+    """Load the shared string table (rich-text runs are concatenated)."""
+    path = next(
+        (path for rel_type, path in rels.values() if rel_type.endswith(_SHARED_STRINGS_TYPE)),
+        None,
+    )
+    if path is None:
+        return []
+
+    strings: List[str] = []
+    parts: List[str] = []
+    in_phonetic = False
+    with archive.open(path) as handle:
+        for event, elem in iterparse(handle, events=("start", "end")):
+            tag = _local(elem.tag)
+            if tag == "rPh":
+                in_phonetic = event == "start"
+            elif event != "end":
+                continue
+            elif tag == "t" and not in_phonetic:
+                parts.append(elem.text or "")
+            elif tag == "si":
+                strings.append("".join(parts))
+                parts.clear()
+                elem.clear()
+    return strings
+
+
+def _read_date_styles(archive: zipfile.ZipFile, rels: Dict[str, Tuple[str, str]]) -> Dict[int, bool]:
+    """
+    Map each cell style (``s=`` index) with a date or time number format to
+    whether that format shows elapsed time (``[h]:mm``) rather than a clock.
+    """
+    path = next(
+        (path for rel_type, path in rels.values() if rel_type.endswith(_STYLES_TYPE)),
+        None,
+    )
+    if path is None:
+        return {}
+
+    custom: Dict[int, str] = {}
+    style_formats: List[int] = []
+    in_cell_xfs = False
+    with archive.open(path) as handle:
+        for event, elem in iterparse(handle, events=("start", "end")):
+            tag = _local(elem.tag)
+            if tag == "cellXfs":
+                in_cell_xfs = event == "start"
+            elif event != "start":
+                continue
+            elif tag == "numFmt":
+                custom[int(elem.get("numFmtId", 0))] = elem.get("formatCode", "")
+            elif tag == "xf" and in_cell_xfs:
+                style_formats.append(int(elem.get("numFmtId", 0)))
+
+    date_styles: Dict[int, bool] = {}
+    for style, fmt_id in enumerate(style_formats):
+        fmt = custom.get(fmt_id) or _BUILTIN_DATE_FORMATS.get(fmt_id)
+        if not fmt:
+            continue
+        # Only the positive-number section decides how a cell is shown
+        fmt = fmt.split(";")[0]
+        if _DATE_TOKEN_RE.search(_FORMAT_LITERAL_RE.sub("", fmt)):
+            date_styles[style] = _ELAPSED_TIME_RE.search(fmt) is not None
+    return date_styles
+
+
+def _from_excel_serial(value: float, epoch: datetime, elapsed: bool) -> Any:
+    """Convert a date-formatted serial number as openpyxl's from_excel does."""
+    try:
+        if elapsed:
+            delta = timedelta(days=value)
+            if delta.microseconds:
+                # Round to millisecond precision
+                delta = timedelta(
+                    seconds=delta.total_seconds() // 1,
+                    microseconds=round(delta.microseconds, -3),
+                )
+            return delta
+
+        day, fraction = divmod(value, 1)
+        diff = timedelta(milliseconds=round(fraction * 86400 * 1000))
+        if 0 <= value < 1 and diff.days == 0:
+            minutes, seconds = divmod(diff.seconds, 60)
+            hours, minutes = divmod(minutes, 60)
+            return time(hours, minutes, seconds, diff.microseconds)
+        if 0 < value < 60 and epoch == _WINDOWS_EPOCH:
+            # Serials before 1900-03-01 skip Excel's phantom 1900-02-29
+            day += 1
+        return epoch + timedelta(days=day) + diff
+    except (OverflowError, ValueError):
+        # openpyxl reports out-of-range date serials as an error cell
+        return "#VALUE!"
+
+
+def _iso_value(raw: str) -> Any:
+    """Parse a ``t="d"`` ISO 8601 cell into a date, time or datetime."""
+    try:
+        if "T" in raw:
+            return datetime.fromisoformat(raw)
+        if ":" in raw:
+            return time.fromisoformat(raw)
+        return date.fromisoformat(raw)
+    except ValueError:
+        return raw
+
+
+def _cell_value(cell_type: Optional[str], raw: Optional[str], shared: List[str]) -> Any:
+    """Convert a raw <v> payload to the value openpyxl would report."""
+    if not raw:
+        # Formulas without a cached result are written as an empty <v/>
+        return None
+    if cell_type == "s":
+        return shared[int(raw)]
+    if cell_type == "b":
+        return raw == "1"
+    if cell_type == "d":
+        return _iso_value(raw)
+    if cell_type in ("str", "e", "inlineStr"):
+        return raw
+    # Numeric: mirror openpyxl's int/float split
+    if "." in raw or "E" in raw or "e" in raw:
+        return float(raw)
+    return int(raw)
+
+
+def iter_sheet_rows(
+    file_content: bytes,
+    min_row: int = 1,
+    max_col: Optional[int] = None,
+) -> Iterator[Tuple[Any, ...]]:
+    """
+    Stream the active sheet's rows as value tuples.
+
+    Mirrors ``iter_rows(values_only=True)``: rows are 1-based, start at
+    ``min_row``, and are padded/truncated to ``max_col`` columns. Rows with
+    no values in that range are skipped rather than yielded as blanks.
+
+    Raises:
+        ValueError: If the content is not a readable .xlsx package
+    """
+    try:
+        archive = zipfile.ZipFile(BytesIO(file_content))
+    except zipfile.BadZipFile as e:
+        raise ValueError(f"Not an .xlsx package: {e}") from e
+
+    with archive:
+        try:
+            rels = _read_relationships(archive)
+            active_tab, sheet_ids, date1904 = _read_sheet_order(archive)
+            shared = _read_shared_strings(archive, rels)
+            date_styles = _read_date_styles(archive, rels)
+            handle = archive.open(rels[sheet_ids[active_tab]][1])
+        except (KeyError, IndexError, ValueError, ParseError) as e:
+            raise ValueError(f"Unsupported workbook structure: {e}") from e
+
+        with handle:
+            row_number = 0
+            sheet_data = None
+            values: Dict[int, Any] = {}
+            cell_type: Optional[str] = None
+            raw: Optional[str] = None
+            elapsed: Optional[bool] = None
+            epoch = _MAC_EPOCH if date1904 else _WINDOWS_EPOCH
+            col = -1
+            try:
+                for event, elem in iterparse(handle, events=("start", "end")):
+                    tag = _local(elem.tag)
+                    if event == "start":
+                        if tag == "row":
+                            row_number = int(elem.get("r") or row_number + 1)
+                            values = {}
+                            col = -1
+                        elif tag == "sheetData":
+                            sheet_data = elem
+                        elif tag == "c":
+                            ref = elem.get("r")
+                            col = _column_index(ref) if ref else col + 1
+                            cell_type = elem.get("t")
+                            raw = None
+                            # None unless the cell's style is a date format
+                            elapsed = date_styles.get(int(elem.get("s") or 0)) if date_styles else None
+                        continue
+
+                    if tag == "v":
+                        raw = elem.text or ""
+                    elif tag == "t" and cell_type == "inlineStr":
+                        # Inline rich text arrives as several <t> runs
+                        raw = (raw or "") + (elem.text or "")
+                    elif tag == "c":
+                        if row_number >= min_row and (max_col is None or col < max_col):
+                            value = _cell_value(cell_type, raw, shared)
+                            if elapsed is not None and cell_type in (None, "n") and value is not None:
+                                value = _from_excel_serial(value, epoch, elapsed)
+                            if value is not None:
+                                values[col] = value
+                        elem.clear()
+                    elif tag == "row":
+                        if row_number >= min_row and values:
+                            width = max_col if max_col is not None else max(values, default=-1) + 1
+                            yield tuple(values.get(i) for i in range(width))
+                        # Drop finished rows so memory stays flat on long sheets
+                        if sheet_data is not None:
+                            sheet_data.clear()
+            except (ParseError, IndexError) as e:
+                raise ValueError(f"Malformed worksheet XML: {e}") from e
+
+
+def _calamine_value(value: Any) -> Any:
+    """Map calamine's cell values onto what openpyxl would report."""
+    if value == "":
+        return None
+    if type(value) is date:
+        # openpyxl reports every date-formatted number as a datetime
+        return datetime.combine(value, time())
+    if type(value) is float and value.is_integer():
+        # calamine reports every xlsx number as float; keep "1" serials as 1
+        return int(value)
+    return value
+
+
+def read_sheet_rows_calamine(
+    file_content: bytes,
+    min_row: int = 1,
+    max_col: Optional[int] = None,
+) -> List[Tuple[Any, ...]]:
+    """
+    Read the active sheet with the Rust-backed python-calamine parser.
+
+    Returns the same shape as ``iter_sheet_rows`` (non-empty rows from
+    ``min_row``, padded/truncated to ``max_col``), parsed in a single call.
+
+    Raises:
+        ImportError: If python-calamine is not installed
+        ValueError: If calamine cannot read the content
+    """
+    if CalamineWorkbook is None:
+        raise ImportError("python-calamine is not installed")
+
+    try:
+        workbook = CalamineWorkbook.from_filelike(BytesIO(file_content))
+        sheet = workbook.get_sheet_by_index(active_sheet_index(file_content))
+        grid = sheet.to_python(skip_empty_area=False)
+    except Exception as e:
+        raise ValueError(f"calamine could not read workbook: {e}") from e
+
+    rows: List[Tuple[Any, ...]] = []
+    for raw_row in grid[min_row - 1:]:
+        row = tuple(_calamine_value(v) for v in raw_row[:max_col])
+        if all(v is None for v in row):
+            continue
+        if max_col is not None and len(row) < max_col:
+            row += (None,) * (max_col - len(row))
+        rows.append(row)
+    return rows
@@ -6,114 +6,103 @@ Central service layer for all scalar operations:
 - CRUD operations (add, update, delete)
 - Reordering and renumbering
 - Bloom's verb validation for CLOs
-- Session state management for UI
 
 This is the single source of truth for scalar data manipulation.
 The UI layer should call these functions rather than manipulating
-scalar data directly.
+scalar data directly. Streamlit session state lives in scalar_session,
+which is only imported when an operation needs the session collection, so
+the import and validation helpers can be used without Streamlit.
 """
 
-from typing import Any, Dict, List, Optional, Tuple
-import streamlit as st
+from functools import lru_cache
+from io import BytesIO
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from pcgs_app.core.scalar_models import (
     ScalarEntry,
     ScalarLevel,
     ScalarCollection,
-    EXCEL_COLUMN_MAP,
+    EXCEL_COLUMN_COUNT,
     EXCEL_DATA_START_ROW,
     BLOOMS_VERBS,
     check_blooms_verb,
+    correct_blooms_verb,
 )
+from pcgs_app.services.importer.scalar_importer import collect_scalar_rows
+from pcgs_app.services.importer.xlsx_reader import iter_sheet_rows, read_sheet_rows_calamine
 
 
-# Session state keys for scalar management
-SCALAR_STATE_KEY = "pcgs_scalar_collection"
-SCALAR_WARNINGS_KEY = "pcgs_scalar_warnings"
-SCALAR_DIRTY_KEY = "pcgs_scalar_dirty"  # True if unsaved changes exist
+def _session():
+    """Import the Streamlit-backed session helpers on first use."""
+    from pcgs_app.services import scalar_session
+    return scalar_session
 
 
-# ============================================================================
-# Session State Management
-# ============================================================================
+# Last display entries per level: (collection, collection.version, entries)
+_DISPLAY_CACHE: Dict[ScalarLevel, Tuple[ScalarCollection, int, List[ScalarEntry]]] = {}
 
-def init_scalar_state() -> None:
-    """
-    Initialize scalar-related session state.
-    Call this at the start of the scalar tab render.
-    """
-    if SCALAR_STATE_KEY not in st.session_state:
-        st.session_state[SCALAR_STATE_KEY] = ScalarCollection()
-    if SCALAR_WARNINGS_KEY not in st.session_state:
-        st.session_state[SCALAR_WARNINGS_KEY] = []
-    if SCALAR_DIRTY_KEY not in st.session_state:
-        st.session_state[SCALAR_DIRTY_KEY] = False
+# Serial -> position maps derived from the cached display entries
+_POSITION_CACHE: Dict[ScalarLevel, Tuple[List[ScalarEntry], Dict[str, int]]] = {}
 
+# Last per-level counts: (collection, collection.version, counts)
+_COUNTS_CACHE: Optional[Tuple[ScalarCollection, int, Dict[str, int]]] = None
 
-def get_scalar_collection() -> ScalarCollection:
-    """
-    Get the current scalar collection from session state.
-    
-    Returns:
-        ScalarCollection instance
-    """
-    init_scalar_state()
-    return st.session_state[SCALAR_STATE_KEY]
 
+# ============================================================================
+# Excel Import
+# ============================================================================
 
-def set_scalar_collection(collection: ScalarCollection) -> None:
+def _read_template_rows(file_content: bytes) -> Iterable[Tuple[Any, ...]]:
     """
-    Set the scalar collection in session state.
+    Read template rows with python-calamine if installed, else stream the XML.
     
-    Args:
-        collection: ScalarCollection to store
+    Raises:
+        ValueError: If the content cannot be parsed by the chosen reader
     """
-    st.session_state[SCALAR_STATE_KEY] = collection
-    st.session_state[SCALAR_DIRTY_KEY] = True
-
-
-def get_warnings() -> List[str]:
-    """Get current warnings list."""
-    init_scalar_state()
-    return st.session_state[SCALAR_WARNINGS_KEY]
-
-
-def add_warning(message: str) -> None:
-    """Add a warning message."""
-    init_scalar_state()
-    warnings = st.session_state[SCALAR_WARNINGS_KEY]
-    if message not in warnings:
-        warnings.append(message)
-    # Keep only last 10 warnings
-    st.session_state[SCALAR_WARNINGS_KEY] = warnings[-10:]
-
-
-def clear_warnings() -> None:
-    """Clear all warnings."""
-    st.session_state[SCALAR_WARNINGS_KEY] = []
-
-
-def is_dirty() -> bool:
-    """Check if there are unsaved changes."""
-    init_scalar_state()
-    return st.session_state.get(SCALAR_DIRTY_KEY, False)
-
-
-def mark_clean() -> None:
-    """Mark scalar as saved (no unsaved changes)."""
-    st.session_state[SCALAR_DIRTY_KEY] = False
+    try:
+        return read_sheet_rows_calamine(
+            file_content,
+            min_row=EXCEL_DATA_START_ROW + 1,
+            max_col=EXCEL_COLUMN_COUNT,
+        )
+    except ImportError:
+        return iter_sheet_rows(
+            file_content,
+            min_row=EXCEL_DATA_START_ROW + 1,
+            max_col=EXCEL_COLUMN_COUNT,
+        )
 
 
-def mark_dirty() -> None:
-    """Mark scalar as having unsaved changes."""
-    st.session_state[SCALAR_DIRTY_KEY] = True
+@lru_cache(maxsize=1)
+def _load_openpyxl() -> Any:
+    """Import openpyxl once on first fallback; None if it is not installed."""
+    try:
+        import openpyxl
+    except ImportError:
+        return None
+    return openpyxl
 
 
-# ============================================================================
-# Excel Import
-# ============================================================================
-
-def import_scalar_from_excel(file_content: bytes) -> Tuple[bool, str, ScalarCollection]:
+def _collect_with_openpyxl(openpyxl: Any, file_content: bytes) -> Tuple[ScalarCollection, Dict[ScalarLevel, int]]:
+    """Fallback reader for workbooks the streaming reader cannot handle."""
+    # Read-only mode streams rows instead of building the full object model
+    workbook = openpyxl.load_workbook(BytesIO(file_content), read_only=True, data_only=True)
+    try:
+        sheet = workbook.active
+        if sheet is None:
+            raise ValueError("No active sheet found in workbook")
+        return collect_scalar_rows(sheet.iter_rows(
+            min_row=EXCEL_DATA_START_ROW + 1,
+            max_col=EXCEL_COLUMN_COUNT,
+            values_only=True,
+        ))
+    finally:
+        # Read-only workbooks keep the archive open until closed
+        workbook.close()
+
+
+def import_scalar_from_excel(file_content: bytes,
+                             validate: bool = True) -> Tuple[bool, str, ScalarCollection]:
     """
     Import scalar data from Excel file content.
     
@@ -125,90 +114,40 @@ def import_scalar_from_excel(file_content: bytes) -> Tuple[bool, str, ScalarColl
     - Column H/I: Lesson serial + text
     - Column J/K: Performance Criteria serial + text
     
+    The active sheet is parsed by python-calamine when installed, otherwise
+    streamed straight from the .xlsx XML; openpyxl is only used when those
+    readers reject the file.
+    
     Args:
         file_content: Raw bytes from uploaded Excel file
+        validate: If False, skip the Bloom's corrections so the caller can
+            run them later (see scalar_session.run_pending_validation)
         
     Returns:
         Tuple of (success: bool, message: str, collection: ScalarCollection)
     """
     try:
-        import openpyxl
-        from io import BytesIO
-    except ImportError:
-        return (False, "openpyxl library not installed. Run: pip install openpyxl", ScalarCollection())
-    
-    try:
-        # Load workbook from bytes
-        workbook = openpyxl.load_workbook(BytesIO(file_content), data_only=True)
-        sheet = workbook.active
-        
-        if sheet is None:
-            return (False, "No active sheet found in workbook", ScalarCollection())
-        
-        collection = ScalarCollection()
-        counts = {level: 0 for level in ScalarLevel}
-        
-        # Process rows starting from row 6 (index 5)
-        for row_idx, row in enumerate(sheet.iter_rows(min_row=EXCEL_DATA_START_ROW + 1), start=1):
-            # Process each scalar level
-            for level, (serial_col, text_col) in EXCEL_COLUMN_MAP.items():
-                serial_cell = row[serial_col] if serial_col < len(row) else None
-                text_cell = row[text_col] if text_col < len(row) else None
-                
-                serial = str(serial_cell.value).strip() if serial_cell and serial_cell.value else ""
-                text = str(text_cell.value).strip() if text_cell and text_cell.value else ""
-                
-                # Only add if we have meaningful content
-                if serial or text:
-                    counts[level] += 1
-                    entry = ScalarEntry(
-                        level=level,
-                        serial=serial or str(counts[level]),
-                        text=text,
-                        order_index=counts[level],
-                    )
-                    collection.add_entry(entry)
+        try:
+            collection, counts = collect_scalar_rows(_read_template_rows(file_content))
+        except ValueError:
+            openpyxl = _load_openpyxl()
+            if openpyxl is None:
+                return (False, "openpyxl library not installed. Run: pip install openpyxl", ScalarCollection())
+            collection, counts = _collect_with_openpyxl(openpyxl, file_content)
         
         # Generate summary
         total = sum(counts.values())
-        summary_parts = [f"{counts[level]} {level.value}s" for level in ScalarLevel if counts[level] > 0]
+        summary_parts = [f"{count} {level.value}s" for level, count in counts.items() if count > 0]
         summary = f"Imported {total} entries: " + ", ".join(summary_parts)
         
-        # Validate CLOs for Bloom's verbs
-        validate_all_clos(collection)
+        # Capitalize Bloom's verbs; the session wrapper records the warnings
+        if validate:
+            apply_blooms_corrections(collection)
         
         return (True, summary, collection)
-        
-    except Exception as e:
-        return (False, f"Error reading Excel file: {str(e)}", ScalarCollection())
-
-
-def import_scalar_from_file(uploaded_file) -> Tuple[bool, str]:
-    """
-    Import scalar from Streamlit uploaded file object.
-    Updates session state directly.
     
-    Args:
-        uploaded_file: Streamlit UploadedFile object
-        
-    Returns:
-        Tuple of (success: bool, message: str)
-    """
-    if uploaded_file is None:
-        return (False, "No file uploaded")
-    
-    try:
-        content = uploaded_file.read()
-        success, message, collection = import_scalar_from_excel(content)
-        
-        if success:
-            set_scalar_collection(collection)
-            mark_dirty()
-        
-        return (success, message)
-        
     except Exception as e:
-        return (False, f"Error processing file: {str(e)}")
+        return (False, f"Error reading Excel file: {str(e)}", ScalarCollection())
 
 
 # ============================================================================
@@ -229,7 +168,8 @@ def add_scalar_entry(level: ScalarLevel, serial: str, text: str,
     Returns:
         Tuple of (success: bool, message: str)
     """
-    collection = get_scalar_collection()
+    session = _session()
+    collection = session.get_scalar_collection()
     
     # Auto-number if serial is empty
     if auto_number and not serial.strip():
@@ -242,16 +182,17 @@ def add_scalar_entry(level: ScalarLevel, serial: str, text: str,
     if not text.strip():
         return (False, "Text content is required")
     
+    serial = serial.strip()
+    
     # Check for duplicate serial within same level
-    existing = collection.get_by_level(level)
-    if any(e.serial == serial for e in existing):
+    if collection.has_serial(level, serial):
         return (False, f"Serial '{serial}' already exists for {level.value}")
     
     entry = ScalarEntry(
         level=level,
-        serial=serial.strip(),
+        serial=serial,
         text=text.strip(),
-        order_index=len(existing) + 1,
+        order_index=collection.count_by_level(level) + 1,
     )
     
     # Validate Bloom's verb for CLOs
@@ -259,10 +200,10 @@ def add_scalar_entry(level: ScalarLevel, serial: str, text: str,
         has_verb, verb, corrected = check_blooms_verb(text)
         entry.text = corrected
         if not has_verb:
-            add_warning(f"Warning: CLO {serial} does not start with a Bloom's performance verb.")
+            session.add_warning(f"Warning: CLO {serial} does not start with a Bloom's performance verb.")
     
     collection.add_entry(entry)
-    mark_dirty()
+    session.mark_dirty()
     
     return (True, f"Added {level.value}: {serial}")
 
@@ -282,23 +223,30 @@ def update_scalar_entry(level: ScalarLevel, old_serial: str,
     Returns:
         Tuple of (success: bool, message: str)
     """
-    collection = get_scalar_collection()
+    session = _session()
+    collection = session.get_scalar_collection()
     
     # Find the entry
-    entries = collection.get_by_level(level)
-    entry = next((e for e in entries if e.serial == old_serial), None)
+    entry = collection.get_entry(level, old_serial)
     
     if entry is None:
         return (False, f"Entry not found: {level.value} {old_serial}")
     
+    return _update_entry(session, collection, entry, new_serial, new_text)
+
+
+def _update_entry(session: Any, collection: ScalarCollection, entry: ScalarEntry,
+                  new_serial: Optional[str], new_text: Optional[str]) -> Tuple[bool, str]:
+    """Apply a serial and/or text change to one entry object."""
+    level = entry.level
+    
     # Check for duplicate serial if changing
-    if new_serial and new_serial != old_serial:
-        if any(e.serial == new_serial for e in entries if e.serial != old_serial):
+    new_serial = new_serial.strip() if new_serial else ""
+    if new_serial and new_serial != entry.serial:
+        if collection.has_serial(level, new_serial):
             return (False, f"Serial '{new_serial}' already exists for {level.value}")
-    
-    # Update fields
-    if new_serial:
-        entry.serial = new_serial.strip()
+        # Serial changes go through the collection to keep its index current
+        collection.set_entry_serial(entry, new_serial)
     if new_text:
         text = new_text.strip()
         # Validate Bloom's verb for CLOs
@@ -306,11 +254,12 @@ def update_scalar_entry(level: ScalarLevel, old_serial: str,
             has_verb, verb, corrected = check_blooms_verb(text)
             entry.text = corrected
             if not has_verb:
-                add_warning(f"Warning: CLO {entry.serial} does not start with a Bloom's performance verb.")
+                session.add_warning(f"Warning: CLO {entry.serial} does not start with a Bloom's performance verb.")
         else:
             entry.text = text
+        collection.mark_modified()
     
-    mark_dirty()
+    session.mark_dirty()
     return (True, f"Updated {level.value}: {entry.serial}")
 
 
@@ -327,7 +276,8 @@ def delete_scalar_entry(level: ScalarLevel, serial: str,
     Returns:
         Tuple of (success: bool, message: str)
     """
-    collection = get_scalar_collection()
+    session = _session()
+    collection = session.get_scalar_collection()
     
     if not collection.remove_entry(level, serial):
         return (False, f"Entry not found: {level.value} {serial}")
@@ -335,10 +285,62 @@ def delete_scalar_entry(level: ScalarLevel, serial: str,
     if auto_renumber:
         collection.renumber_level(level)
     
-    mark_dirty()
+    session.mark_dirty()
     return (True, f"Deleted {level.value}: {serial}")
 
 
+def apply_bulk_edits(level: ScalarLevel,
+                     deleted_rows: Iterable[int],
+                     edited_rows: Dict[int, Tuple[Optional[str], Optional[str]]],
+                     added_rows: Iterable[Tuple[str, str]]) -> List[str]:
+    """
+    Apply a table-style batch of row changes to one level.
+    
+    Row indices refer to the level's display order when the batch was made.
+    They are resolved to entry objects before anything changes, so duplicate
+    serials (possible after import) cannot redirect an edit or deletion to
+    another entry. Deletions renumber the level once, as delete_scalar_entry
+    does; edits are applied after that, then rows with text are added.
+    
+    Args:
+        level: The scalar level
+        deleted_rows: Display positions of rows to delete
+        edited_rows: Display position -> (new serial, new text); None keeps a field
+        added_rows: (serial, text) pairs; rows without text are skipped
+        
+    Returns:
+        Messages for the changes that were rejected
+    """
+    session = _session()
+    collection = session.get_scalar_collection()
+    entries = get_entries_for_display(level)
+    errors: List[str] = []
+    
+    deleted = set(deleted_rows)
+    removed = False
+    for idx in deleted:
+        if 0 <= idx < len(entries) and collection.discard_entry(entries[idx]):
+            removed = True
+    if removed:
+        collection.renumber_level(level)
+        session.mark_dirty()
+    
+    for idx, (new_serial, new_text) in edited_rows.items():
+        if idx in deleted or not 0 <= idx < len(entries):
+            continue
+        success, msg = _update_entry(session, collection, entries[idx], new_serial, new_text)
+        if not success:
+            errors.append(msg)
+    
+    for serial, text in added_rows:
+        if text.strip():
+            success, msg = add_scalar_entry(level, serial, text)
+            if not success:
+                errors.append(msg)
+    
+    return errors
+
+
 def reorder_scalar_entries(level: ScalarLevel, serials_in_order: List[str],
                            auto_renumber: bool = True) -> Tuple[bool, str]:
     """
@@ -352,12 +354,12 @@ def reorder_scalar_entries(level: ScalarLevel, serials_in_order: List[str],
     Returns:
         Tuple of (success: bool, message: str)
     """
-    collection = get_scalar_collection()
+    session = _session()
+    collection = session.get_scalar_collection()
     
-    # Validate that all serials exist
-    existing = {e.serial for e in collection.get_by_level(level)}
+    # Validate against the level's serial index (no per-call set rebuild)
     for serial in serials_in_order:
-        if serial not in existing:
+        if not collection.has_serial(level, serial):
             return (False, f"Serial '{serial}' not found in {level.value}")
     
     collection.reorder_level(level, serials_in_order)
@@ -365,36 +367,53 @@ def reorder_scalar_entries(level: ScalarLevel, serials_in_order: List[str],
     if auto_renumber:
         collection.renumber_level(level)
     
-    mark_dirty()
+    session.mark_dirty()
     return (True, f"Reordered {level.value} entries")
 
 
+def _level_positions(level: ScalarLevel) -> Dict[str, int]:
+    """
+    Map each serial in a level to its display position.
+    
+    Cached against the collection version like the display entries; the
+    dict's insertion order is the display order, so list(positions) gives
+    the ordered serials.
+    """
+    entries = get_entries_for_display(level)
+    cached = _POSITION_CACHE.get(level)
+    if cached is not None and cached[0] is entries:
+        return cached[1]
+    positions: Dict[str, int] = {}
+    for e in entries:
+        # Duplicate serials (possible after import) keep their first position
+        if e.serial not in positions:
+            positions[e.serial] = len(positions)
+    _POSITION_CACHE[level] = (entries, positions)
+    return positions
+
+
 def move_entry_up(level: ScalarLevel, serial: str) -> Tuple[bool, str]:
     """Move an entry up one position in its level."""
-    collection = get_scalar_collection()
-    entries = collection.get_by_level(level)
-    serials = [e.serial for e in entries]
-    
-    idx = serials.index(serial) if serial in serials else -1
+    positions = _level_positions(level)
+    idx = positions.get(serial, -1)
     if idx <= 0:
         return (False, "Cannot move up: already at top or not found")
     
     # Swap with previous
+    serials = list(positions)
     serials[idx], serials[idx - 1] = serials[idx - 1], serials[idx]
     return reorder_scalar_entries(level, serials)
 
 
 def move_entry_down(level: ScalarLevel, serial: str) -> Tuple[bool, str]:
     """Move an entry down one position in its level."""
-    collection = get_scalar_collection()
-    entries = collection.get_by_level(level)
-    serials = [e.serial for e in entries]
-    
-    idx = serials.index(serial) if serial in serials else -1
-    if idx < 0 or idx >= len(serials) - 1:
+    positions = _level_positions(level)
+    idx = positions.get(serial, -1)
+    if idx < 0 or idx >= len(positions) - 1:
         return (False, "Cannot move down: already at bottom or not found")
     
     # Swap with next
+    serials = list(positions)
     serials[idx], serials[idx + 1] = serials[idx + 1], serials[idx]
     return reorder_scalar_entries(level, serials)
 
@@ -403,9 +422,36 @@ def move_entry_down(level: ScalarLevel, serial: str) -> Tuple[bool, str]:
 # Validation
 # ============================================================================
 
+def apply_blooms_corrections(collection: ScalarCollection) -> List[str]:
+    """
+    Capitalize leading Bloom's verbs on every CLO, without touching session state.
+    
+    Args:
+        collection: Collection whose CLOs are checked and corrected in place
+        
+    Returns:
+        List of warning messages for CLOs without Bloom's verbs
+    """
+    warnings = []
+    modified = False
+    for clo in collection.get_by_level(ScalarLevel.CLO):
+        verb, corrected = correct_blooms_verb(clo.text)
+        if verb is None:
+            warnings.append(f"Warning: CLO {clo.serial} does not start with a Bloom's performance verb.")
+            continue
+        # Auto-capitalize the verb in place
+        if clo.text != corrected:
+            clo.text = corrected
+            modified = True
+    
+    if modified:
+        collection.mark_modified()
+    return warnings
+
+
 def validate_all_clos(collection: Optional[ScalarCollection] = None) -> List[str]:
     """
-    Validate all CLOs for Bloom's verbs.
+    Validate all CLOs for Bloom's verbs and record warnings in the session.
     
     Args:
         collection: Optional collection to validate (uses session state if None)
@@ -413,21 +459,12 @@ def validate_all_clos(collection: Optional[ScalarCollection] = None) -> List[str
     Returns:
         List of warning messages for CLOs without Bloom's verbs
     """
+    session = _session()
     if collection is None:
-        collection = get_scalar_collection()
+        collection = session.get_scalar_collection()
     
-    warnings = []
-    clos = collection.get_by_level(ScalarLevel.CLO)
-    
-    for clo in clos:
-        has_verb, verb, corrected = check_blooms_verb(clo.text)
-        if not has_verb:
-            warning = f"Warning: CLO {clo.serial} does not start with a Bloom's performance verb."
-            warnings.append(warning)
-            add_warning(warning)
-        else:
-            # Auto-capitalize the verb
-            clo.text = corrected
+    warnings = apply_blooms_corrections(collection)
+    session.add_warnings(warnings)
     
     return warnings
 
@@ -451,8 +488,9 @@ def save_scalar_to_course(course_scalar: List[Dict[str, Any]]) -> List[Dict[str,
     Returns:
         New list of dicts to assign to Course.scalar
     """
-    collection = get_scalar_collection()
-    mark_clean()
+    session = _session()
+    collection = session.get_scalar_collection()
+    session.mark_clean()
     return collection.to_list()
 
 
@@ -463,25 +501,20 @@ def load_scalar_from_course(course_scalar: List[Dict[str, Any]]) -> None:
     Args:
         course_scalar: List of dicts from Course.scalar
     """
+    session = _session()
     collection = ScalarCollection.from_list(course_scalar)
-    set_scalar_collection(collection)
-    mark_clean()
+    session.set_scalar_collection(collection)
+    session.mark_clean()
     validate_all_clos(collection)
 
 
-def clear_scalar() -> None:
-    """Clear all scalar data in session state."""
-    st.session_state[SCALAR_STATE_KEY] = ScalarCollection()
-    st.session_state[SCALAR_WARNINGS_KEY] = []
-    st.session_state[SCALAR_DIRTY_KEY] = True
-
-
 def clear_level(level: ScalarLevel) -> Tuple[bool, str]:
     """Clear all entries of a specific level."""
-    collection = get_scalar_collection()
+    session = _session()
+    collection = session.get_scalar_collection()
     count = collection.count_by_level(level)
     collection.clear_level(level)
-    mark_dirty()
+    session.mark_dirty()
     return (True, f"Cleared {count} {level.value} entries")
 
 
@@ -489,35 +522,68 @@ def clear_level(level: ScalarLevel) -> Tuple[bool, str]:
 # Utility Functions
 # ============================================================================
 
-def get_entries_for_display(level: ScalarLevel) -> List[Dict[str, Any]]:
+def get_entries_for_display(
+    level: ScalarLevel, as_dicts: bool = False
+) -> Union[List[ScalarEntry], List[Dict[str, Any]]]:
     """
-    Get entries formatted for UI display.
+    Get a level's entries in display order.
     
-    Returns:
-        List of dicts with 'serial', 'text', 'order_index' keys
+    The sorted entries are cached per level against the collection's version,
+    so reruns without edits reuse the previous list. Treat the result as
+    read-only; edits go through the CRUD functions above.
+    
+    Args:
+        level: The scalar level
+        as_dicts: If True, return dicts with 'serial', 'text', 'order_index'
+            keys instead of the ScalarEntry objects
     """
-    collection = get_scalar_collection()
-    entries = collection.get_by_level(level)
-    return [
-        {
-            "serial": e.serial,
-            "text": e.text,
-            "order_index": e.order_index,
-        }
-        for e in entries
-    ]
+    session = _session()
+    collection = session.get_scalar_collection()
+    version = collection.version
+    cached = _DISPLAY_CACHE.get(level)
+    # The cache holds the collection itself, so identity cannot be confused
+    # with a newer collection that reuses a freed object's id
+    if cached is not None and cached[0] is collection and cached[1] == version:
+        entries = cached[2]
+    else:
+        entries = collection.get_by_level(level)
+        _DISPLAY_CACHE[level] = (collection, version, entries)
+    
+    if as_dicts:
+        return [
+            {
+                "serial": e.serial,
+                "text": e.text,
+                "order_index": e.order_index,
+            }
+            for e in entries
+        ]
+    return entries
 
 
 def get_level_count(level: ScalarLevel) -> int:
     """Get count of entries for a level."""
-    return get_scalar_collection().count_by_level(level)
+    session = _session()
+    return session.get_scalar_collection().count_by_level(level)
 
 
 def get_all_counts() -> Dict[str, int]:
-    """Get counts for all levels as a dict with string keys."""
-    collection = get_scalar_collection()
-    counts = collection.get_counts()
-    return {level.value: count for level, count in counts.items()}
+    """
+    Get counts for all levels as a dict with string keys.
+    
+    Cached against the collection version like the display entries; treat
+    the result as read-only.
+    """
+    global _COUNTS_CACHE
+    session = _session()
+    collection = session.get_scalar_collection()
+    version = collection.version
+    cached = _COUNTS_CACHE
+    if cached is not None and cached[0] is collection and cached[1] == version:
+        return cached[2]
+    counts = {level.value: count for level, count in collection.get_counts().items()}
+    _COUNTS_CACHE = (collection, version, counts)
+    return counts
 
 
 def get_next_serial(level: ScalarLevel) -> str:
@@ -0,0 +1,194 @@
+"""
+Scalar Session State
+
+Streamlit session-state helpers for the scalar manager: the working
+collection, warnings, dirty flag, and the upload cache. Kept apart from
+scalar_service so the import and validation logic can run without Streamlit.
+"""
+
+import hashlib
+from typing import Iterable, List, Tuple
+
+import streamlit as st
+
+from pcgs_app.core.scalar_models import ScalarCollection
+from pcgs_app.services import scalar_service
+
+
+# Session state keys for scalar management
+SCALAR_STATE_KEY = "pcgs_scalar_collection"
+SCALAR_WARNINGS_KEY = "pcgs_scalar_warnings"
+SCALAR_DIRTY_KEY = "pcgs_scalar_dirty"  # True if unsaved changes exist
+SCALAR_PENDING_VALIDATION_KEY = "pcgs_scalar_pending_validation"  # Set after an upload
+MAX_WARNINGS = 10
+
+# Parsed uploads keyed by content digest: {digest: (message, to_list())}
+SCALAR_IMPORT_CACHE_KEY = "pcgs_scalar_import_cache"
+IMPORT_CACHE_SIZE = 4
+
+
+# ============================================================================
+# Session State Management
+# ============================================================================
+
+def init_scalar_state() -> None:
+    """
+    Initialize scalar-related session state.
+    Call this at the start of the scalar tab render.
+    """
+    # Bind the state proxy once; each attribute hop runs Streamlit's proxy logic
+    ss = st.session_state
+    if SCALAR_STATE_KEY not in ss:
+        ss[SCALAR_STATE_KEY] = ScalarCollection()
+    ss.setdefault(SCALAR_WARNINGS_KEY, [])
+    ss.setdefault(SCALAR_DIRTY_KEY, False)
+
+
+def get_scalar_collection() -> ScalarCollection:
+    """
+    Get the current scalar collection from session state.
+    
+    Returns:
+        ScalarCollection instance
+    """
+    ss = st.session_state
+    collection = ss.get(SCALAR_STATE_KEY)
+    if collection is None:
+        init_scalar_state()
+        collection = ss[SCALAR_STATE_KEY]
+    return collection
+
+
+def set_scalar_collection(collection: ScalarCollection) -> None:
+    """
+    Set the scalar collection in session state.
+    
+    Args:
+        collection: ScalarCollection to store
+    """
+    ss = st.session_state
+    ss[SCALAR_STATE_KEY] = collection
+    ss[SCALAR_DIRTY_KEY] = True
+
+
+def get_warnings() -> List[str]:
+    """Get current warnings list."""
+    return st.session_state.setdefault(SCALAR_WARNINGS_KEY, [])
+
+
+def add_warning(message: str) -> None:
+    """Add a warning message."""
+    warnings = st.session_state.setdefault(SCALAR_WARNINGS_KEY, [])
+    # The list never exceeds MAX_WARNINGS, so the membership scan is bounded
+    if message in warnings:
+        return
+    warnings.append(message)
+    # Keep only the most recent warnings, trimming in place
+    if len(warnings) > MAX_WARNINGS:
+        del warnings[:-MAX_WARNINGS]
+
+
+def add_warnings(messages: Iterable[str]) -> None:
+    """Add several warning messages with a single dedupe and trim."""
+    warnings = st.session_state.setdefault(SCALAR_WARNINGS_KEY, [])
+    seen = set(warnings)
+    new_warnings = [m for m in dict.fromkeys(messages) if m not in seen]
+    if not new_warnings:
+        return
+    warnings.extend(new_warnings)
+    if len(warnings) > MAX_WARNINGS:
+        del warnings[:-MAX_WARNINGS]
+
+
+def clear_warnings() -> None:
+    """Clear all warnings."""
+    st.session_state[SCALAR_WARNINGS_KEY] = []
+
+
+def is_dirty() -> bool:
+    """Check if there are unsaved changes."""
+    return st.session_state.get(SCALAR_DIRTY_KEY, False)
+
+
+def mark_clean() -> None:
+    """Mark scalar as saved (no unsaved changes)."""
+    st.session_state[SCALAR_DIRTY_KEY] = False
+
+
+def mark_dirty() -> None:
+    """Mark scalar as having unsaved changes."""
+    st.session_state[SCALAR_DIRTY_KEY] = True
+
+
+def clear_scalar() -> None:
+    """Clear all scalar data in session state."""
+    ss = st.session_state
+    ss[SCALAR_STATE_KEY] = ScalarCollection()
+    ss[SCALAR_WARNINGS_KEY] = []
+    ss[SCALAR_DIRTY_KEY] = True
+
+
+# ============================================================================
+# Excel Upload
+# ============================================================================
+
+def import_scalar_from_file(uploaded_file) -> Tuple[bool, str]:
+    """
+    Import scalar from Streamlit uploaded file object.
+    Updates session state directly.
+    
+    Args:
+        uploaded_file: Streamlit UploadedFile object
+        
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    if uploaded_file is None:
+        return (False, "No file uploaded")
+    
+    try:
+        content = uploaded_file.read()
+        
+        # Re-uploads of the same workbook (preview -> confirm) skip the parse
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        cache = st.session_state.setdefault(SCALAR_IMPORT_CACHE_KEY, {})
+        cached = cache.get(digest)
+        if cached is not None:
+            message, data = cached
+            collection = ScalarCollection.from_list(data)
+            success = True
+        else:
+            success, message, collection = scalar_service.import_scalar_from_excel(
+                content, validate=False
+            )
+            if success:
+                cache[digest] = (message, collection.to_list())
+                while len(cache) > IMPORT_CACHE_SIZE:
+                    cache.pop(next(iter(cache)))
+        
+        if success:
+            set_scalar_collection(collection)
+            mark_dirty()
+            # Bloom's checks run after the grid renders (run_pending_validation)
+            st.session_state[SCALAR_PENDING_VALIDATION_KEY] = True
+        
+        return (success, message)
+        
+    except Exception as e:
+        return (False, f"Error processing file: {str(e)}")
+
+
+def run_pending_validation() -> bool:
+    """
+    Run the Bloom's validation deferred by the last upload, if any.
+    
+    Returns:
+        True if validation corrected CLO text or added warnings, i.e. the
+        rendered grid and warnings panel are out of date
+    """
+    if not st.session_state.pop(SCALAR_PENDING_VALIDATION_KEY, False):
+        return False
+    collection = get_scalar_collection()
+    version = collection.version
+    warnings = scalar_service.validate_all_clos(collection)
+    return bool(warnings) or collection.version != version
@@ -4,10 +4,11 @@ Create Course / CLO Tab
 Implements the Prometheus v2 console layout for Tab 1 – Create Course.
 """
 
-import copy
-import html
-from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from collections import deque
+from functools import lru_cache
+from itertools import product
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Mapping, Optional, Tuple
 
 import streamlit as st
 
@@ -17,6 +18,9 @@ from pcgs_app.ui.theme.shared_chrome import (
     render_ai_console,
     navigate_to_tab,
     inject_shared_chrome_styles,
+    html_buffer,
+    header_status_html,
+    HtmlBuffer,
     CURRENT_USER,
     START_DATE,
     PROGRAM_STATUS,
@@ -30,62 +34,66 @@ from pcgs_app.ui.widgets.status_lights import render_status_dot
 
 NEW_COURSE_LABEL = "-- NEW COURSE --"
 
-COURSE_LEVEL_OPTIONS = ["", "Foundation", "Intermediate", "Advanced", "Executive"]
-COURSE_THEMATIC_OPTIONS = [
+COURSE_LEVEL_OPTIONS = ("", "Foundation", "Intermediate", "Advanced", "Executive")
+COURSE_THEMATIC_OPTIONS = (
     "",
     "Cyber Operations",
     "Leadership",
     "Prometheus Systems",
     "Strategic Planning",
     "Readiness",
-]
+)
+_COURSE_LEVEL_SET = frozenset(COURSE_LEVEL_OPTIONS)
+_COURSE_THEMATIC_SET = frozenset(COURSE_THEMATIC_OPTIONS)
 
-EXPORT_BUTTONS = [
+EXPORT_BUTTONS = (
     ("PRESENTATION", "presentation"),
     ("HANDBOOK", "handbook"),
     ("ASSESSMENTS", "assessments"),
     ("SUPPORTING MATERIALS", "supporting_materials"),
-]
+)
 
-MANAGER_TILES = [
+MANAGER_TILES = (
     ("SCALAR MANAGER", "scalar", Lex.SCALEMGR),
     ("CONTENT MANAGER", "content", Lex.CONTMGR),
     ("LESSON MANAGER", "lesson", Lex.LSNMGR),
-]
+)
 
-COURSE_FLOW_SEQUENCE = [Lex.C_INFO, Lex.C_DESC, Lex.CLO, Lex.SCALEMGR, Lex.CONTMGR, Lex.LSNMGR]
+COURSE_FLOW_SEQUENCE = (Lex.C_INFO, Lex.C_DESC, Lex.CLO, Lex.SCALEMGR, Lex.CONTMGR, Lex.LSNMGR)
 
 MIN_CLOS = 3
+CLO_COLUMN = "CLO"
 
-DEFAULT_COURSE_INFO: Dict[Lex, str] = {
+# Read-only templates; callers take a shallow dict()/list() copy
+DEFAULT_COURSE_INFO: Mapping[Lex, str] = MappingProxyType({
     Lex.C_NAME: "",
     Lex.C_LEVEL: "",
     Lex.C_THEME: "",
     Lex.C_DURATION: "",
     Lex.C_CODE: "",
     Lex.C_DEV: CURRENT_USER,
-}
+})
 
-DEFAULT_CLOS: List[str] = ["", "", ""]
+DEFAULT_CLOS: Tuple[str, ...] = ("", "", "")
 
 PLACEHOLDER_DESCRIPTION = (
     "This is placeholder text. PKE functionality coming soon. "
     "Your generated course description will appear here."
 )
 
-CLO_PLACEHOLDERS = [
+CLO_PLACEHOLDERS = (
     "CLO 1 – Placeholder objective drafted by PKE preview.",
     "CLO 2 – Placeholder objective drafted by PKE preview.",
     "CLO 3 – Placeholder objective drafted by PKE preview.",
     "CLO 4 – Placeholder objective drafted by PKE preview.",
-]
+)
 
-CLO_ALT_PLACEHOLDERS = [
+CLO_ALT_PLACEHOLDERS = (
     "CLO 1 – Alternate placeholder objective supplied by PKE.",
     "CLO 2 – Alternate placeholder objective supplied by PKE.",
     "CLO 3 – Alternate placeholder objective supplied by PKE.",
     "CLO 4 – Alternate placeholder objective supplied by PKE.",
-]
+)
 
 AI_PROMPTS: Dict[str, str] = {
     "description": "Would you like me to draft a course description based on the current Course Information?",
@@ -110,15 +118,54 @@ STEP_FLAG_KEYS: Dict[Lex, str] = {
     Lex.LSNMGR: "pcgs_step_lesson_complete",
 }
 
-CONNECTOR_EDGES = [
+REQUIRED_INFO_FIELDS = (Lex.C_NAME, Lex.C_LEVEL, Lex.C_THEME, Lex.C_DURATION, Lex.C_DEV)
+
+# One bit per stage in flow order, so the lowest clear bit is the next stage
+_STAGE_BIT: Dict[Lex, int] = {stage: 1 << idx for idx, stage in enumerate(COURSE_FLOW_SEQUENCE)}
+_FULL_FLOW_MASK = (1 << len(COURSE_FLOW_SEQUENCE)) - 1
+
+CONNECTOR_EDGES = (
     (Lex.C_INFO, Lex.C_DESC),
     (Lex.C_DESC, Lex.CLO),
     (Lex.CLO, Lex.SCALEMGR),
     (Lex.SCALEMGR, Lex.CONTMGR),
     (Lex.CONTMGR, Lex.LSNMGR),
-]
+)
+
+_CONNECTOR_ROW_TEMPLATE = (
+    "<div class='pcgs-connector-row'>" + "{}" * len(CONNECTOR_EDGES) + "</div>"
+)
+_CONNECTOR_HTML = {
+    state: f"<div class='pcgs-connector pcgs-connector--{state}'></div>"
+    for state in ("idle", "active", "complete")
+}
+
+PANEL_BASES = (
+    "pcgs-panel--course-info",
+    "pcgs-panel--description",
+    "pcgs-panel--clos",
+    "pcgs-panel--export",
+)
+
+
+def _join_panel_classes(base: str, disabled: bool, progress: str, ai_target: bool) -> str:
+    classes = ["pcgs-panel", base]
+    if disabled:
+        classes.append("pcgs-panel--disabled")
+    if progress:
+        classes.append(f"pcgs-panel--{progress}")
+    if ai_target:
+        classes.append("pcgs-panel--ai-target")
+    return " ".join(classes)
+
 
-PROGRESS_STEPS = [Lex.C_DESC, Lex.CLO, Lex.SCALEMGR, Lex.CONTMGR, Lex.LSNMGR]
+# Every (base, disabled, progress, ai_target) class string, joined once
+_PANEL_CLASS_TABLE: Mapping[Tuple[str, bool, str, bool], str] = MappingProxyType({
+    key: _join_panel_classes(*key)
+    for key in product(PANEL_BASES, (False, True), ("", "complete", "unsaved"), (False, True))
+})
+
+PROGRESS_STEPS = (Lex.C_DESC, Lex.CLO, Lex.SCALEMGR, Lex.CONTMGR, Lex.LSNMGR)
 
 PKE_TARGET_TO_STAGE: Dict[str, Optional[Lex]] = {
     "description": Lex.C_DESC,
@@ -128,7 +175,7 @@ PKE_TARGET_TO_STAGE: Dict[str, Optional[Lex]] = {
     "lesson": Lex.LSNMGR,
 }
 
-COURSE_LIBRARY: Dict[str, Dict[str, Any]] = {
+COURSE_LIBRARY: Mapping[str, Dict[str, Any]] = MappingProxyType({
     "Cyber Defense Analyst Bootcamp": {
         "title": "Cyber Defense Analyst Bootcamp",
         "level": "Intermediate",
@@ -157,9 +204,11 @@ COURSE_LIBRARY: Dict[str, Dict[str, Any]] = {
             "CLO 3 – Align strategic initiatives with PCGS governance checkpoints.",
         ],
     },
-}
+})
 
-COURSE_OPTIONS = [NEW_COURSE_LABEL, *COURSE_LIBRARY.keys()]
+# Option tuples keep a stable identity across reruns
+COURSE_OPTIONS = (NEW_COURSE_LABEL, *COURSE_LIBRARY.keys())
+_FIRST_TEMPLATE = next(iter(COURSE_LIBRARY.values()))
 
 COURSE_INFO_WIDGET_KEYS: Dict[Lex, str] = {
     Lex.C_NAME: "pcgs_course_title",
@@ -171,18 +220,30 @@ COURSE_INFO_WIDGET_KEYS: Dict[Lex, str] = {
 }
 
 DESCRIPTION_INPUT_KEY = "pcgs_course_description_text"
+CLO_EDITOR_KEY = "pcgs_clos_editor"
+
+FORM_WIDGET_KEYS = (*COURSE_INFO_WIDGET_KEYS.values(), DESCRIPTION_INPUT_KEY)
+
+STATE_INITIALIZED_KEY = "_pcgs_initialized"
+AI_APP_RERUN_KEY = "_pcgs_ai_app_rerun"
+PROGRESS_COMPLETED_KEY = "_pcgs_progress_completed"
+SNAPSHOT_HASH_KEY = "_pcgs_snapshot_hash"
+COMPLETION_SIG_KEY = "_pcgs_completion_sig"
+
+# Same substitutions as html.escape(quote=True), applied in one C-level pass
+_HTML_ESCAPE_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+)
 
 
 def render_tab_create_course(course: Optional[Dict[str, Any]] = None) -> None:
     """
     Render the sci-fi styled Create Course hub with Prometheus v2 layout.
     """
-
     apply_base_theme(get_default_tokens())
     inject_shared_chrome_styles()
     _init_state(course)
     _tick_ai_flash()
-    _update_completion_flags()
 
     st.markdown("<div class='pcgs-root'>", unsafe_allow_html=True)
     _render_region("pcgs-region-status", _render_header)
@@ -213,38 +274,51 @@ def _render_region(region_class: str, renderer: Callable[[], None]) -> None:
 def _init_state(initial_course: Optional[Dict[str, Any]]) -> None:
     state = st.session_state
 
-    if "pcgs_course_info" not in state:
-        state["pcgs_course_info"] = copy.deepcopy(DEFAULT_COURSE_INFO)
-    if "pcgs_course_description" not in state:
-        state["pcgs_course_description"] = ""
-    if "pcgs_clos" not in state:
-        state["pcgs_clos"] = copy.deepcopy(DEFAULT_CLOS)
-    if "pcgs_saved_snapshot" not in state:
-        state["pcgs_saved_snapshot"] = _build_snapshot()
-    if "pcgs_ai_history" not in state:
-        state["pcgs_ai_history"] = [
+    # Plain state only needs seeding once per session
+    if not state.get(STATE_INITIALIZED_KEY):
+        if "pcgs_course_info" not in state:
+            state["pcgs_course_info"] = dict(DEFAULT_COURSE_INFO)
+        if "pcgs_course_description" not in state:
+            state["pcgs_course_description"] = ""
+        if "pcgs_clos" not in state:
+            state["pcgs_clos"] = list(DEFAULT_CLOS)
+        if "pcgs_saved_snapshot" not in state:
+            state["pcgs_saved_snapshot"] = _build_snapshot()
+        # A capped deque trims old lines on append without copying
+        history = state.get("pcgs_ai_history") or [
             ("PKE", "PROMETHEUS Knowledge Engine calibrated. Awaiting trigger.")
         ]
-    state.setdefault("pcgs_ai_mode", "idle")
-    state.setdefault("pcgs_ai_followup", None)
-    state.setdefault("pcgs_ai_target_panel", None)
-    state.setdefault("pcgs_ai_flash_panel", None)
-    state.setdefault("pcgs_ai_flash_ticks", 0)
-    state.setdefault("pcgs_ai_input", "")
-    state.setdefault("pcgs_ai_input_triggered", False)
-    state.setdefault("pcgs_has_saved_once", False)
-    state.setdefault("pcgs_selected_course_option", NEW_COURSE_LABEL)
-    state.setdefault("pcgs_active_course_option", NEW_COURSE_LABEL)
+        if not isinstance(history, deque):
+            state["pcgs_ai_history"] = deque(history, maxlen=HISTORY_LIMIT)
+        state.setdefault("pcgs_ai_mode", "idle")
+        state.setdefault("pcgs_ai_followup", None)
+        state.setdefault("pcgs_ai_target_panel", None)
+        state.setdefault("pcgs_ai_flash_panel", None)
+        state.setdefault("pcgs_ai_flash_ticks", 0)
+        state.setdefault("pcgs_has_saved_once", False)
+        state.setdefault("pcgs_active_course_option", NEW_COURSE_LABEL)
+
+        for key in STEP_FLAG_KEYS.values():
+            state.setdefault(key, False)
+        state[PROGRESS_COMPLETED_KEY] = sum(
+            1 for stage in PROGRESS_STEPS if state[STEP_FLAG_KEYS[stage]]
+        )
 
-    for key in STEP_FLAG_KEYS.values():
-        state.setdefault(key, False)
+        _ensure_min_clos()
+        # Later flag changes are written by the handlers that cause them
+        _update_completion_flags()
+        state[STATE_INITIALIZED_KEY] = True
 
-    _ensure_min_clos()
+    # Widget-backed keys are dropped by Streamlit while another tab is shown
+    state.setdefault("pcgs_ai_input", "")
+    state.setdefault("pcgs_selected_course_option", NEW_COURSE_LABEL)
 
     if initial_course:
         _apply_external_course(initial_course, mark_saved=True, show_message=False)
-
-    _sync_form_inputs()
+    elif any(key not in state for key in FORM_WIDGET_KEYS):
+        # Handlers resync after changing course state; otherwise the widgets
+        # already hold the current values and only need restoring
+        _sync_form_inputs()
 
 
 def _ensure_min_clos(min_count: int = MIN_CLOS) -> None:
@@ -254,22 +328,35 @@ def _ensure_min_clos(min_count: int = MIN_CLOS) -> None:
 
 
 def _sync_form_inputs() -> None:
-    info = st.session_state["pcgs_course_info"]
+    state = st.session_state
+    info = state["pcgs_course_info"]
     for field, key in COURSE_INFO_WIDGET_KEYS.items():
         value = info.get(field, "")
-        st.session_state[key] = value
+        state[key] = value
 
-    st.session_state[DESCRIPTION_INPUT_KEY] = st.session_state["pcgs_course_description"]
+    state[DESCRIPTION_INPUT_KEY] = state["pcgs_course_description"]
 
-    for idx, value in enumerate(st.session_state["pcgs_clos"]):
-        st.session_state[f"pcgs_clo_{idx}"] = value
+    # The CLO editor restarts from pcgs_clos once its pending delta is gone
+    state.pop(CLO_EDITOR_KEY, None)
 
 
 def _build_snapshot() -> Dict[str, Any]:
+    state = st.session_state
+    info = state.get("pcgs_course_info", {})
+    description = state.get("pcgs_course_description", "")
+    clos = state.get("pcgs_clos", [])
+    content_hash = hash((tuple(info.items()), description, tuple(clos)))
+    # Saving or reloading unchanged content reuses the existing snapshot
+    snapshot = state.get("pcgs_saved_snapshot")
+    if snapshot is not None and state.get(SNAPSHOT_HASH_KEY) == content_hash:
+        return snapshot
+
+    state[SNAPSHOT_HASH_KEY] = content_hash
     return {
-        "course_info": copy.deepcopy(st.session_state.get("pcgs_course_info", {})),
-        "description": st.session_state.get("pcgs_course_description", ""),
-        "clos": copy.deepcopy(st.session_state.get("pcgs_clos", [])),
+        # Course info values and CLOs are strings, so shallow copies suffice
+        "course_info": dict(info),
+        "description": description,
+        "clos": list(clos),
     }
 
 
@@ -279,7 +366,8 @@ def _apply_external_course(
     mark_saved: bool,
     show_message: bool,
 ) -> None:
-    info = copy.deepcopy(DEFAULT_COURSE_INFO)
+    state = st.session_state
+    info = dict(DEFAULT_COURSE_INFO)
     info[Lex.C_NAME] = payload.get("title") or payload.get("name") or info[Lex.C_NAME]
     info[Lex.C_LEVEL] = payload.get("level", info[Lex.C_LEVEL])
     info[Lex.C_THEME] = payload.get("thematic") or payload.get("theme") or info[Lex.C_THEME]
@@ -292,20 +380,18 @@ def _apply_external_course(
     info[Lex.C_CODE] = payload.get("code", info[Lex.C_CODE])
     info[Lex.C_DEV] = payload.get("developer", info[Lex.C_DEV])
 
-    st.session_state["pcgs_course_info"] = info
-    st.session_state["pcgs_course_description"] = payload.get("description", "")
+    state["pcgs_course_info"] = info
+    state["pcgs_course_description"] = payload.get("description", "")
     clos = payload.get("clos") or payload.get("learning_objectives") or []
-    st.session_state["pcgs_clos"] = list(clos) if isinstance(clos, list) else copy.deepcopy(DEFAULT_CLOS)
+    state["pcgs_clos"] = list(clos) if isinstance(clos, list) else list(DEFAULT_CLOS)
 
     _ensure_min_clos()
     _sync_form_inputs()
 
     if mark_saved:
-        st.session_state["pcgs_saved_snapshot"] = _build_snapshot()
-        st.session_state["pcgs_has_saved_once"] = True
-        _update_completion_flags()
-    else:
-        _update_completion_flags()
+        state["pcgs_saved_snapshot"] = _build_snapshot()
+        state["pcgs_has_saved_once"] = True
+    _update_completion_flags()
 
     if show_message:
         st.success("Course loaded.")
@@ -316,24 +402,26 @@ def _reset_course_editor(
     show_message: bool,
     reset_selection: bool,
 ) -> None:
-    st.session_state["pcgs_course_info"] = copy.deepcopy(DEFAULT_COURSE_INFO)
-    st.session_state["pcgs_course_description"] = ""
-    st.session_state["pcgs_clos"] = copy.deepcopy(DEFAULT_CLOS)
-    st.session_state["pcgs_saved_snapshot"] = _build_snapshot()
-    st.session_state["pcgs_has_saved_once"] = False
-    st.session_state["pcgs_ai_target_panel"] = None
-    st.session_state["pcgs_ai_flash_panel"] = None
-    st.session_state["pcgs_ai_flash_ticks"] = 0
-    st.session_state["pcgs_ai_followup"] = None
-    for key in STEP_FLAG_KEYS.values():
-        st.session_state[key] = False
+    state = st.session_state
+    state["pcgs_course_info"] = dict(DEFAULT_COURSE_INFO)
+    state["pcgs_course_description"] = ""
+    state["pcgs_clos"] = list(DEFAULT_CLOS)
+    state["pcgs_saved_snapshot"] = _build_snapshot()
+    state["pcgs_has_saved_once"] = False
+    state["pcgs_ai_target_panel"] = None
+    state["pcgs_ai_flash_panel"] = None
+    state["pcgs_ai_flash_ticks"] = 0
+    state["pcgs_ai_followup"] = None
+    for stage in STEP_FLAG_KEYS:
+        _set_stage_complete(stage, False)
+    # Flags were cleared directly, so the next full recompute must run
+    state.pop(COMPLETION_SIG_KEY, None)
     _ensure_min_clos()
     _sync_form_inputs()
-    _update_completion_flags()
 
     if reset_selection:
-        st.session_state["pcgs_selected_course_option"] = NEW_COURSE_LABEL
-        st.session_state["pcgs_active_course_option"] = NEW_COURSE_LABEL
+        state["pcgs_selected_course_option"] = NEW_COURSE_LABEL
+        state["pcgs_active_course_option"] = NEW_COURSE_LABEL
 
     if show_message:
         st.info("Editor reset. Ready for a new course.")
@@ -345,40 +433,15 @@ def _reset_course_editor(
 
 
 def _render_header() -> None:
-    st.markdown("<div class='pcgs-status-band'>", unsafe_allow_html=True)
-    st.markdown("<div class='pcgs-status-band__left'>", unsafe_allow_html=True)
-    _render_header_status()
-    st.markdown("</div>", unsafe_allow_html=True)
-    st.markdown("<div class='pcgs-status-band__right'>", unsafe_allow_html=True)
-    _render_top_buttons()
-    st.markdown("</div>", unsafe_allow_html=True)
-    st.markdown("</div>", unsafe_allow_html=True)
+    with html_buffer() as out:
+        out.add("<div class='pcgs-status-band'><div class='pcgs-status-band__left'>")
+        out.add(header_status_html())
+        out.add("</div><div class='pcgs-status-band__right'>")
+        _render_top_buttons(out)
+        out.add("</div></div>")
 
 
-def _render_header_status() -> None:
-    info = st.session_state["pcgs_course_info"]
-    now_str = datetime.now().strftime("%d %b %Y %H:%M")
-    title = info.get(Lex.C_NAME, "") or "UNSPECIFIED"
-    duration = info.get(Lex.C_DURATION, "") or "N/A"
-    level = info.get(Lex.C_LEVEL, "") or "UNSPECIFIED"
-    thematic = info.get(Lex.C_THEME, "") or "UNSPECIFIED"
-
-    status_html = f"""
-    <div class="pcgs-header-status">
-        <div class="pcgs-header-status__title">PROMETHEUS COURSE GENERATION SYSTEM 2.0</div>
-        <div class="pcgs-header-status__timestamp">{now_str}</div>
-        <div class="pcgs-header-status__metrics">
-            <span>Course Loaded · {html.escape(title)}</span>
-            <span>Duration · {html.escape(duration)}</span>
-            <span>Level · {html.escape(level)}</span>
-            <span>Thematic · {html.escape(thematic)}</span>
-        </div>
-    </div>
-    """
-    st.markdown(status_html, unsafe_allow_html=True)
-
-
-def _render_top_buttons() -> None:
+def _render_top_buttons(out: HtmlBuffer) -> None:
     """Render horizontal action buttons in the header."""
     specs = [
         ("LOAD", "neutral", _handle_load_button),
@@ -386,35 +449,35 @@ def _render_top_buttons() -> None:
         ("DELETE", "danger", _handle_delete_button),
         ("RESET", "neutral", _handle_clear_button),
     ]
-    # Use horizontal layout for dashboard
-    st.markdown("<div class='pcgs-top-buttons--horizontal'>", unsafe_allow_html=True)
+    # Use horizontal layout for dashboard; wrapper markup between buttons
+    # is batched so each gap costs one markdown element
+    out.add("<div class='pcgs-top-buttons--horizontal'>")
     for label, tone, handler in specs:
-        st.markdown(
-            f"<div class='pcgs-pill-button pcgs-pill-button--{tone}'>",
-            unsafe_allow_html=True,
-        )
+        out.add(f"<div class='pcgs-pill-button pcgs-pill-button--{tone}'>")
+        out.flush()
         if st.button(label, key=f"pcgs_ctrl_{label.lower().replace('/', '_').replace(' ', '_')}"):
             handler()
-        st.markdown("</div>", unsafe_allow_html=True)
-    st.markdown("</div>", unsafe_allow_html=True)
+        out.add("</div>")
+    out.add("</div>")
 
 
 def _handle_load_button() -> None:
-    selected = st.session_state.get("pcgs_selected_course_option", NEW_COURSE_LABEL)
+    state = st.session_state
+    selected = state.get("pcgs_selected_course_option", NEW_COURSE_LABEL)
     if selected == NEW_COURSE_LABEL:
-        example = next(iter(COURSE_LIBRARY.values()))
-        _apply_external_course(example, mark_saved=False, show_message=False)
+        _apply_external_course(_FIRST_TEMPLATE, mark_saved=False, show_message=False)
         st.info("Starter template loaded. Press SAVE to lock it in.")
     else:
         payload = COURSE_LIBRARY.get(selected)
         if payload:
             _apply_external_course(payload, mark_saved=True, show_message=True)
-            st.session_state["pcgs_active_course_option"] = selected
+            state["pcgs_active_course_option"] = selected
 
 
 def _handle_save_button() -> None:
-    st.session_state["pcgs_saved_snapshot"] = _build_snapshot()
-    st.session_state["pcgs_has_saved_once"] = True
+    state = st.session_state
+    state["pcgs_saved_snapshot"] = _build_snapshot()
+    state["pcgs_has_saved_once"] = True
     _update_completion_flags()
     st.success("Course saved (placeholder).")
 
@@ -446,10 +509,11 @@ def _render_select_course() -> None:
 
 
 def _handle_course_selection(selected: str) -> None:
-    active = st.session_state.get("pcgs_active_course_option", NEW_COURSE_LABEL)
+    state = st.session_state
+    active = state.get("pcgs_active_course_option", NEW_COURSE_LABEL)
     if selected == active:
         return
-    st.session_state["pcgs_active_course_option"] = selected
+    state["pcgs_active_course_option"] = selected
     if selected == NEW_COURSE_LABEL:
         _reset_course_editor(show_message=False, reset_selection=False)
     else:
@@ -459,9 +523,9 @@ def _handle_course_selection(selected: str) -> None:
 
 
 def _render_course_info_panel() -> None:
+    state = st.session_state
     stage = Lex.C_INFO
-    classes = _panel_classes("pcgs-panel--course-info", stage=stage)
-    status = render_status_dot(_panel_status(stage))
+    classes, status = _stage_panel_chrome("pcgs-panel--course-info", stage)
 
     st.markdown(f"<div class='{classes}'>", unsafe_allow_html=True)
     st.markdown(
@@ -469,55 +533,68 @@ def _render_course_info_panel() -> None:
         unsafe_allow_html=True,
     )
 
-    info = st.session_state["pcgs_course_info"]
-    cols = st.columns(2)
-    with cols[0]:
-        title = st.text_input(
-            "Title",
-            key=COURSE_INFO_WIDGET_KEYS[Lex.C_NAME],
-            value=st.session_state[COURSE_INFO_WIDGET_KEYS[Lex.C_NAME]],
-        )
-        info[Lex.C_NAME] = title
-        duration = st.text_input(
-            "Duration",
-            key=COURSE_INFO_WIDGET_KEYS[Lex.C_DURATION],
-            value=st.session_state[COURSE_INFO_WIDGET_KEYS[Lex.C_DURATION]],
-        )
-        info[Lex.C_DURATION] = duration
-        code = st.text_input(
-            "Code",
-            key=COURSE_INFO_WIDGET_KEYS[Lex.C_CODE],
-            value=st.session_state[COURSE_INFO_WIDGET_KEYS[Lex.C_CODE]],
-        )
-        info[Lex.C_CODE] = code
-    with cols[1]:
-        level = st.selectbox(
-            "Level",
-            _ensure_option(COURSE_LEVEL_OPTIONS, st.session_state[COURSE_INFO_WIDGET_KEYS[Lex.C_LEVEL]]),
-            key=COURSE_INFO_WIDGET_KEYS[Lex.C_LEVEL],
-        )
-        info[Lex.C_LEVEL] = level
-        thematic = st.selectbox(
-            "Thematic",
-            _ensure_option(COURSE_THEMATIC_OPTIONS, st.session_state[COURSE_INFO_WIDGET_KEYS[Lex.C_THEME]]),
-            key=COURSE_INFO_WIDGET_KEYS[Lex.C_THEME],
-        )
-        info[Lex.C_THEME] = thematic
-        developer = st.text_input(
-            "Developer",
-            key=COURSE_INFO_WIDGET_KEYS[Lex.C_DEV],
-            value=st.session_state[COURSE_INFO_WIDGET_KEYS[Lex.C_DEV]],
-        )
-        info[Lex.C_DEV] = developer
+    # A form batches the edits into one rerun on APPLY instead of one per field
+    with st.form("pcgs_course_info_form", clear_on_submit=False, border=False):
+        cols = st.columns(2)
+        with cols[0]:
+            st.text_input("Title", key=COURSE_INFO_WIDGET_KEYS[Lex.C_NAME])
+            st.text_input("Duration", key=COURSE_INFO_WIDGET_KEYS[Lex.C_DURATION])
+            st.text_input("Code", key=COURSE_INFO_WIDGET_KEYS[Lex.C_CODE])
+        with cols[1]:
+            level_key = COURSE_INFO_WIDGET_KEYS[Lex.C_LEVEL]
+            st.selectbox(
+                "Level",
+                _ensure_option(
+                    COURSE_LEVEL_OPTIONS, _COURSE_LEVEL_SET, state[level_key]
+                ),
+                key=level_key,
+            )
+            theme_key = COURSE_INFO_WIDGET_KEYS[Lex.C_THEME]
+            st.selectbox(
+                "Thematic",
+                _ensure_option(
+                    COURSE_THEMATIC_OPTIONS, _COURSE_THEMATIC_SET, state[theme_key]
+                ),
+                key=theme_key,
+            )
+            st.text_input("Developer", key=COURSE_INFO_WIDGET_KEYS[Lex.C_DEV])
+        st.form_submit_button("APPLY", on_click=_store_course_info)
 
-    st.session_state["pcgs_course_info"] = info
     st.markdown("</div>", unsafe_allow_html=True)
 
 
+def _store_course_info() -> None:
+    state = st.session_state
+    info = state["pcgs_course_info"]
+    for field, key in COURSE_INFO_WIDGET_KEYS.items():
+        info[field] = state[key]
+    _refresh_stage_flag(Lex.C_INFO)
+
+
+def _store_description() -> None:
+    state = st.session_state
+    state["pcgs_course_description"] = state[DESCRIPTION_INPUT_KEY]
+    _refresh_stage_flag(Lex.C_DESC)
+
+
+def _store_clos() -> None:
+    # The editor's state holds only the delta against the list it was given
+    state = st.session_state
+    changes = state.pop(CLO_EDITOR_KEY, None) or {}
+    clos = state["pcgs_clos"]
+    for idx, row in changes.get("edited_rows", {}).items():
+        if CLO_COLUMN in row:
+            clos[int(idx)] = row[CLO_COLUMN] or ""
+    for idx in sorted(changes.get("deleted_rows", []), reverse=True):
+        del clos[idx]
+    clos.extend(row.get(CLO_COLUMN) or "" for row in changes.get("added_rows", []))
+    _ensure_min_clos()
+    _refresh_stage_flag(Lex.CLO)
+
+
 def _render_description_panel() -> None:
     stage = Lex.C_DESC
-    classes = _panel_classes("pcgs-panel--description", stage=stage)
-    status = render_status_dot(_panel_status(stage))
+    classes, status = _stage_panel_chrome("pcgs-panel--description", stage)
 
     st.markdown(f"<div class='{classes}'>", unsafe_allow_html=True)
     header_cols = st.columns([4, 1])
@@ -528,64 +605,56 @@ def _render_description_panel() -> None:
         )
     with header_cols[1]:
         _render_flame_button("description")
-    description = st.text_area(
+    st.text_area(
         "Course Description",
         key=DESCRIPTION_INPUT_KEY,
-        value=st.session_state[DESCRIPTION_INPUT_KEY],
         height=220,
+        on_change=_store_description,
     )
-    st.session_state["pcgs_course_description"] = description
     st.markdown("</div>", unsafe_allow_html=True)
 
 
 def _render_clos_panel() -> None:
     stage = Lex.CLO
-    classes = _panel_classes("pcgs-panel--clos", stage=stage)
-    status = render_status_dot(_panel_status(stage))
+    classes, status = _stage_panel_chrome("pcgs-panel--clos", stage)
 
     st.markdown(f"<div class='{classes}'>", unsafe_allow_html=True)
-    header_cols = st.columns([4, 1, 1])
+    header_cols = st.columns([4, 1])
     with header_cols[0]:
         st.markdown(
             f"<div class='pcgs-panel__title'>{status} LEARNING OBJECTIVES</div>",
             unsafe_allow_html=True,
         )
     with header_cols[1]:
-        st.markdown("<div class='pcgs-mini-button'>", unsafe_allow_html=True)
-        if st.button("+", key="pcgs_add_clo", help="Add Learning Objective"):
-            _add_clo_row()
-        st.markdown("</div>", unsafe_allow_html=True)
-    with header_cols[2]:
         _render_flame_button("clos")
 
     st.markdown("<div class='pcgs-clos-list'>", unsafe_allow_html=True)
-    for idx, value in enumerate(st.session_state["pcgs_clos"]):
-        text = st.text_area(
-            f"CLO {idx + 1}",
-            key=f"pcgs_clo_{idx}",
-            value=st.session_state.get(f"pcgs_clo_{idx}", value),
-            height=85,
+    with st.form("pcgs_clos_form", clear_on_submit=False, border=False):
+        # One grid widget for every CLO; rows are added/removed in place
+        st.data_editor(
+            {CLO_COLUMN: st.session_state["pcgs_clos"]},
+            key=CLO_EDITOR_KEY,
+            num_rows="dynamic",
+            hide_index=True,
+            column_config={CLO_COLUMN: st.column_config.TextColumn(CLO_COLUMN, width="large")},
         )
-        st.session_state["pcgs_clos"][idx] = text
-    st.markdown("</div>", unsafe_allow_html=True)
-    st.markdown("</div>", unsafe_allow_html=True)
+        st.form_submit_button("APPLY", on_click=_store_clos)
+    st.markdown("</div></div>", unsafe_allow_html=True)
 
 
 def _render_exports_panel() -> None:
     classes = _panel_classes("pcgs-panel--export")
-    st.markdown(f"<div class='{classes}'>", unsafe_allow_html=True)
-    st.markdown(
-        "<div class='pcgs-panel__header'><div class='pcgs-panel__title'>GENERATE</div></div>",
-        unsafe_allow_html=True,
-    )
-    st.markdown("<div class='pcgs-generate-buttons'>", unsafe_allow_html=True)
-    for label, key_suffix in EXPORT_BUTTONS:
-        st.markdown("<div class='pcgs-pill-button pcgs-pill-button--neutral'>", unsafe_allow_html=True)
-        if st.button(label, key=f"pcgs_export_{key_suffix}"):
-            st.info("Export not yet implemented.")
-        st.markdown("</div>", unsafe_allow_html=True)
-    st.markdown("</div>", unsafe_allow_html=True)
-    st.markdown("</div>", unsafe_allow_html=True)
+    with html_buffer() as out:
+        out.add(f"<div class='{classes}'>")
+        out.add("<div class='pcgs-panel__header'><div class='pcgs-panel__title'>GENERATE</div></div>")
+        out.add("<div class='pcgs-generate-buttons'>")
+        for label, key_suffix in EXPORT_BUTTONS:
+            out.add("<div class='pcgs-pill-button pcgs-pill-button--neutral'>")
+            out.flush()
+            if st.button(label, key=f"pcgs_export_{key_suffix}"):
+                st.info("Export not yet implemented.")
+            out.add("</div>")
+        out.add("</div></div>")
 
 
 # ---------------------------------------------------------------------------
@@ -594,47 +663,53 @@ def _render_exports_panel() -> None:
 
 
 def _render_connectors() -> None:
-    st.markdown("<div class='pcgs-connector-row'>", unsafe_allow_html=True)
-    for left, right in CONNECTOR_EDGES:
-        state = _connector_state(left, right)
-        classes = f"pcgs-connector pcgs-connector--{state}"
-        st.markdown(f"<div class='{classes}'></div>", unsafe_allow_html=True)
-    st.markdown("</div>", unsafe_allow_html=True)
+    st.markdown(_connector_row_html(_flow_mask()), unsafe_allow_html=True)
+
+
+@lru_cache(maxsize=None)
+def _connector_row_html(mask: int) -> str:
+    # The row depends only on the stage flags; each combination is built once
+    return _CONNECTOR_ROW_TEMPLATE.format(
+        *(_CONNECTOR_HTML[_connector_state(mask, left, right)] for left, right in CONNECTOR_EDGES)
+    )
 
 
 def _render_managers_row() -> None:
-    st.markdown("<div class='pcgs-managers-row'>", unsafe_allow_html=True)
-    st.markdown("<div class='pcgs-node-row'>", unsafe_allow_html=True)
-    for label, mode, stage in MANAGER_TILES:
-        classes = _tile_classes(stage)
-        status = render_status_dot(_panel_status(stage))
-        st.markdown(f"<div class='{classes}'>", unsafe_allow_html=True)
-        meta_cols = st.columns([3, 1])
-        with meta_cols[0]:
-            st.markdown(
-                f"<div class='pcgs-panel__title'>{status} {label}</div>",
-                unsafe_allow_html=True,
+    with html_buffer() as out:
+        out.add("<div class='pcgs-managers-row'><div class='pcgs-node-row'>")
+        for label, mode, stage in MANAGER_TILES:
+            # Re-read per tile: a flame click in an earlier tile updates flags
+            classes = _tile_classes(_flow_mask(), _ai_highlighted_stages(), stage)
+            status = render_status_dot(_panel_status(stage))
+            out.add(f"<div class='{classes}'>")
+            out.flush()
+            meta_cols = st.columns([3, 1])
+            with meta_cols[0]:
+                st.markdown(
+                    f"<div class='pcgs-panel__title'>{status} {label}</div>",
+                    unsafe_allow_html=True,
+                )
+            with meta_cols[1]:
+                _render_flame_button(mode)
+            # on_click queues the redirect before this script run starts,
+            # so the shell routes straight to the manager tab
+            st.button(
+                f"OPEN {label}",
+                key=f"pcgs_manager_{mode}",
+                on_click=_navigate_to_manager,
+                args=(mode,),
             )
-        with meta_cols[1]:
-            _render_flame_button(mode)
-        if st.button(
-            f"OPEN {label}",
-            key=f"pcgs_manager_{mode}",
-        ):
-            _navigate_to_manager(mode, label)
-        st.markdown("</div>", unsafe_allow_html=True)
-    st.markdown("</div>", unsafe_allow_html=True)
-    st.markdown("</div>", unsafe_allow_html=True)
+            out.add("</div>")
+        out.add("</div></div>")
 
 
-def _navigate_to_manager(mode: str, label: str) -> None:
+def _navigate_to_manager(mode: str) -> None:
     """
     Navigate to a manager tab.
     Sets session state that the main app shell can read to switch tabs.
     
     Args:
         mode: Tab mode identifier ("scalar", "content", "lesson")
-        label: Display label for the tab
     """
     # Map mode to tab id
     tab_map = {
@@ -644,7 +719,6 @@ def _navigate_to_manager(mode: str, label: str) -> None:
     }
     tab_id = tab_map.get(mode, mode)
     navigate_to_tab(tab_id)
-    st.info(f"Navigating to {label}. Select the tab from the sidebar to continue.")
 
 
 # ---------------------------------------------------------------------------
@@ -652,37 +726,43 @@ def _navigate_to_manager(mode: str, label: str) -> None:
 # ---------------------------------------------------------------------------
 
 
+@st.fragment
 def _render_ai_band() -> None:
-    active = st.session_state.get("pcgs_ai_mode") != "idle"
+    # A fragment, so a PKE reply only reruns the band unless it touched a panel
+    state = st.session_state
+    if state.pop(AI_APP_RERUN_KEY, False):
+        st.rerun(scope="app")
+
+    active = state.get("pcgs_ai_mode") != "idle"
     band_class = "pcgs-ai-band pcgs-ai-band--active" if active else "pcgs-ai-band"
 
-    st.markdown(f"<div class='{band_class}'>", unsafe_allow_html=True)
-    st.markdown("<div class='pcgs-ai-band__feed'>", unsafe_allow_html=True)
-    for speaker, text in st.session_state["pcgs_ai_history"][-HISTORY_LIMIT:]:
-        prefix = "[PKE]" if speaker == "PKE" else "&gt;"
-        st.markdown(
-            f"<div class='pcgs-ai-band__line'><span class='pcgs-ai-band__speaker'>{prefix}</span>{_sanitize(text)}</div>",
-            unsafe_allow_html=True,
-        )
-    st.markdown("</div>", unsafe_allow_html=True)
-    st.markdown("<div class='pcgs-ai-band__prompt'>PROMPT<span class='pcgs-ai-band__caret'></span></div>", unsafe_allow_html=True)
-    st.text_input(
-        "PKE Input",
-        key="pcgs_ai_input",
-        label_visibility="collapsed",
-        placeholder="Type your reply and press Enter…",
-        on_change=_flag_ai_submission,
+    # The whole feed goes out as one markdown element rather than one per line
+    lines_html = "".join(
+        _feed_line_html(speaker, text)
+        for speaker, text in state["pcgs_ai_history"]
     )
+    st.markdown(
+        f"<div class='{band_class}'><div class='pcgs-ai-band__feed'>{lines_html}</div>"
+        "<div class='pcgs-ai-band__prompt'>PROMPT<span class='pcgs-ai-band__caret'></span></div>",
+        unsafe_allow_html=True,
+    )
+    # Only an explicit submit (Enter or SEND) sends the reply to the band;
+    # the handler stays a callback so it may resync the form widgets
+    with st.form("pcgs_ai_form", clear_on_submit=True, border=False):
+        st.text_input(
+            "PKE Input",
+            key="pcgs_ai_input",
+            label_visibility="collapsed",
+            placeholder="Type your reply and press Enter…",
+        )
+        st.form_submit_button("SEND", on_click=_handle_ai_submission)
     st.markdown("</div>", unsafe_allow_html=True)
 
-    if st.session_state.pop("pcgs_ai_input_triggered", False):
-        _handle_ai_submission()
-
 
 def _render_footer_section() -> None:
     """Render the footer using shared chrome component."""
     total = len(PROGRESS_STEPS)
-    completed = sum(1 for stage in PROGRESS_STEPS if _stage_complete(stage))
+    completed = st.session_state[PROGRESS_COMPLETED_KEY]
     progress = round((completed / total) * 100) if total else 0
     render_footer(progress_percent=progress)
 
@@ -692,32 +772,48 @@ def _render_footer_section() -> None:
 # ---------------------------------------------------------------------------
 
 
-def _flag_ai_submission() -> None:
-    st.session_state["pcgs_ai_input_triggered"] = True
-
-
 def _handle_ai_submission() -> None:
-    raw_input = st.session_state.get("pcgs_ai_input", "")
+    # Runs as the AI form's submit callback, before any widget is created,
+    # so replies may reset the input and resync the form widgets
+    state = st.session_state
+    raw_input = state.get("pcgs_ai_input", "")
     reply = raw_input.strip()
     if not reply:
         return
 
     _append_user_line(reply)
-    st.session_state["pcgs_ai_input"] = ""
-    active_stage = st.session_state.get("pcgs_ai_target_panel")
+    state["pcgs_ai_input"] = ""
+    before = _panel_state_signature()
+    active_stage = state.get("pcgs_ai_target_panel")
     _process_ai_reply(reply)
-    if st.session_state.get("pcgs_ai_mode") == "idle" and active_stage is not None:
+    if state.get("pcgs_ai_mode") == "idle" and active_stage is not None:
         _flash_panel(active_stage)
         _set_ai_target(None)
+    if _panel_state_signature() != before:
+        state[AI_APP_RERUN_KEY] = True
+
+
+def _panel_state_signature() -> Tuple[Any, ...]:
+    # Everything outside the AI band that a reply can change
+    state = st.session_state
+    return (
+        state["pcgs_course_description"],
+        tuple(state["pcgs_clos"]),
+        state.get("pcgs_ai_target_panel"),
+        state.get("pcgs_ai_flash_panel"),
+        state.get("pcgs_ai_flash_ticks", 0),
+        tuple(state.get(key, False) for key in STEP_FLAG_KEYS.values()),
+    )
 
 
 def _process_ai_reply(reply: str) -> None:
-    mode = st.session_state.get("pcgs_ai_mode", "idle")
+    state = st.session_state
+    mode = state.get("pcgs_ai_mode", "idle")
     lowered = reply.lower()
 
     if mode == "description":
         _handle_description_reply(lowered)
-        st.session_state["pcgs_ai_mode"] = "idle"
+        state["pcgs_ai_mode"] = "idle"
         return
 
     if mode == "clos":
@@ -726,17 +822,19 @@ def _process_ai_reply(reply: str) -> None:
 
     if mode in {"scalar", "content", "lesson"}:
         _handle_manager_reply(mode)
-        st.session_state["pcgs_ai_mode"] = "idle"
+        state["pcgs_ai_mode"] = "idle"
         return
 
     _append_ai_line("Input received. Engage a flame icon to target a panel.")
 
 
 def _handle_description_reply(reply: str) -> None:
+    state = st.session_state
     if "yes" in reply:
-        st.session_state["pcgs_course_description"] = PLACEHOLDER_DESCRIPTION
-        st.session_state["pcgs_ai_target_panel"] = Lex.C_DESC
+        state["pcgs_course_description"] = PLACEHOLDER_DESCRIPTION
+        state["pcgs_ai_target_panel"] = Lex.C_DESC
         _sync_form_inputs()
+        _refresh_stage_flag(Lex.C_DESC)
         _append_ai_line("Draft description generated and placed into the Course Description panel.")
         _append_ai_line("Please review and edit as needed, then SAVE to confirm.")
     elif "no" in reply:
@@ -746,42 +844,46 @@ def _handle_description_reply(reply: str) -> None:
 
 
 def _handle_clos_reply(reply: str) -> None:
-    followup = st.session_state.get("pcgs_ai_followup")
+    state = st.session_state
+    followup = state.get("pcgs_ai_followup")
 
     if followup == "generate":
         if "yes" in reply:
-            st.session_state["pcgs_clos"] = copy.deepcopy(CLO_PLACEHOLDERS)
-            st.session_state["pcgs_ai_target_panel"] = Lex.CLO
+            # Refill in place; the strings are shared, nothing is deep-copied
+            state["pcgs_clos"][:] = CLO_PLACEHOLDERS
+            state["pcgs_ai_target_panel"] = Lex.CLO
             _ensure_min_clos()
             _sync_form_inputs()
-            for idx, clo in enumerate(st.session_state["pcgs_clos"], start=1):
+            _refresh_stage_flag(Lex.CLO)
+            for idx, clo in enumerate(state["pcgs_clos"], start=1):
                 _append_ai_line(f"CLO {idx} generated. {clo}")
             _append_ai_line("Is this satisfactory, or would you like me to try again?")
-            st.session_state["pcgs_ai_followup"] = "review"
+            state["pcgs_ai_followup"] = "review"
             return
         if "no" in reply:
             _append_ai_line("No problem. You can add your own CLOs in the Learning Objectives panel.")
-            st.session_state["pcgs_ai_followup"] = None
-            st.session_state["pcgs_ai_mode"] = "idle"
+            state["pcgs_ai_followup"] = None
+            state["pcgs_ai_mode"] = "idle"
             return
         _append_ai_line("Respond with YES or NO so I know how to proceed.")
         return
 
     if followup == "review":
         if "no" in reply:
-            st.session_state["pcgs_clos"] = copy.deepcopy(CLO_ALT_PLACEHOLDERS)
-            st.session_state["pcgs_ai_target_panel"] = Lex.CLO
+            state["pcgs_clos"][:] = CLO_ALT_PLACEHOLDERS
+            state["pcgs_ai_target_panel"] = Lex.CLO
             _ensure_min_clos()
             _sync_form_inputs()
+            _refresh_stage_flag(Lex.CLO)
             _append_ai_line("Updated CLOs drafted. Let me know if you need another pass.")
         else:
             _append_ai_line("Great. Remember to SAVE once you're happy.")
-        st.session_state["pcgs_ai_followup"] = None
-        st.session_state["pcgs_ai_mode"] = "idle"
+        state["pcgs_ai_followup"] = None
+        state["pcgs_ai_mode"] = "idle"
         return
 
     _append_ai_line("Engage the flame icon to start CLO drafting.")
-    st.session_state["pcgs_ai_mode"] = "idle"
+    state["pcgs_ai_mode"] = "idle"
 
 
 def _handle_manager_reply(mode: str) -> None:
@@ -793,13 +895,13 @@ def _handle_manager_reply(mode: str) -> None:
 
 
 def _trigger_ai_prompt(target: str) -> None:
+    state = st.session_state
     stage = _mode_to_stage(target)
-    st.session_state["pcgs_ai_mode"] = target
-    st.session_state["pcgs_ai_followup"] = "generate" if target == "clos" else None
+    state["pcgs_ai_mode"] = target
+    state["pcgs_ai_followup"] = "generate" if target == "clos" else None
     _set_ai_target(stage)
     if stage in (Lex.SCALEMGR, Lex.CONTMGR, Lex.LSNMGR):
         _set_stage_complete(stage, True)
-        _update_completion_flags()
     prompt = AI_PROMPTS.get(target)
     if prompt:
         _append_ai_line(prompt)
@@ -813,15 +915,11 @@ def _render_flame_button(target: str) -> None:
 
 
 def _append_ai_line(text: str) -> None:
-    history = st.session_state["pcgs_ai_history"]
-    history.append(("PKE", text))
-    st.session_state["pcgs_ai_history"] = history[-HISTORY_LIMIT:]
+    st.session_state["pcgs_ai_history"].append(("PKE", text))
 
 
 def _append_user_line(text: str) -> None:
-    history = st.session_state["pcgs_ai_history"]
-    history.append(("USER", text))
-    st.session_state["pcgs_ai_history"] = history[-HISTORY_LIMIT:]
+    st.session_state["pcgs_ai_history"].append(("USER", text))
 
 
 # ---------------------------------------------------------------------------
@@ -829,23 +927,21 @@ def _append_user_line(text: str) -> None:
 # ---------------------------------------------------------------------------
 
 
-def _panel_classes(
-    base: str,
-    *,
-    stage: Optional[Lex] = None,
-    disabled: bool = False,
-) -> str:
-    classes = ["pcgs-panel", base]
-    if disabled:
-        classes.append("pcgs-panel--disabled")
-    if stage is not None:
-        if _stage_complete(stage):
-            classes.append("pcgs-panel--complete")
-        elif _has_unsaved_stage(stage):
-            classes.append("pcgs-panel--unsaved")
-        if _is_ai_highlight(stage):
-            classes.append("pcgs-panel--ai-target")
-    return " ".join(classes)
+def _panel_classes(base: str, *, disabled: bool = False) -> str:
+    """Classes for a panel that does not track a flow stage."""
+    return _PANEL_CLASS_TABLE[(base, disabled, "", False)]
+
+
+def _stage_panel_chrome(base: str, stage: Lex) -> Tuple[str, str]:
+    """Return (panel classes, status dot HTML), reading the stage state once."""
+    if _stage_complete(stage):
+        progress, status = "complete", "ok"
+    elif _has_unsaved_stage(stage):
+        progress, status = "unsaved", "warn"
+    else:
+        progress, status = "", "warn" if _stage_has_content(stage) else "idle"
+    classes = _PANEL_CLASS_TABLE[(base, False, progress, _is_ai_highlight(stage))]
+    return classes, render_status_dot(status)
 
 
 def _panel_status(stage: Lex) -> str:
@@ -869,89 +965,119 @@ def _stage_complete(stage: Lex) -> bool:
 
 def _set_stage_complete(stage: Lex, value: bool) -> None:
     key = _stage_flag_key(stage)
-    if key:
-        st.session_state[key] = value
+    if not key:
+        return
+    state = st.session_state
+    previous = bool(state.get(key))
+    state[key] = value
+    if stage in PROGRESS_STEPS and previous != bool(value):
+        # Keep the footer's completed-step count in step with the flags
+        delta = 1 if value else -1
+        state[PROGRESS_COMPLETED_KEY] = state.get(PROGRESS_COMPLETED_KEY, 0) + delta
 
 
 def _has_unsaved_stage(stage: Lex) -> bool:
-    snapshot = st.session_state["pcgs_saved_snapshot"]
+    state = st.session_state
+    snapshot = state["pcgs_saved_snapshot"]
     if stage == Lex.C_INFO:
-        return st.session_state["pcgs_course_info"] != snapshot.get("course_info")
+        return state["pcgs_course_info"] != snapshot.get("course_info")
     if stage == Lex.C_DESC:
-        return st.session_state["pcgs_course_description"] != snapshot.get("description")
+        return state["pcgs_course_description"] != snapshot.get("description")
     if stage == Lex.CLO:
-        return st.session_state["pcgs_clos"] != snapshot.get("clos")
+        return state["pcgs_clos"] != snapshot.get("clos")
     return False
 
 
 def _stage_has_content(stage: Lex) -> bool:
+    state = st.session_state
     if stage == Lex.C_INFO:
-        info = st.session_state["pcgs_course_info"]
-        return any(value.strip() for value in info.values())
+        info = state["pcgs_course_info"]
+        return any(map(_has_text, info.values()))
     if stage == Lex.C_DESC:
-        return bool(st.session_state["pcgs_course_description"].strip())
+        return _has_text(state["pcgs_course_description"])
     if stage == Lex.CLO:
-        return any(obj.strip() for obj in st.session_state["pcgs_clos"])
+        return any(map(_has_text, state["pcgs_clos"]))
     return False
 
 
 def _info_has_required_fields(info: Dict[Lex, str]) -> bool:
-    required_fields = [
-        Lex.C_NAME,
-        Lex.C_LEVEL,
-        Lex.C_THEME,
-        Lex.C_DURATION,
-        Lex.C_DEV,
-    ]
-    return all(info.get(field, "").strip() for field in required_fields)
+    return all(_has_text(info.get(field, "")) for field in REQUIRED_INFO_FIELDS)
 
 
 def _update_completion_flags() -> None:
-    saved = bool(st.session_state.get("pcgs_has_saved_once"))
-    info = st.session_state["pcgs_course_info"]
-    info_ready = _info_has_required_fields(info)
-    _set_stage_complete(
-        Lex.C_INFO,
-        saved and info_ready and not _has_unsaved_stage(Lex.C_INFO),
+    # Full recompute for events that touch every editable stage at once
+    # (init, save, load, reset); field edits refresh only their own stage
+    state = st.session_state
+    sig = (
+        tuple(state["pcgs_course_info"].items()),
+        state["pcgs_course_description"],
+        tuple(state["pcgs_clos"]),
+        bool(state.get("pcgs_has_saved_once")),
+        state.get(SNAPSHOT_HASH_KEY),
     )
+    if state.get(COMPLETION_SIG_KEY) == sig:
+        return
+    for stage in (Lex.C_INFO, Lex.C_DESC, Lex.CLO):
+        _refresh_stage_flag(stage)
+    state[COMPLETION_SIG_KEY] = sig
 
-    description_ready = bool(st.session_state["pcgs_course_description"].strip())
-    _set_stage_complete(
-        Lex.C_DESC,
-        saved and description_ready and not _has_unsaved_stage(Lex.C_DESC),
-    )
 
-    clos_ready = any(obj.strip() for obj in st.session_state["pcgs_clos"])
-    _set_stage_complete(
-        Lex.CLO,
-        saved and clos_ready and not _has_unsaved_stage(Lex.CLO),
-    )
+def _refresh_stage_flag(stage: Lex) -> None:
+    state = st.session_state
+    if stage == Lex.C_INFO:
+        ready = _info_has_required_fields(state["pcgs_course_info"])
+    else:
+        ready = _stage_has_content(stage)
+    saved = bool(state.get("pcgs_has_saved_once"))
+    _set_stage_complete(stage, saved and ready and not _has_unsaved_stage(stage))
+    # The flag may now differ from the last full recompute, so its signature
+    # no longer vouches for the current flags
+    state.pop(COMPLETION_SIG_KEY, None)
+
+
+def _flow_mask() -> int:
+    """Snapshot the stage completion flags as a bitmask in flow order."""
+    state = st.session_state
+    return sum(bit for stage, bit in _STAGE_BIT.items() if state.get(STEP_FLAG_KEYS[stage]))
+
 
+def _ai_highlighted_stages() -> Tuple[Optional[Lex], Optional[Lex]]:
+    """Return (AI target stage, flashing stage) for class lookups."""
+    state = st.session_state
+    flash = state.get("pcgs_ai_flash_panel") if state.get("pcgs_ai_flash_ticks", 0) > 0 else None
+    return state.get("pcgs_ai_target_panel"), flash
 
-def _connector_state(left: Lex, right: Lex) -> str:
-    if _stage_complete(right):
+
+def _connector_state(mask: int, left: Lex, right: Lex) -> str:
+    if mask & _STAGE_BIT[right]:
         return "complete"
-    if _stage_complete(left):
+    if mask & _STAGE_BIT[left]:
         return "active"
     return "idle"
 
 
-def _get_next_stage() -> Optional[Lex]:
-    for stage in COURSE_FLOW_SEQUENCE:
-        if not _stage_complete(stage):
-            return stage
-    return None
+def _get_next_stage(mask: int) -> Optional[Lex]:
+    pending = ~mask & _FULL_FLOW_MASK
+    if not pending:
+        return None
+    return COURSE_FLOW_SEQUENCE[(pending & -pending).bit_length() - 1]
 
 
-def _tile_classes(stage: Lex) -> str:
+@lru_cache(maxsize=256)
+def _tile_classes(
+    mask: int,
+    highlighted: Tuple[Optional[Lex], Optional[Lex]],
+    stage: Lex,
+) -> str:
+    # Pure in its arguments, so reruns with unchanged flags reuse the string
     classes = ["pcgs-node-tile"]
-    if _stage_complete(stage):
+    if mask & _STAGE_BIT[stage]:
         classes.append("pcgs-node-tile--complete")
-    elif _get_next_stage() == stage:
+    elif _get_next_stage(mask) == stage:
         classes.append("pcgs-node-tile--in-progress")
     else:
         classes.append("pcgs-node-tile--idle")
-    if _is_ai_highlight(stage):
+    if stage in highlighted:
         classes.append("pcgs-node-tile--ai-target")
     return " ".join(classes)
 
@@ -961,47 +1087,65 @@ def _mode_to_stage(mode: str) -> Optional[Lex]:
 
 
 def _set_ai_target(stage: Optional[Lex]) -> None:
-    st.session_state["pcgs_ai_target_panel"] = stage
+    state = st.session_state
+    state["pcgs_ai_target_panel"] = stage
     if stage is not None:
-        st.session_state["pcgs_ai_flash_panel"] = None
-        st.session_state["pcgs_ai_flash_ticks"] = 0
+        state["pcgs_ai_flash_panel"] = None
+        state["pcgs_ai_flash_ticks"] = 0
 
 
 def _flash_panel(stage: Lex) -> None:
-    st.session_state["pcgs_ai_flash_panel"] = stage
-    st.session_state["pcgs_ai_flash_ticks"] = 2
+    state = st.session_state
+    state["pcgs_ai_flash_panel"] = stage
+    state["pcgs_ai_flash_ticks"] = 2
 
 
 def _is_ai_highlight(stage: Lex) -> bool:
-    flash_stage = st.session_state.get("pcgs_ai_flash_panel")
-    flash_ticks = st.session_state.get("pcgs_ai_flash_ticks", 0)
+    state = st.session_state
+    flash_stage = state.get("pcgs_ai_flash_panel")
+    flash_ticks = state.get("pcgs_ai_flash_ticks", 0)
     return (
-        st.session_state.get("pcgs_ai_target_panel") == stage
+        state.get("pcgs_ai_target_panel") == stage
         or (flash_stage == stage and flash_ticks > 0)
     )
 
 
 def _tick_ai_flash() -> None:
-    ticks = st.session_state.get("pcgs_ai_flash_ticks", 0)
+    state = st.session_state
+    ticks = state.get("pcgs_ai_flash_ticks", 0)
     if ticks > 0:
-        st.session_state["pcgs_ai_flash_ticks"] = ticks - 1
+        state["pcgs_ai_flash_ticks"] = ticks - 1
         if ticks - 1 == 0:
-            st.session_state["pcgs_ai_flash_panel"] = None
+            state["pcgs_ai_flash_panel"] = None
     else:
-        st.session_state["pcgs_ai_flash_panel"] = None
+        state["pcgs_ai_flash_panel"] = None
 
 
-def _add_clo_row() -> None:
-    st.session_state["pcgs_clos"].append("")
-    _sync_form_inputs()
+def _ensure_option(
+    options: Tuple[str, ...], known: FrozenSet[str], current: str
+) -> Tuple[str, ...]:
+    """Return the shared options tuple, prepending ``current`` only if unknown."""
+    if current in known:
+        return options
+    return (current, *options)
 
 
-def _ensure_option(options: List[str], current: str) -> List[str]:
-    if current and current not in options:
-        return [current, *options]
-    return options
+def _has_text(value: str) -> bool:
+    # Same answer as bool(value.strip()) without copying the string; isspace
+    # stops at the first visible character
+    return bool(value) and not value.isspace()
 
 
 def _sanitize(value: str) -> str:
-    return html.escape(value)
+    return value.translate(_HTML_ESCAPE_TABLE)
+
+
+@lru_cache(maxsize=HISTORY_LIMIT * 2)
+def _feed_line_html(speaker: str, text: str) -> str:
+    # History is append-only, so each line is escaped and formatted once
+    prefix = "[PKE]" if speaker == "PKE" else "&gt;"
+    return (
+        f"<div class='pcgs-ai-band__line'><span class='pcgs-ai-band__speaker'>"
+        f"{prefix}</span>{_sanitize(text)}</div>"
+    )
 
@@ -15,19 +15,24 @@ Layout Structure (Template B - Manager 2-Column):
 
 import copy
 import html
-from datetime import datetime
+from collections import deque
+from itertools import islice
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Optional
 
 import streamlit as st
 
 from pcgs_app.core.scalar_models import ScalarLevel, ScalarEntry, BLOOMS_VERBS
-from pcgs_app.logic.lexicon import Lex
-from pcgs_app.services import scalar_service
+from pcgs_app.services import scalar_service, scalar_session
 from pcgs_app.ui.theme.shared_chrome import (
     render_footer,
     render_ai_console,
     navigate_to_tab,
     inject_shared_chrome_styles,
+    html_buffer,
+    header_status_html,
+    HtmlBuffer,
+    minify_css,
     CURRENT_USER,
     START_DATE,
     PROGRAM_STATUS,
@@ -52,10 +57,19 @@ SCALAR_COLUMNS = [
 # Edit tool buttons
 EDIT_TOOLS = ["SELECT", "REORDER", "BULK EDIT", "DELETE"]
 
+# Entry count the footer treats as 100% progress
+FOOTER_PROGRESS_TARGET = 20
+
+# Bulk edit table columns
+BULK_SERIAL_COLUMN = "Serial"
+BULK_TEXT_COLUMN = "Text"
+
 # Navigation state keys
 NAV_STATE_KEY = "pcgs_current_tab"
 SCALAR_EDIT_MODE_KEY = "pcgs_scalar_edit_mode"
 SCALAR_EDITING_ENTRY_KEY = "pcgs_scalar_editing_entry"
+GRID_HTML_CACHE_KEY = "_pcgs_scalar_grid_html"
+BULK_EDITOR_REV_KEY = "_pcgs_scalar_bulk_rev"
 
 
 # ============================================================================
@@ -82,6 +96,16 @@ def render_tab_scalar() -> None:
     
     # Inject Scalar Manager specific styles
     _inject_scalar_styles()
+    
+    # Bloom's checks for a fresh upload run once the rows are on screen
+    _run_deferred_validation()
+
+
+@st.fragment
+def _run_deferred_validation() -> None:
+    """Validate a just-imported scalar, rerunning the tab if anything changed."""
+    if scalar_session.run_pending_validation():
+        st.rerun()
 
 
 def _render_region(region_class: str, renderer: Callable[[], None]) -> None:
@@ -98,7 +122,7 @@ def _render_region(region_class: str, renderer: Callable[[], None]) -> None:
 
 def _init_state() -> None:
     """Initialize scalar tab state."""
-    scalar_service.init_scalar_state()
+    scalar_session.init_scalar_state()
     
     # Edit mode state
     if SCALAR_EDIT_MODE_KEY not in st.session_state:
@@ -141,70 +165,42 @@ def _is_editing(level: ScalarLevel, serial: str) -> bool:
 
 def _render_header() -> None:
     """Render the header with status info and action buttons."""
-    st.markdown("<div class='pcgs-status-band'>", unsafe_allow_html=True)
-    st.markdown("<div class='pcgs-status-band__left'>", unsafe_allow_html=True)
-    _render_header_status()
-    st.markdown("</div>", unsafe_allow_html=True)
-    st.markdown("<div class='pcgs-status-band__right'>", unsafe_allow_html=True)
-    _render_top_buttons()
-    st.markdown("</div>", unsafe_allow_html=True)
-    st.markdown("</div>", unsafe_allow_html=True)
+    with html_buffer() as out:
+        out.add("<div class='pcgs-status-band'><div class='pcgs-status-band__left'>")
+        out.add(header_status_html("SCALAR MANAGER"))
+        out.add("</div><div class='pcgs-status-band__right'>")
+        _render_top_buttons(out)
+        out.add("</div></div>")
 
 
-def _render_header_status() -> None:
-    """Render the status information in header."""
-    now_str = datetime.now().strftime("%d %b %Y %H:%M")
-    
-    # Get course info from session state if available
-    course_info = st.session_state.get("pcgs_course_info", {})
-    title = course_info.get(Lex.C_NAME, "") or "UNSPECIFIED"
-    duration = course_info.get(Lex.C_DURATION, "") or "N/A"
-    level = course_info.get(Lex.C_LEVEL, "") or "UNSPECIFIED"
-    thematic = course_info.get(Lex.C_THEME, "") or "UNSPECIFIED"
-    
-    status_html = f"""
-    <div class="pcgs-header-status">
-        <div class="pcgs-header-status__title">PROMETHEUS COURSE GENERATION SYSTEM 2.0</div>
-        <div class="pcgs-header-status__page-title">SCALAR MANAGER</div>
-        <div class="pcgs-header-status__timestamp">{now_str}</div>
-        <div class="pcgs-header-status__metrics">
-            <span>Course Loaded · {html.escape(str(title))}</span>
-            <span>Duration · {html.escape(str(duration))}</span>
-            <span>Level · {html.escape(str(level))}</span>
-            <span>Thematic · {html.escape(str(thematic))}</span>
-        </div>
-    </div>
-    """
-    st.markdown(status_html, unsafe_allow_html=True)
-
-
-def _render_top_buttons() -> None:
+def _render_top_buttons(out: HtmlBuffer) -> None:
     """Render top action buttons (LOAD disabled, SAVE, DELETE disabled, CLEAR)."""
-    st.markdown("<div class='pcgs-top-buttons'>", unsafe_allow_html=True)
+    # Wrapper markup between buttons is batched; each gap is one markdown
+    out.add("<div class='pcgs-top-buttons'>")
     
     # LOAD - disabled on Scalar Manager
-    st.markdown("<div class='pcgs-pill-button pcgs-pill-button--disabled'>", unsafe_allow_html=True)
+    out.add("<div class='pcgs-pill-button pcgs-pill-button--disabled'>")
+    out.flush()
     st.button("LOAD", key="pcgs_scalar_load", disabled=True)
-    st.markdown("</div>", unsafe_allow_html=True)
     
     # SAVE - active
-    st.markdown("<div class='pcgs-pill-button pcgs-pill-button--primary'>", unsafe_allow_html=True)
+    out.add("</div><div class='pcgs-pill-button pcgs-pill-button--primary'>")
+    out.flush()
     if st.button("SAVE", key="pcgs_scalar_save"):
         _handle_save()
-    st.markdown("</div>", unsafe_allow_html=True)
     
     # DELETE - disabled on Scalar Manager
-    st.markdown("<div class='pcgs-pill-button pcgs-pill-button--disabled'>", unsafe_allow_html=True)
+    out.add("</div><div class='pcgs-pill-button pcgs-pill-button--disabled'>")
+    out.flush()
     st.button("DELETE", key="pcgs_scalar_delete_btn", disabled=True)
-    st.markdown("</div>", unsafe_allow_html=True)
     
     # CLEAR - active
-    st.markdown("<div class='pcgs-pill-button pcgs-pill-button--neutral'>", unsafe_allow_html=True)
+    out.add("</div><div class='pcgs-pill-button pcgs-pill-button--neutral'>")
+    out.flush()
     if st.button("CLEAR", key="pcgs_scalar_clear"):
         _handle_clear()
-    st.markdown("</div>", unsafe_allow_html=True)
     
-    st.markdown("</div>", unsafe_allow_html=True)
+    out.add("</div></div>")
 
 
 def _handle_save() -> None:
@@ -219,7 +215,7 @@ def _handle_save() -> None:
 
 def _handle_clear() -> None:
     """Handle clear button click."""
-    scalar_service.clear_scalar()
+    scalar_session.clear_scalar()
     st.info("Scalar cleared. Remember to SAVE to confirm.")
 
 
@@ -229,36 +225,37 @@ def _handle_clear() -> None:
 
 def _render_control_panel() -> None:
     """Render the left SCALAR CONTROL panel."""
-    classes = "pcgs-panel pcgs-panel--scalar-control"
-    
-    st.markdown(f"<div class='{classes}'>", unsafe_allow_html=True)
-    st.markdown(
-        "<div class='pcgs-panel__header'><div class='pcgs-panel__title'>SCALAR CONTROL</div></div>",
-        unsafe_allow_html=True,
-    )
-    
-    # A) Import Scalar Section
-    _render_import_section()
-    
-    # B) Edit Tools Section
-    _render_edit_tools()
-    
-    # C) Master PKE Control
-    _render_pke_control()
-    
-    # D) Navigation Buttons
-    _render_navigation_buttons()
-    
-    # Warnings Panel
-    _render_warnings_panel()
-    
-    st.markdown("</div>", unsafe_allow_html=True)
+    with html_buffer() as out:
+        out.add(
+            "<div class='pcgs-panel pcgs-panel--scalar-control'>"
+            "<div class='pcgs-panel__header'><div class='pcgs-panel__title'>SCALAR CONTROL</div></div>"
+        )
+        
+        # A) Import Scalar Section
+        _render_import_section(out)
+        
+        # B) Edit Tools Section
+        _render_edit_tools(out)
+        
+        # C) Master PKE Control
+        _render_pke_control(out)
+        
+        # D) Navigation Buttons
+        _render_navigation_buttons(out)
+        
+        # Warnings Panel
+        _render_warnings_panel(out)
+        
+        out.add("</div>")
 
 
-def _render_import_section() -> None:
+def _render_import_section(out: HtmlBuffer) -> None:
     """Render the Import Scalar section."""
-    st.markdown("<div class='pcgs-scalar-section'>", unsafe_allow_html=True)
-    st.markdown("<div class='pcgs-scalar-section__title'>IMPORT SCALAR</div>", unsafe_allow_html=True)
+    out.add(
+        "<div class='pcgs-scalar-section'>"
+        "<div class='pcgs-scalar-section__title'>IMPORT SCALAR</div>"
+    )
+    out.flush()
     
     # File uploader
     uploaded_file = st.file_uploader(
@@ -269,106 +266,108 @@ def _render_import_section() -> None:
     )
     
     # Import button
-    st.markdown("<div class='pcgs-pill-button pcgs-pill-button--primary'>", unsafe_allow_html=True)
+    out.add("<div class='pcgs-pill-button pcgs-pill-button--primary'>")
+    out.flush()
     if st.button("IMPORT SCALAR", key="pcgs_scalar_import_btn"):
         if uploaded_file:
-            success, message = scalar_service.import_scalar_from_file(uploaded_file)
+            success, message = scalar_session.import_scalar_from_file(uploaded_file)
             if success:
                 st.success(message)
             else:
                 st.error(message)
         else:
             st.warning("Please select an Excel file first.")
-    st.markdown("</div>", unsafe_allow_html=True)
     
-    st.markdown(
-        "<div class='pcgs-scalar-help'>Import from Excel template (rows 6+, columns B–K).</div>",
-        unsafe_allow_html=True,
+    out.add(
+        "</div>"
+        "<div class='pcgs-scalar-help'>Import from Excel template (rows 6+, columns B–K).</div>"
+        "</div>"
     )
-    st.markdown("</div>", unsafe_allow_html=True)
 
 
-def _render_edit_tools() -> None:
+def _render_edit_tools(out: HtmlBuffer) -> None:
     """Render the Edit Tools section."""
-    st.markdown("<div class='pcgs-scalar-section'>", unsafe_allow_html=True)
-    st.markdown("<div class='pcgs-scalar-section__title'>EDIT TOOLS</div>", unsafe_allow_html=True)
+    out.add(
+        "<div class='pcgs-scalar-section'>"
+        "<div class='pcgs-scalar-section__title'>EDIT TOOLS</div>"
+    )
+    out.flush()
     
     current_mode = _get_edit_mode()
     
+    # The active tool is shown as a primary button rather than through
+    # wrapper divs, so each column holds just its button
     cols = st.columns(4)
     for i, tool in enumerate(EDIT_TOOLS):
         with cols[i]:
             tool_key = tool.lower().replace(" ", "_")
             is_active = current_mode == tool_key
-            btn_class = "pcgs-tool-button--active" if is_active else ""
-            st.markdown(f"<div class='pcgs-tool-button {btn_class}'>", unsafe_allow_html=True)
-            if st.button(tool, key=f"pcgs_scalar_tool_{tool_key}"):
+            if st.button(
+                tool,
+                key=f"pcgs_scalar_tool_{tool_key}",
+                type="primary" if is_active else "secondary",
+            ):
                 if is_active:
                     _set_edit_mode(None)
                 else:
                     _set_edit_mode(tool_key)
-            st.markdown("</div>", unsafe_allow_html=True)
     
-    st.markdown("</div>", unsafe_allow_html=True)
+    out.add("</div>")
 
 
-def _render_pke_control() -> None:
+def _render_pke_control(out: HtmlBuffer) -> None:
     """Render the Master PKE Control section."""
-    st.markdown("<div class='pcgs-scalar-pke'>", unsafe_allow_html=True)
-    
-    st.markdown(f"""
+    out.add(f"""
+    <div class='pcgs-scalar-pke'>
     <div class='pcgs-pke-badge'>
         <span class='pcgs-pke-icon'>{PKE_ICON}</span>
         <span class='pcgs-pke-label'>PROMETHEUS: SCALAR BUILDER</span>
     </div>
-    """, unsafe_allow_html=True)
-    
-    st.markdown("<div class='pcgs-pill-button pcgs-pill-button--pke'>", unsafe_allow_html=True)
+    <div class='pcgs-pill-button pcgs-pill-button--pke'>
+    """)
+    out.flush()
     if st.button("ENGAGE PKE", key="pcgs_scalar_pke"):
-        st.session_state.setdefault("pcgs_ai_history", []).append(
+        st.session_state.setdefault("pcgs_ai_history", deque(maxlen=HISTORY_LIMIT)).append(
             ("PKE", "Scalar Builder PKE functionality coming soon. I will help you generate and refine your course structure.")
         )
         st.info("PKE Scalar Builder engaged. See AI Console below.")
-    st.markdown("</div>", unsafe_allow_html=True)
-    
-    st.markdown("</div>", unsafe_allow_html=True)
+    out.add("</div></div>")
 
 
-def _render_navigation_buttons() -> None:
+def _render_navigation_buttons(out: HtmlBuffer) -> None:
     """Render navigation buttons."""
-    st.markdown("<div class='pcgs-scalar-nav'>", unsafe_allow_html=True)
+    out.add("<div class='pcgs-scalar-nav'>")
+    out.flush()
     
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("<div class='pcgs-pill-button pcgs-pill-button--neutral'>", unsafe_allow_html=True)
         if st.button("RETURN TO\nFRONT PAGE", key="pcgs_scalar_nav_back"):
             _navigate_to_tab("create")
-        st.markdown("</div>", unsafe_allow_html=True)
     
     with col2:
-        st.markdown("<div class='pcgs-pill-button pcgs-pill-button--neutral'>", unsafe_allow_html=True)
         if st.button("CONTINUE TO\nCONTENT MGR", key="pcgs_scalar_nav_forward"):
             _navigate_to_tab("content")
-        st.markdown("</div>", unsafe_allow_html=True)
     
-    st.markdown("</div>", unsafe_allow_html=True)
+    out.add("</div>")
 
 
-def _render_warnings_panel() -> None:
+def _render_warnings_panel(out: HtmlBuffer) -> None:
     """Render the Warnings panel."""
-    warnings = scalar_service.get_warnings()
+    warnings = scalar_session.get_warnings()
     
-    st.markdown("<div class='pcgs-scalar-warnings'>", unsafe_allow_html=True)
-    st.markdown("<div class='pcgs-scalar-section__title'>WARNINGS</div>", unsafe_allow_html=True)
+    out.add(
+        "<div class='pcgs-scalar-warnings'>"
+        "<div class='pcgs-scalar-section__title'>WARNINGS</div>"
+    )
     
     if warnings:
         for warning in warnings[-5:]:  # Show last 5 warnings
-            st.markdown(f"<div class='pcgs-warning-item'>⚠️ {html.escape(warning)}</div>", unsafe_allow_html=True)
+            out.add(f"<div class='pcgs-warning-item'>⚠️ {_sanitize(warning)}</div>")
     else:
-        st.markdown("<div class='pcgs-warning-empty'>No warnings.</div>", unsafe_allow_html=True)
+        out.add("<div class='pcgs-warning-empty'>No warnings.</div>")
     
-    st.markdown("</div>", unsafe_allow_html=True)
+    out.add("</div>")
 
 
 # ============================================================================
@@ -377,70 +376,130 @@ def _render_warnings_panel() -> None:
 
 def _render_grid_panel() -> None:
     """Render the right SCALAR GRID panel."""
-    classes = "pcgs-panel pcgs-panel--scalar-grid"
+    with html_buffer() as out:
+        out.add(
+            "<div class='pcgs-panel pcgs-panel--scalar-grid'>"
+            "<div class='pcgs-panel__header'><div class='pcgs-panel__title'>COURSE SCALAR</div></div>"
+        )
+        
+        if _get_edit_mode() is None and st.session_state.get(SCALAR_EDITING_ENTRY_KEY) is None:
+            # Viewing: every row is static, so the whole grid is one markdown
+            # and only the add rows need widget columns
+            out.add(_cached_grid_html())
+            out.flush()
+            cols = st.columns(len(SCALAR_COLUMNS))
+            for col_idx, col_config in enumerate(SCALAR_COLUMNS):
+                if col_config["level"]:
+                    with cols[col_idx], html_buffer() as col_out:
+                        _render_add_entry_row(col_out, col_config["level"], col_config["key"])
+        else:
+            out.flush()
+            
+            # Create columns for the grid
+            cols = st.columns(len(SCALAR_COLUMNS))
+            
+            for col_idx, col_config in enumerate(SCALAR_COLUMNS):
+                with cols[col_idx]:
+                    _render_scalar_column(col_config)
+        
+        out.add("</div>")
+
+
+def _column_header_html(config: Dict[str, Any]) -> str:
+    """Open a scalar column and its content area, including the header."""
+    level = config["level"]
+    count = scalar_service.get_level_count(level) if level else 0
+    return f"""
+        <div class='pcgs-scalar-column' data-level='{config["key"]}'>
+        <div class='pcgs-scalar-column__header'>
+            <span class='pcgs-scalar-column__label'>{config["label"]}</span>
+            <span class='pcgs-scalar-column__pke'>{PKE_ICON}</span>
+            <span class='pcgs-scalar-column__count'>({count})</span>
+        </div>
+        <div class='pcgs-scalar-column__content'>
+        """
+
+
+def _cached_grid_html() -> str:
+    """
+    Return the read-only grid HTML, rebuilt only when the scalar changes.
     
-    st.markdown(f"<div class='{classes}'>", unsafe_allow_html=True)
-    st.markdown(
-        "<div class='pcgs-panel__header'><div class='pcgs-panel__title'>COURSE SCALAR</div></div>",
-        unsafe_allow_html=True,
+    Keyed on the collection object and its version, so reruns triggered by
+    unrelated widgets (e.g. the AI prompt) reuse the previous markup.
+    """
+    collection = scalar_session.get_scalar_collection()
+    cached = st.session_state.get(GRID_HTML_CACHE_KEY)
+    if cached is not None and cached[0] is collection and cached[1] == collection.version:
+        return cached[2]
+    grid_html = _grid_html()
+    st.session_state[GRID_HTML_CACHE_KEY] = (collection, collection.version, grid_html)
+    return grid_html
+
+
+def _grid_html() -> str:
+    """Build the read-only grid: all six columns with their display rows."""
+    parts = ["<div class='pcgs-scalar-grid'>"]
+    for config in SCALAR_COLUMNS:
+        level = config["level"]
+        parts.append(_column_header_html(config))
+        if level:
+            entries = scalar_service.get_entries_for_display(level)
+            if entries:
+                parts.extend(
+                    f"<div class='pcgs-scalar-row'>{_row_label_html(entry.serial, entry.text)}</div>"
+                    for entry in entries
+                )
+            else:
+                parts.append("<div class='pcgs-scalar-empty'>No items</div>")
+        else:
+            parts.append("<div class='pcgs-scalar-reserved'>Reserved for future use</div>")
+        parts.append("</div></div>")
+    parts.append("</div>")
+    return "".join(parts)
+
+
+def _row_label_html(serial: str, text: str) -> str:
+    """Serial and truncated text spans for a display row."""
+    truncated_text = text[:30] + "..." if len(text) > 30 else text
+    return (
+        f"<span class='pcgs-scalar-row__serial'>{_sanitize(serial)}</span> "
+        f"<span class='pcgs-scalar-row__text'>{_sanitize(truncated_text)}</span>"
     )
-    
-    # Create columns for the grid
-    cols = st.columns(len(SCALAR_COLUMNS))
-    
-    for col_idx, col_config in enumerate(SCALAR_COLUMNS):
-        with cols[col_idx]:
-            _render_scalar_column(col_config)
-    
-    st.markdown("</div>", unsafe_allow_html=True)
 
 
 def _render_scalar_column(config: Dict[str, Any]) -> None:
-    """Render a single scalar column."""
+    """Render a single scalar column with per-row action buttons."""
     level = config["level"]
-    label = config["label"]
-    key = config["key"]
-    
-    # Get count
-    count = scalar_service.get_level_count(level) if level else 0
-    
-    st.markdown(f"<div class='pcgs-scalar-column' data-level='{key}'>", unsafe_allow_html=True)
-    
-    # Header with label, PKE icon, and count
-    st.markdown(f"""
-    <div class='pcgs-scalar-column__header'>
-        <span class='pcgs-scalar-column__label'>{label}</span>
-        <span class='pcgs-scalar-column__pke'>{PKE_ICON}</span>
-        <span class='pcgs-scalar-column__count'>({count})</span>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Content area
-    st.markdown("<div class='pcgs-scalar-column__content'>", unsafe_allow_html=True)
     
-    if level:
-        entries = scalar_service.get_entries_for_display(level)
+    # Header, content wrapper and the markup between rows share markdowns
+    with html_buffer() as out:
+        out.add(_column_header_html(config))
         
-        if entries:
-            for entry in entries:
-                _render_entry_row(level, entry)
+        if level and _get_edit_mode() == "bulk_edit":
+            out.flush()
+            _render_bulk_editor(level, config["key"])
+        elif level:
+            entries = scalar_service.get_entries_for_display(level)
+            
+            if entries:
+                for entry in entries:
+                    _render_entry_row(out, level, entry)
+            else:
+                out.add("<div class='pcgs-scalar-empty'>No items</div>")
+            
+            # Add entry row
+            _render_add_entry_row(out, level, config["key"])
         else:
-            st.markdown("<div class='pcgs-scalar-empty'>No items</div>", unsafe_allow_html=True)
+            # Reserved column
+            out.add("<div class='pcgs-scalar-reserved'>Reserved for future use</div>")
         
-        # Add entry row
-        _render_add_entry_row(level, key)
-    else:
-        # Reserved column
-        st.markdown("<div class='pcgs-scalar-reserved'>Reserved for future use</div>", unsafe_allow_html=True)
-    
-    st.markdown("</div>", unsafe_allow_html=True)
-    st.markdown("</div>", unsafe_allow_html=True)
+        out.add("</div></div>")
 
 
-def _render_entry_row(level: ScalarLevel, entry: Dict[str, Any]) -> None:
+def _render_entry_row(out: HtmlBuffer, level: ScalarLevel, entry: ScalarEntry) -> None:
     """Render a single entry row."""
-    serial = entry["serial"]
-    text = entry["text"]
+    serial = entry.serial
+    text = entry.text
     is_editing = _is_editing(level, serial)
     edit_mode = _get_edit_mode()
     
@@ -451,24 +510,20 @@ def _render_entry_row(level: ScalarLevel, entry: Dict[str, Any]) -> None:
     elif edit_mode == "delete":
         row_class += " pcgs-scalar-row--delete"
     
-    st.markdown(f"<div class='{row_class}'>", unsafe_allow_html=True)
+    out.add(f"<div class='{row_class}'>")
+    out.flush()
     
     if is_editing:
         # Edit mode - show inputs
         _render_edit_mode(level, serial, text)
     else:
         # Display mode
-        truncated_text = text[:30] + "..." if len(text) > 30 else text
-        
-        col1, col2, col3 = st.columns([1, 5, 2])
+        col1, col2 = st.columns([6, 2])
         
         with col1:
-            st.markdown(f"<span class='pcgs-scalar-row__serial'>{html.escape(serial)}</span>", unsafe_allow_html=True)
+            st.markdown(_row_label_html(serial, text), unsafe_allow_html=True)
         
         with col2:
-            st.markdown(f"<span class='pcgs-scalar-row__text'>{html.escape(truncated_text)}</span>", unsafe_allow_html=True)
-        
-        with col3:
             # Action buttons based on edit mode
             if edit_mode == "delete":
                 if st.button("🗑️", key=f"pcgs_del_{level.value}_{serial}"):
@@ -490,7 +545,48 @@ def _render_entry_row(level: ScalarLevel, entry: Dict[str, Any]) -> None:
                     _start_editing(level, serial)
                     st.rerun()
     
-    st.markdown("</div>", unsafe_allow_html=True)
+    out.add("</div>")
+
+
+def _render_bulk_editor(level: ScalarLevel, key: str) -> None:
+    """Render a level as one editable table instead of per-row buttons."""
+    entries = scalar_service.get_entries_for_display(level)
+    # The revision is part of the key so each applied batch gets a fresh
+    # editor; otherwise rejected edits would stay on screen and be resent
+    editor_key = f"pcgs_bulk_{key}_{st.session_state.get(BULK_EDITOR_REV_KEY, 0)}"
+    st.data_editor(
+        {
+            BULK_SERIAL_COLUMN: [entry.serial for entry in entries],
+            BULK_TEXT_COLUMN: [entry.text for entry in entries],
+        },
+        key=editor_key,
+        num_rows="dynamic",
+        hide_index=True,
+        on_change=_apply_bulk_edits,
+        args=(level, editor_key),
+    )
+
+
+def _apply_bulk_edits(level: ScalarLevel, editor_key: str) -> None:
+    """Apply a bulk editor's row delta through the scalar service."""
+    state = st.session_state
+    changes = state.pop(editor_key, None) or {}
+    state[BULK_EDITOR_REV_KEY] = state.get(BULK_EDITOR_REV_KEY, 0) + 1
+    
+    errors = scalar_service.apply_bulk_edits(
+        level,
+        deleted_rows=changes.get("deleted_rows", []),
+        edited_rows={
+            int(idx): (row.get(BULK_SERIAL_COLUMN), row.get(BULK_TEXT_COLUMN))
+            for idx, row in changes.get("edited_rows", {}).items()
+        },
+        added_rows=[
+            (row.get(BULK_SERIAL_COLUMN) or "", row.get(BULK_TEXT_COLUMN) or "")
+            for row in changes.get("added_rows", [])
+        ],
+    )
+    for msg in errors:
+        st.error(msg)
 
 
 def _render_edit_mode(level: ScalarLevel, serial: str, text: str) -> None:
@@ -528,14 +624,15 @@ def _render_edit_mode(level: ScalarLevel, serial: str, text: str) -> None:
             st.rerun()
 
 
-def _render_add_entry_row(level: ScalarLevel, key: str) -> None:
+def _render_add_entry_row(out: HtmlBuffer, level: ScalarLevel, key: str) -> None:
     """Render the add entry row at the bottom of a column."""
-    st.markdown("<div class='pcgs-scalar-add-row'>", unsafe_allow_html=True)
+    out.add("<div class='pcgs-scalar-add-row'>")
+    out.flush()
     
     col1, col2, col3 = st.columns([2, 5, 1])
     
     with col1:
-        serial = st.text_input(
+        st.text_input(
             "Serial",
             key=f"pcgs_add_serial_{key}",
             placeholder=scalar_service.get_next_serial(level),
@@ -543,7 +640,7 @@ def _render_add_entry_row(level: ScalarLevel, key: str) -> None:
         )
     
     with col2:
-        text = st.text_input(
+        st.text_input(
             "Text",
             key=f"pcgs_add_text_{key}",
             placeholder="Enter text...",
@@ -551,45 +648,54 @@ def _render_add_entry_row(level: ScalarLevel, key: str) -> None:
         )
     
     with col3:
-        if st.button("+", key=f"pcgs_add_btn_{key}"):
-            if text.strip():
-                success, msg = scalar_service.add_scalar_entry(level, serial, text)
-                if success:
-                    # Clear inputs
-                    st.session_state[f"pcgs_add_serial_{key}"] = ""
-                    st.session_state[f"pcgs_add_text_{key}"] = ""
-                    st.rerun()
-                else:
-                    st.error(msg)
-            else:
-                st.warning("Please enter text content.")
-    
-    st.markdown("</div>", unsafe_allow_html=True)
+        # on_click runs before the inputs exist, so it may clear them
+        st.button("+", key=f"pcgs_add_btn_{key}", on_click=_add_entry, args=(level, key))
+    
+    out.add("</div>")
+
+
+def _add_entry(level: ScalarLevel, key: str) -> None:
+    """Add the entry typed into a column's add row, then clear the inputs."""
+    serial_key = f"pcgs_add_serial_{key}"
+    text_key = f"pcgs_add_text_{key}"
+    text = st.session_state.get(text_key, "")
+    if not text.strip():
+        st.warning("Please enter text content.")
+        return
+    success, msg = scalar_service.add_scalar_entry(
+        level, st.session_state.get(serial_key, ""), text
+    )
+    if success:
+        st.session_state[serial_key] = ""
+        st.session_state[text_key] = ""
+    else:
+        st.error(msg)
 
 
 # ============================================================================
 # AI Console
 # ============================================================================
 
+@st.fragment
 def _render_ai_band() -> None:
     """Render the AI console band."""
-    st.markdown("<div class='pcgs-ai-band'>", unsafe_allow_html=True)
-    st.markdown("<div class='pcgs-ai-band__header'>PROMETHEUS AI</div>", unsafe_allow_html=True)
-    
-    st.markdown("<div class='pcgs-ai-band__feed'>", unsafe_allow_html=True)
+    # A fragment: the prompt has no handler yet, so Enter reruns only the band
     history = st.session_state.get("pcgs_ai_history", [
         ("PKE", "PROMETHEUS Knowledge Engine calibrated. Scalar Builder ready.")
     ])
     
-    for speaker, text in history[-10:]:
-        prefix = "[PKE]" if speaker == "PKE" else ">"
-        st.markdown(
-            f"<div class='pcgs-ai-band__line'><span class='pcgs-ai-band__speaker'>{prefix}</span>{html.escape(text)}</div>",
-            unsafe_allow_html=True,
-        )
-    st.markdown("</div>", unsafe_allow_html=True)
-    
-    st.markdown("<div class='pcgs-ai-band__prompt'>PROMPT<span class='pcgs-ai-band__caret'></span></div>", unsafe_allow_html=True)
+    # Header, feed and prompt go out as one markdown rather than one per line
+    lines_html = "".join(
+        f"<div class='pcgs-ai-band__line'><span class='pcgs-ai-band__speaker'>"
+        f"{'[PKE]' if speaker == 'PKE' else '&gt;'}</span>{_sanitize(text)}</div>"
+        for speaker, text in islice(history, max(0, len(history) - 10), None)
+    )
+    st.markdown(
+        "<div class='pcgs-ai-band'><div class='pcgs-ai-band__header'>PROMETHEUS AI</div>"
+        f"<div class='pcgs-ai-band__feed'>{lines_html}</div>"
+        "<div class='pcgs-ai-band__prompt'>PROMPT<span class='pcgs-ai-band__caret'></span></div>",
+        unsafe_allow_html=True,
+    )
     st.text_input(
         "PKE Input",
         key="pcgs_scalar_ai_input",
@@ -605,9 +711,8 @@ def _render_ai_band() -> None:
 
 def _render_footer_section() -> None:
     """Render the bottom status strip using shared chrome."""
-    counts = scalar_service.get_all_counts()
-    total_entries = sum(counts.values())
-    progress = min(100, int((total_entries / 20) * 100)) if total_entries else 0
+    total_entries = sum(scalar_service.get_all_counts().values())
+    progress = min(100, total_entries * 100 // FOOTER_PROGRESS_TARGET)
     render_footer(progress_percent=progress)
 
 
@@ -620,13 +725,34 @@ def _navigate_to_tab(tab_id: str) -> None:
     navigate_to_tab(tab_id)
 
 
+# ============================================================================
+# Helpers
+# ============================================================================
+
+@lru_cache(maxsize=4096)
+def _sanitize(value: str) -> str:
+    """HTML-escape text; entry and course strings repeat on every rerun."""
+    return html.escape(value)
+
+
 # ============================================================================
 # Styles
 # ============================================================================
 
 def _inject_scalar_styles() -> None:
     """Inject Scalar Manager specific CSS styles."""
-    css = """
+    # Streamlit drops elements a rerun does not re-emit, so the stylesheet
+    # is sent every run; it is minified once per process to keep it small
+    st.markdown(_scalar_css(), unsafe_allow_html=True)
+
+
+@lru_cache(maxsize=1)
+def _scalar_css() -> str:
+    """Return the Scalar Manager stylesheet with comments and indentation stripped."""
+    return minify_css(_SCALAR_STYLES)
+
+
+_SCALAR_STYLES = """
     <style>
     /* Scalar Manager specific layout */
     .pcgs-scalar-root {
@@ -679,26 +805,6 @@ def _inject_scalar_styles() -> None:
         margin-top: 0.5rem;
     }
     
-    /* Edit Tools */
-    .pcgs-tool-button {
-        padding: 2px;
-        border-radius: 8px;
-        border: 1px solid rgba(255, 255, 255, 0.2);
-        background: rgba(0, 0, 0, 0.3);
-    }
-    
-    .pcgs-tool-button button {
-        font-size: 0.65rem !important;
-        padding: 0.4rem 0.2rem !important;
-        letter-spacing: 0.05em;
-    }
-    
-    .pcgs-tool-button--active {
-        border-color: #2CF0FF;
-        background: rgba(44, 240, 255, 0.15);
-        box-shadow: 0 0 10px rgba(44, 240, 255, 0.3);
-    }
-    
     /* PKE Control */
     .pcgs-scalar-pke {
         background: linear-gradient(135deg, rgba(255, 179, 71, 0.15), rgba(255, 179, 71, 0.05));
@@ -777,6 +883,13 @@ def _inject_scalar_styles() -> None:
         min-height: 500px;
     }
     
+    .pcgs-scalar-grid {
+        display: grid;
+        grid-template-columns: repeat(6, minmax(0, 1fr));
+        gap: 1rem;
+        margin-bottom: 0.5rem;
+    }
+    
     .pcgs-scalar-column {
         background: rgba(6, 12, 24, 0.5);
         border-radius: 12px;
@@ -913,5 +1026,4 @@ def _inject_scalar_styles() -> None:
         margin-bottom: 0.5rem;
     }
     </style>
-    """
-    st.markdown(css, unsafe_allow_html=True)
+"""
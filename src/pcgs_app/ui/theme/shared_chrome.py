@@ -6,8 +6,13 @@ across all PCGS V2 tabs.
 """
 
 import html
+import re
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Callable, Dict, List, Optional, Tuple
+from functools import lru_cache
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 import streamlit as st
 
@@ -25,6 +30,42 @@ PROGRAM_STATUS = "IN DEVELOPMENT"
 APPROVED_FOR_USE = "N"
 PKE_ICON = ICONS.get("pke", "🔥")
 HISTORY_LIMIT = 60
+_OWNER_LABEL = CURRENT_USER.upper()
+
+
+# ============================================================================
+# HTML Batching
+# ============================================================================
+
+class HtmlBuffer:
+    """
+    Collects raw HTML fragments so adjacent ones go out as one st.markdown.
+    
+    Every st.markdown call is a separate delta to the frontend; call
+    flush() before rendering a widget and keep appending afterwards.
+    """
+    __slots__ = ("_parts",)
+    
+    def __init__(self) -> None:
+        self._parts: List[str] = []
+    
+    def add(self, fragment: str) -> None:
+        """Queue an HTML fragment."""
+        self._parts.append(fragment)
+    
+    def flush(self) -> None:
+        """Emit the queued fragments as a single markdown element."""
+        if self._parts:
+            st.markdown("".join(self._parts), unsafe_allow_html=True)
+            self._parts.clear()
+
+
+@contextmanager
+def html_buffer() -> Iterator[HtmlBuffer]:
+    """Yield an HtmlBuffer that is flushed when the block exits."""
+    buffer = HtmlBuffer()
+    yield buffer
+    buffer.flush()
 
 
 # ============================================================================
@@ -59,33 +100,54 @@ def render_header_band(
 
 def _render_header_status(page_title: Optional[str] = None) -> None:
     """Render the status information cluster in the header."""
-    now_str = datetime.now().strftime("%d %b %Y %H:%M")
-    
+    st.markdown(header_status_html(page_title), unsafe_allow_html=True)
+
+
+def header_status_html(page_title: Optional[str] = None) -> str:
+    """
+    Return the header status cluster for the loaded course.
+
+    Tabs that batch their header markup add this string to their buffer;
+    it is cached per course info and minute by _header_status_html.
+    """
     # Get course info from session state if available
     course_info = st.session_state.get("pcgs_course_info", {})
-    title = course_info.get(Lex.C_NAME, "") or "UNSPECIFIED"
-    duration = course_info.get(Lex.C_DURATION, "") or "N/A"
-    level = course_info.get(Lex.C_LEVEL, "") or "UNSPECIFIED"
-    thematic = course_info.get(Lex.C_THEME, "") or "UNSPECIFIED"
+    fields = (
+        str(course_info.get(Lex.C_NAME, "") or "UNSPECIFIED"),
+        str(course_info.get(Lex.C_DURATION, "") or "N/A"),
+        str(course_info.get(Lex.C_LEVEL, "") or "UNSPECIFIED"),
+        str(course_info.get(Lex.C_THEME, "") or "UNSPECIFIED"),
+    )
+    return _header_status_html(page_title, fields, int(time.time() // 60))
+
+
+@lru_cache(maxsize=32)
+def _header_status_html(
+    page_title: Optional[str],
+    fields: Tuple[str, str, str, str],
+    minute: int,
+) -> str:
+    """Build the status cluster; the timestamp has minute resolution."""
+    title, duration, level, thematic = fields
+    now_str = datetime.fromtimestamp(minute * 60).strftime("%d %b %Y %H:%M")
     
     page_title_html = ""
     if page_title:
         page_title_html = f'<div class="pcgs-header-status__page-title">{html.escape(page_title)}</div>'
     
-    status_html = f"""
+    return f"""
     <div class="pcgs-header-status">
         <div class="pcgs-header-status__title">PROMETHEUS COURSE GENERATION SYSTEM 2.0</div>
         {page_title_html}
         <div class="pcgs-header-status__timestamp">{now_str}</div>
         <div class="pcgs-header-status__metrics">
-            <span>Course Loaded · {html.escape(str(title))}</span>
-            <span>Duration · {html.escape(str(duration))}</span>
-            <span>Level · {html.escape(str(level))}</span>
-            <span>Thematic · {html.escape(str(thematic))}</span>
+            <span>Course Loaded · {html.escape(title)}</span>
+            <span>Duration · {html.escape(duration)}</span>
+            <span>Level · {html.escape(level)}</span>
+            <span>Thematic · {html.escape(thematic)}</span>
         </div>
     </div>
     """
-    st.markdown(status_html, unsafe_allow_html=True)
 
 
 def _render_action_buttons(
@@ -126,17 +188,22 @@ def render_footer(progress_percent: int = 0) -> None:
     Args:
         progress_percent: Progress percentage (0-100)
     """
-    st.markdown("<div class='pcgs-footer'>", unsafe_allow_html=True)
-    st.markdown(f"<div><strong>Owner:</strong> {CURRENT_USER.upper()}</div>", unsafe_allow_html=True)
-    st.markdown(f"<div><strong>Start Date:</strong> {START_DATE}</div>", unsafe_allow_html=True)
-    st.markdown(f"<div><strong>Status:</strong> {PROGRAM_STATUS}</div>", unsafe_allow_html=True)
-    st.markdown(
+    st.markdown(_footer_html(progress_percent), unsafe_allow_html=True)
+
+
+@lru_cache(maxsize=128)
+def _footer_html(progress_percent: int) -> str:
+    # Everything but the progress value is fixed, so each percentage is built once
+    return (
+        f"<div class='pcgs-footer'>"
+        f"<div><strong>Owner:</strong> {_OWNER_LABEL}</div>"
+        f"<div><strong>Start Date:</strong> {START_DATE}</div>"
+        f"<div><strong>Status:</strong> {PROGRAM_STATUS}</div>"
         f"<div><strong>Progress:</strong> {progress_percent}%"
-        f"<div class='pcgs-progress'><div class='pcgs-progress__value' style='width: {progress_percent}%;'></div></div></div>",
-        unsafe_allow_html=True,
+        f"<div class='pcgs-progress'><div class='pcgs-progress__value' style='width: {progress_percent}%;'></div></div></div>"
+        f"<div><strong>Approved for Use Y/N:</strong> {APPROVED_FOR_USE}</div>"
+        f"</div>"
     )
-    st.markdown(f"<div><strong>Approved for Use Y/N:</strong> {APPROVED_FOR_USE}</div>", unsafe_allow_html=True)
-    st.markdown("</div>", unsafe_allow_html=True)
 
 
 # ============================================================================
@@ -171,7 +238,7 @@ def render_ai_console(
     st.markdown("<div class='pcgs-ai-band__feed'>", unsafe_allow_html=True)
     
     history = st.session_state.get(history_key, [("PKE", default_message)])
-    for speaker, text in history[-HISTORY_LIMIT:]:
+    for speaker, text in islice(history, max(0, len(history) - HISTORY_LIMIT), None):
         prefix = "[PKE]" if speaker == "PKE" else "&gt;"
         st.markdown(
             f"<div class='pcgs-ai-band__line'><span class='pcgs-ai-band__speaker'>{prefix}</span>{html.escape(text)}</div>",
@@ -211,7 +278,22 @@ def navigate_to_tab(tab_id: str) -> None:
 
 def inject_shared_chrome_styles() -> None:
     """Inject additional CSS for shared chrome components."""
-    css = """
+    # Streamlit drops elements a rerun does not re-emit, so the stylesheet
+    # is sent every run; it is minified once per process to keep it small
+    st.markdown(_shared_chrome_css(), unsafe_allow_html=True)
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and collapse whitespace in a <style> block."""
+    return " ".join(re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL).split())
+
+
+@lru_cache(maxsize=1)
+def _shared_chrome_css() -> str:
+    return minify_css(_SHARED_CHROME_STYLES)
+
+
+_SHARED_CHROME_STYLES = """
     <style>
     /* Horizontal button layout for top bar */
     .pcgs-top-buttons--horizontal {
@@ -266,5 +348,3 @@ def inject_shared_chrome_styles() -> None:
     }
     </style>
     """
-    st.markdown(css, unsafe_allow_html=True)
-
@@ -16,13 +16,18 @@ STATUS_CLASS_MAP = {
 }
 
 
+# Dot markup per state, built once at import
+STATUS_DOT_HTML = {
+    state: f"<span class='{css_class}'></span>" for state, css_class in STATUS_CLASS_MAP.items()
+}
+
+
 def render_status_dot(state: Literal["ok", "warn", "error", "idle"]) -> str:
     """
     Return the HTML span representing a themed status dot.
     """
 
-    css_class = STATUS_CLASS_MAP.get(state, STATUS_CLASS_MAP["idle"])
-    return f"<span class='{css_class}'></span>"
+    return STATUS_DOT_HTML.get(state, STATUS_DOT_HTML["idle"])
 
 
 def render_status_light(label: str, status: str) -> None:
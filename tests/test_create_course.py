@@ -0,0 +1,54 @@
+"""
+Create Course Tests
+
+Tests for the Create Course tab's stage completion bookkeeping, driven
+through its handlers with Streamlit stubbed out.
+"""
+
+import sys
+import os
+from types import SimpleNamespace
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from pcgs_app.logic.lexicon import Lex
+from pcgs_app.ui.tabs import tab_create_course as tab
+
+
+@pytest.fixture
+def state(monkeypatch):
+    """Replace the tab's Streamlit handle with a plain session dict."""
+    session = {}
+    monkeypatch.setattr(
+        tab,
+        "st",
+        SimpleNamespace(
+            session_state=session,
+            success=lambda *args, **kwargs: None,
+            info=lambda *args, **kwargs: None,
+        ),
+    )
+    tab._init_state(None)
+    return session
+
+
+def test_reload_after_edit_restores_stage_flags(state):
+    """Reloading a course after an edit marks its saved stages complete again."""
+    course = "Cyber Defense Analyst Bootcamp"
+    state["pcgs_selected_course_option"] = course
+    tab._handle_load_button()
+    desc_flag = tab.STEP_FLAG_KEYS[Lex.C_DESC]
+    assert state[desc_flag] is True
+    completed = state[tab.PROGRESS_COMPLETED_KEY]
+
+    state[tab.DESCRIPTION_INPUT_KEY] = "Edited description"
+    tab._store_description()
+    assert state[desc_flag] is False
+
+    tab._handle_load_button()
+    assert not tab._has_unsaved_stage(Lex.C_DESC)
+    assert state[desc_flag] is True
+    assert state[tab.PROGRESS_COMPLETED_KEY] == completed
@@ -0,0 +1,91 @@
+"""
+Lexicon Tests
+
+Tests for the canonical lexicon lookup helpers:
+- Generated variant index stays in sync with LEXICON
+- Term normalisation and entry lookup
+- Lex sentinels keep their identity through copy and pickle
+"""
+
+import copy
+import pickle
+import sys
+import os
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from pcgs_app.logic.lexicon import (
+    LEXICON,
+    Lex,
+    _VARIANT_INDEX,
+    _normalise_key,
+    get_entry,
+    is_term,
+    match_any,
+    normalise_term,
+)
+
+
+def test_generated_variant_index_matches_lexicon():
+    """Rebuilding the index from LEXICON must match the shipped literal."""
+    rebuilt = {}
+    for lex_id, entry in LEXICON.items():
+        rebuilt[_normalise_key(entry.primary_term)] = lex_id
+        for variant in entry.variants:
+            rebuilt[_normalise_key(variant)] = lex_id
+        rebuilt[_normalise_key(entry.id)] = lex_id
+
+    assert _VARIANT_INDEX == rebuilt, (
+        "Variant index is stale; run `python tools/gen_variant_index.py`"
+    )
+
+
+def test_variant_index_keys_are_interned():
+    """Every index key should be the canonical interned string object."""
+    assert all(sys.intern(key) is key for key in _VARIANT_INDEX)
+
+
+def test_normalise_term():
+    """Test labels and IDs resolve to canonical Lex IDs."""
+    assert normalise_term("Course Name") is Lex.C_NAME
+    assert normalise_term("course-name:") is Lex.C_NAME
+    assert normalise_term("C_NAME") is Lex.C_NAME
+    assert normalise_term("not a lexicon term") is None
+
+
+def test_get_entry_and_is_term():
+    """Test entry lookup by Lex ID and by variant."""
+    assert get_entry(Lex.C_NAME) is LEXICON[Lex.C_NAME]
+    assert get_entry("course title") is LEXICON[Lex.C_NAME]
+    assert get_entry("unknown") is None
+    assert is_term("Course Title", Lex.C_NAME)
+    assert is_term(Lex.CLO, Lex.CLO)
+    assert not is_term("Course Title", Lex.CLO)
+
+
+def test_match_any():
+    """Test matching a value against several Lex IDs."""
+    assert match_any("course title", Lex.CLO, Lex.C_NAME)
+    assert match_any(Lex.CLO, Lex.CLO, Lex.C_NAME)
+    assert not match_any("course title", Lex.CLO, Lex.C_CODE)
+    assert not match_any("course title")
+
+
+def test_lex_identity_survives_copy_and_pickle():
+    """Identity checks such as is_term must hold for copied sentinels."""
+    assert copy.copy(Lex.C_NAME) is Lex.C_NAME
+    assert copy.deepcopy(Lex.C_NAME) is Lex.C_NAME
+    assert copy.deepcopy({Lex.CLO: [Lex.C_NAME]}) == {Lex.CLO: [Lex.C_NAME]}
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        assert pickle.loads(pickle.dumps(Lex.C_NAME, protocol)) is Lex.C_NAME
+    assert is_term(copy.deepcopy(Lex.C_NAME), Lex.C_NAME)
+
+
+def test_lex_ord_is_read_only():
+    """The ordinal indexes the entry table and must not be reassigned."""
+    assert get_entry(Lex.C_NAME) is LEXICON[Lex.C_NAME]
+    with pytest.raises(AttributeError):
+        Lex.C_NAME.ord = 0
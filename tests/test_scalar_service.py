@@ -21,6 +21,7 @@ from pcgs_app.core.scalar_models import (
     ScalarCollection,
     BLOOMS_VERBS,
     check_blooms_verb,
+    correct_blooms_verb,
 )
 
 
@@ -46,6 +47,16 @@ class TestScalarEntry:
         assert entry.parent_serial is None
         assert entry.metadata == {}
     
+    def test_entries_are_slotted(self):
+        """Test entries and collections carry no per-instance __dict__."""
+        entry = ScalarEntry(ScalarLevel.CLO, "1", "Identify threats")
+        assert not hasattr(entry, "__dict__")
+        assert not hasattr(ScalarCollection(), "__dict__")
+        
+        # Mutable fields are still assignable through the slots
+        entry.serial = "2"
+        assert entry.serial == "2"
+    
     def test_to_dict(self):
         """Test serialization to dictionary."""
         entry = ScalarEntry(
@@ -239,6 +250,34 @@ class TestScalarCollection:
         assert restored.count_by_level(ScalarLevel.CLO) == 1
         assert restored.count_by_level(ScalarLevel.TOPIC) == 1
     
+    def test_to_list_from_list_copies_metadata(self):
+        """Test stored dicts and rebuilt entries never share metadata."""
+        entry = ScalarEntry(ScalarLevel.CLO, "1", "CLO 1", metadata={"source": "import"})
+        collection = ScalarCollection([entry])
+        
+        data = collection.to_list()
+        entry.metadata["source"] = "edited"
+        assert data[0]["metadata"] == {"source": "import"}
+        
+        first = ScalarCollection.from_list(data).entries[0]
+        second = ScalarCollection.from_list(data).entries[0]
+        first.metadata["source"] = "changed"
+        assert data[0]["metadata"] == {"source": "import"}
+        assert second.metadata == {"source": "import"}
+        assert ScalarEntry.from_dict(data[0]).metadata is not data[0]["metadata"]
+    
+    def test_from_list_shares_repeated_strings(self):
+        """Test repeated serials and texts are loaded as shared objects."""
+        data = [
+            {"level": "CLO", "serial": ".".join(["1", "2"]), "text": " ".join(["Same", "text"])},
+            {"level": "Topic", "serial": ".".join(["1", "2"]), "text": " ".join(["Same", "text"])},
+        ]
+        assert data[0]["text"] is not data[1]["text"]
+        
+        clo, topic = ScalarCollection.from_list(data).entries
+        assert clo.serial is topic.serial
+        assert clo.text is topic.text
+    
     def test_clear(self):
         """Test clearing all entries."""
         collection = ScalarCollection()
@@ -260,6 +299,78 @@ class TestScalarCollection:
         assert collection.count_by_level(ScalarLevel.CLO) == 0
         assert collection.count_by_level(ScalarLevel.TOPIC) == 1
     
+    def test_level_index_tracks_mutations(self):
+        """Test level queries stay consistent across add/remove/clear."""
+        collection = ScalarCollection.from_list([
+            {"level": "CLO", "serial": "1", "text": "CLO 1", "order_index": 1},
+            {"level": "Topic", "serial": "1.1", "text": "Topic 1", "order_index": 1},
+        ])
+        collection.add_entry(ScalarEntry(ScalarLevel.CLO, "2", "CLO 2"))
+        collection.clear_level(ScalarLevel.TOPIC)
+        collection.add_entry(ScalarEntry(ScalarLevel.TOPIC, "2.1", "Topic 2"))
+        collection.remove_entry(ScalarLevel.CLO, "1")
+        
+        assert [e.serial for e in collection.get_by_level(ScalarLevel.CLO)] == ["2"]
+        assert [e.serial for e in collection.get_by_level(ScalarLevel.TOPIC)] == ["2.1"]
+        assert [e.serial for e in collection.entries] == ["2", "2.1"]
+    
+    def test_serial_lookup_after_update_and_renumber(self):
+        """Test serial-based operations follow serial changes."""
+        collection = ScalarCollection()
+        collection.add_entry(ScalarEntry(ScalarLevel.CLO, "A", "First", order_index=1))
+        collection.add_entry(ScalarEntry(ScalarLevel.CLO, "B", "Second", order_index=2))
+        
+        assert collection.update_entry(ScalarLevel.CLO, "A", new_serial="Z") is True
+        assert collection.update_entry(ScalarLevel.CLO, "A", new_text="x") is False
+        
+        collection.renumber_level(ScalarLevel.CLO)
+        assert collection.remove_entry(ScalarLevel.CLO, "Z") is False
+        assert collection.remove_entry(ScalarLevel.CLO, "2") is True
+        assert [e.text for e in collection.entries] == ["First"]
+    
+    def test_remove_duplicate_serials(self):
+        """Test duplicate serials (e.g. from imports) are removed one at a time."""
+        collection = ScalarCollection()
+        collection.add_entry(ScalarEntry(ScalarLevel.PERFORMANCE_CRITERIA, "PC", "One"))
+        collection.add_entry(ScalarEntry(ScalarLevel.PERFORMANCE_CRITERIA, "PC", "Two"))
+        
+        assert collection.remove_entry(ScalarLevel.PERFORMANCE_CRITERIA, "PC") is True
+        assert [e.text for e in collection.entries] == ["Two"]
+        assert collection.remove_entry(ScalarLevel.PERFORMANCE_CRITERIA, "PC") is True
+        assert collection.count_by_level(ScalarLevel.PERFORMANCE_CRITERIA) == 0
+    
+    def test_get_entry_and_has_serial(self):
+        """Test O(1) serial lookups stay in step with serial changes."""
+        collection = ScalarCollection()
+        entry = ScalarEntry(ScalarLevel.TOPIC, "1.1", "Topic 1")
+        collection.add_entry(entry)
+        
+        assert collection.get_entry(ScalarLevel.TOPIC, "1.1") is entry
+        assert collection.has_serial(ScalarLevel.TOPIC, "1.1")
+        assert not collection.has_serial(ScalarLevel.CLO, "1.1")
+        
+        collection.update_entry(ScalarLevel.TOPIC, "1.1", new_serial="1.2")
+        assert collection.get_entry(ScalarLevel.TOPIC, "1.1") is None
+        assert collection.get_entry(ScalarLevel.TOPIC, "1.2") is entry
+    
+    def test_version_bumps_on_mutation(self):
+        """Test every mutator advances the collection version."""
+        collection = ScalarCollection()
+        versions = [collection.version]
+        
+        collection.add_entry(ScalarEntry(ScalarLevel.CLO, "1", "First"))
+        versions.append(collection.version)
+        collection.update_entry(ScalarLevel.CLO, "1", new_text="Changed")
+        versions.append(collection.version)
+        collection.renumber_level(ScalarLevel.CLO)
+        versions.append(collection.version)
+        collection.mark_modified()
+        versions.append(collection.version)
+        collection.remove_entry(ScalarLevel.CLO, "1")
+        versions.append(collection.version)
+        
+        assert versions == sorted(set(versions))
+    
     def test_get_counts(self):
         """Test getting counts for all levels."""
         collection = ScalarCollection()
@@ -325,6 +436,21 @@ class TestBloomsValidation:
         
         assert has_verb is True
         assert verb == "DESCRIBE"
+        assert corrected == "Describe: the main concepts"
+    
+    def test_check_blooms_verb_leading_whitespace(self):
+        """Test the verb is capitalized in place after leading whitespace."""
+        has_verb, verb, corrected = check_blooms_verb("  identify threats")
+        
+        assert has_verb is True
+        assert verb == "IDENTIFY"
+        assert corrected == "  Identify threats"
+    
+    def test_correct_blooms_verb(self):
+        """Test the shared helper returns the verb and the corrected text."""
+        assert correct_blooms_verb("  identify, then report") == ("IDENTIFY", "  Identify, then report")
+        assert correct_blooms_verb("Understand the concept") == (None, "Understand the concept")
+        assert correct_blooms_verb("") == (None, "")
     
     def test_various_blooms_verbs(self):
         """Test various Bloom's verbs across cognitive levels."""
@@ -343,6 +469,340 @@ class TestBloomsValidation:
             assert verb == expected_verb, f"Failed for: {text}"
 
 
+# ============================================================================
+# Excel Import Tests
+# ============================================================================
+
+def _build_template_workbook() -> bytes:
+    """Build an in-memory workbook following the scalar Excel template."""
+    openpyxl = pytest.importorskip("openpyxl")
+    from io import BytesIO
+    
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet["B1"] = "Header rows are ignored"
+    sheet["B6"], sheet["C6"] = 1, "identify threats"
+    sheet["D6"], sheet["E6"] = "1.1", " Network threats "
+    sheet["C7"] = "Analyze patterns"
+    sheet["J8"], sheet["K8"] = "PC1", "Configure firewall rules"
+    
+    buffer = BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def _build_dated_workbook() -> bytes:
+    """Build a template workbook whose text cells include dates and times."""
+    openpyxl = pytest.importorskip("openpyxl")
+    from datetime import date, time
+    from io import BytesIO
+    
+    workbook = openpyxl.load_workbook(BytesIO(_build_template_workbook()))
+    sheet = workbook.active
+    sheet["B9"], sheet["C9"] = 3, date(2024, 1, 2)
+    sheet["C9"].number_format = "dd/mm/yyyy"
+    sheet["H9"], sheet["I9"] = "L1", time(8, 30)
+    
+    buffer = BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+class TestExcelImport:
+    """Tests for the Excel template loaders."""
+    
+    def test_load_scalar_from_excel(self):
+        """Test level columns are read, stripped and auto-numbered."""
+        pytest.importorskip("pandas")
+        from io import BytesIO
+        from pcgs_app.services.importer.scalar_importer import load_scalar_from_excel
+        
+        collection = load_scalar_from_excel(BytesIO(_build_template_workbook()))
+        
+        clos = collection.get_by_level(ScalarLevel.CLO)
+        assert [(c.serial, c.text) for c in clos] == [
+            ("1", "identify threats"),
+            ("2", "Analyze patterns"),
+        ]
+        topics = collection.get_by_level(ScalarLevel.TOPIC)
+        assert [(t.serial, t.text) for t in topics] == [("1.1", "Network threats")]
+        assert collection.count_by_level(ScalarLevel.PERFORMANCE_CRITERIA) == 1
+        assert collection.count_by_level(ScalarLevel.LESSON) == 0
+    
+    def test_load_scalar_from_excel_matches_service_import(self):
+        """Test the pandas loader and the service import agree on one workbook."""
+        pytest.importorskip("pandas")
+        from io import BytesIO
+        from pcgs_app.services.importer.scalar_importer import load_scalar_from_excel
+        from pcgs_app.services.scalar_service import import_scalar_from_excel
+        
+        import openpyxl
+        
+        # Blank-like and numeric cells must be cleaned the same way by both paths
+        workbook = openpyxl.load_workbook(BytesIO(_build_template_workbook()))
+        sheet = workbook.active
+        sheet["F9"], sheet["G9"] = "   ", "Subtopic without serial"
+        sheet["H10"], sheet["I10"] = 0, "   "
+        sheet["H11"], sheet["I11"] = 2.5, "Lesson two"
+        buffer = BytesIO()
+        workbook.save(buffer)
+        content = buffer.getvalue()
+        success, _, imported = import_scalar_from_excel(content, validate=False)
+        
+        assert success is True
+        assert load_scalar_from_excel(BytesIO(content)) == imported
+        assert imported.count_by_level(ScalarLevel.LESSON) == 1
+    
+    def test_import_scalar_from_workbook(self, tmp_path):
+        """Test the workbook path import returns storage dicts without corrections."""
+        from pcgs_app.services.importer.scalar_importer import import_scalar_from_workbook
+        
+        path = tmp_path / "scalar.xlsx"
+        path.write_bytes(_build_template_workbook())
+        
+        rows = import_scalar_from_workbook(str(path))
+        
+        assert [(r["level"], r["serial"], r["text"]) for r in rows[:2]] == [
+            ("CLO", "1", "identify threats"),
+            ("CLO", "2", "Analyze patterns"),
+        ]
+    
+    def test_import_scalar_from_excel(self):
+        """Test the service import reads the template in read-only mode."""
+        from pcgs_app.services.scalar_service import import_scalar_from_excel
+        
+        success, message, collection = import_scalar_from_excel(_build_template_workbook())
+        
+        assert success, message
+        assert message.startswith("Imported 4 entries")
+        clos = collection.get_by_level(ScalarLevel.CLO)
+        assert [(c.serial, c.text) for c in clos] == [
+            ("1", "Identify threats"),
+            ("2", "Analyze patterns"),
+        ]
+        pcs = collection.get_by_level(ScalarLevel.PERFORMANCE_CRITERIA)
+        assert [(p.serial, p.text) for p in pcs] == [("PC1", "Configure firewall rules")]
+    
+    def test_streaming_reader_matches_openpyxl(self):
+        """Test the streaming reader yields the same non-empty rows as openpyxl."""
+        openpyxl = pytest.importorskip("openpyxl")
+        from io import BytesIO
+        from pcgs_app.services.importer.xlsx_reader import iter_sheet_rows
+        
+        content = _build_dated_workbook()
+        fast = list(iter_sheet_rows(content, min_row=6, max_col=11))
+        
+        workbook = openpyxl.load_workbook(BytesIO(content), read_only=True, data_only=True)
+        try:
+            expected = [
+                row for row in workbook.active.iter_rows(min_row=6, max_col=11, values_only=True)
+                if any(value is not None for value in row)
+            ]
+        finally:
+            workbook.close()
+        
+        assert fast == expected
+    
+    def test_import_reads_date_cells_as_datetimes(self):
+        """Test date-formatted cells import as openpyxl's datetime text."""
+        from pcgs_app.services.scalar_service import import_scalar_from_excel
+        
+        success, _, collection = import_scalar_from_excel(_build_dated_workbook(), validate=False)
+        
+        assert success is True
+        assert collection.get_by_level(ScalarLevel.CLO)[-1].text == "2024-01-02 00:00:00"
+        assert collection.get_by_level(ScalarLevel.LESSON)[0].text == "08:30:00"
+    
+    def test_calamine_reader_matches_streaming_reader(self):
+        """Test the optional calamine reader agrees with the streaming reader."""
+        pytest.importorskip("python_calamine")
+        from pcgs_app.services.importer.xlsx_reader import (
+            iter_sheet_rows,
+            read_sheet_rows_calamine,
+        )
+        
+        content = _build_dated_workbook()
+        
+        assert read_sheet_rows_calamine(content, min_row=6, max_col=11) == list(
+            iter_sheet_rows(content, min_row=6, max_col=11)
+        )
+    
+    def test_import_scalar_from_excel_invalid_bytes(self):
+        """Test unreadable content is reported rather than raised."""
+        pytest.importorskip("openpyxl")
+        from pcgs_app.services.scalar_service import import_scalar_from_excel
+        
+        success, message, collection = import_scalar_from_excel(b"not a workbook")
+        
+        assert not success
+        assert message.startswith("Error reading Excel file")
+        assert collection.entries == []
+    
+    def test_import_scalar_from_excel_without_openpyxl(self, monkeypatch):
+        """Test the openpyxl fallback reports a missing install."""
+        from pcgs_app.services import scalar_service
+        
+        monkeypatch.setattr(scalar_service, "_load_openpyxl", lambda: None)
+        success, message, collection = scalar_service.import_scalar_from_excel(b"not a workbook")
+        
+        assert not success
+        assert message.startswith("openpyxl library not installed")
+        assert collection.entries == []
+
+
+# ============================================================================
+# Service Session Tests
+# ============================================================================
+
+class TestServiceSession:
+    """Tests for the session-backed service helpers."""
+    
+    def test_display_rows_cached_until_mutation(self):
+        """Test display entries are reused until the collection changes."""
+        import streamlit as st
+        from pcgs_app.services import scalar_service, scalar_session
+        
+        collection = ScalarCollection()
+        collection.add_entry(ScalarEntry(ScalarLevel.CLO, "1", "Identify threats"))
+        st.session_state[scalar_session.SCALAR_STATE_KEY] = collection
+        
+        first = scalar_service.get_entries_for_display(ScalarLevel.CLO)
+        assert [e.serial for e in first] == ["1"]
+        assert scalar_service.get_entries_for_display(ScalarLevel.CLO) is first
+        assert scalar_service.get_entries_for_display(ScalarLevel.CLO, as_dicts=True) == [
+            {"serial": "1", "text": "Identify threats", "order_index": 1}
+        ]
+        
+        collection.update_entry(ScalarLevel.CLO, "1", new_text="Analyze threats")
+        second = scalar_service.get_entries_for_display(ScalarLevel.CLO)
+        assert second is not first
+        assert second[0].text == "Analyze threats"
+        
+        st.session_state[scalar_session.SCALAR_STATE_KEY] = ScalarCollection()
+        assert scalar_service.get_entries_for_display(ScalarLevel.CLO) == []
+
+    
+    def test_move_entry_up_and_down(self):
+        """Test entries swap with their neighbours and are renumbered."""
+        import streamlit as st
+        from pcgs_app.services import scalar_service, scalar_session
+        
+        collection = ScalarCollection()
+        for serial, text in (("1", "Identify"), ("2", "Analyze"), ("3", "Evaluate")):
+            collection.add_entry(ScalarEntry(ScalarLevel.CLO, serial, text))
+        st.session_state[scalar_session.SCALAR_STATE_KEY] = collection
+        
+        assert scalar_service.move_entry_up(ScalarLevel.CLO, "1")[0] is False
+        assert scalar_service.move_entry_down(ScalarLevel.CLO, "3")[0] is False
+        assert scalar_service.move_entry_up(ScalarLevel.CLO, "9")[0] is False
+        
+        assert scalar_service.move_entry_up(ScalarLevel.CLO, "3")[0] is True
+        texts = [e.text for e in scalar_service.get_entries_for_display(ScalarLevel.CLO)]
+        assert texts == ["Identify", "Evaluate", "Analyze"]
+        
+        assert scalar_service.move_entry_down(ScalarLevel.CLO, "1")[0] is True
+        entries = scalar_service.get_entries_for_display(ScalarLevel.CLO)
+        assert [e.text for e in entries] == ["Evaluate", "Identify", "Analyze"]
+        assert [e.serial for e in entries] == ["1", "2", "3"]
+    
+    def test_apply_bulk_edits_targets_row_entries(self):
+        """Test bulk row changes act on the row's entry even with duplicate serials."""
+        import streamlit as st
+        from pcgs_app.services import scalar_service, scalar_session
+        
+        level = ScalarLevel.PERFORMANCE_CRITERIA
+        collection = ScalarCollection()
+        for serial, text in (("PC", "One"), ("PC", "Two"), ("X", "Three")):
+            collection.add_entry(ScalarEntry(level, serial, text))
+        st.session_state[scalar_session.SCALAR_STATE_KEY] = collection
+        
+        errors = scalar_service.apply_bulk_edits(
+            level,
+            deleted_rows=[1],
+            edited_rows={0: (None, "One edited"), 2: ("1", None)},
+            added_rows=[("", "Four"), ("", "  ")],
+        )
+        
+        entries = scalar_service.get_entries_for_display(level)
+        assert [(e.serial, e.text) for e in entries] == [
+            ("1", "One edited"), ("2", "Three"), ("3", "Four"),
+        ]
+        assert errors == [f"Serial '1' already exists for {level.value}"]
+    
+    def test_add_warning_dedupes_and_caps(self):
+        """Test warnings are deduplicated and capped at the most recent."""
+        import streamlit as st
+        from pcgs_app.services import scalar_session
+        
+        st.session_state[scalar_session.SCALAR_WARNINGS_KEY] = []
+        for i in range(15):
+            scalar_session.add_warning(f"w{i}")
+        scalar_session.add_warning("w14")
+        
+        warnings = scalar_session.get_warnings()
+        assert warnings == [f"w{i}" for i in range(5, 15)]
+
+    
+    def test_validate_all_clos_batches_corrections(self):
+        """Test CLOs are corrected and warnings recorded in one pass."""
+        import streamlit as st
+        from pcgs_app.services import scalar_service, scalar_session
+        
+        collection = ScalarCollection()
+        collection.add_entry(ScalarEntry(ScalarLevel.CLO, "1", "identify threats"))
+        collection.add_entry(ScalarEntry(ScalarLevel.CLO, "2", "Learn about security"))
+        collection.add_entry(ScalarEntry(ScalarLevel.CLO, "3", "Analyze: traffic"))
+        version = collection.version
+        st.session_state[scalar_session.SCALAR_WARNINGS_KEY] = [
+            "Warning: CLO 2 does not start with a Bloom's performance verb."
+        ]
+        
+        warnings = scalar_service.validate_all_clos(collection)
+        
+        assert warnings == ["Warning: CLO 2 does not start with a Bloom's performance verb."]
+        assert scalar_session.get_warnings() == warnings
+        assert collection.get_entry(ScalarLevel.CLO, "1").text == "Identify threats"
+        assert collection.get_entry(ScalarLevel.CLO, "3").text == "Analyze: traffic"
+        assert collection.version > version
+    
+    def test_import_from_file_reuses_parsed_upload(self, monkeypatch):
+        """Test a repeated upload is served from the digest cache."""
+        pytest.importorskip("openpyxl")
+        from io import BytesIO
+        import streamlit as st
+        from pcgs_app.services import scalar_service, scalar_session
+        
+        st.session_state.pop(scalar_session.SCALAR_IMPORT_CACHE_KEY, None)
+        content = _build_template_workbook()
+        calls = []
+        real_import = scalar_service.import_scalar_from_excel
+        
+        def counting_import(file_content, validate=True):
+            calls.append(file_content)
+            return real_import(file_content, validate=validate)
+        
+        monkeypatch.setattr(scalar_service, "import_scalar_from_excel", counting_import)
+        
+        first = scalar_session.import_scalar_from_file(BytesIO(content))
+        collection = scalar_session.get_scalar_collection()
+        collection.update_entry(ScalarLevel.CLO, "1", new_text="Edited")
+        second = scalar_session.import_scalar_from_file(BytesIO(content))
+        
+        assert first == second
+        assert first[0] is True
+        assert len(calls) == 1
+        restored = scalar_session.get_scalar_collection()
+        assert restored is not collection
+        assert restored.get_entry(ScalarLevel.CLO, "1").text == "identify threats"
+        
+        # Bloom's validation is deferred until the tab asks for it, once
+        assert st.session_state[scalar_session.SCALAR_PENDING_VALIDATION_KEY] is True
+        assert scalar_session.run_pending_validation() is True
+        assert restored.get_entry(ScalarLevel.CLO, "1").text == "Identify threats"
+        assert scalar_session.SCALAR_PENDING_VALIDATION_KEY not in st.session_state
+        assert scalar_session.run_pending_validation() is False
+
+
 # ============================================================================
 # Integration Tests
 # ============================================================================
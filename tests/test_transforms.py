@@ -0,0 +1,48 @@
+"""
+Transform Tests
+
+Tests for reshaping course form payloads into Lex-keyed models.
+"""
+
+import sys
+import os
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from pcgs_app.logic.lexicon import LEXICON, Lex, _normalise_key
+from pcgs_app.logic.transforms import COURSE_FORM_FIELDS, course_form_to_model
+
+
+def test_course_fields_do_not_share_terms():
+    """Each course field term must resolve to exactly one field."""
+    seen = {}
+    for lex_id in COURSE_FORM_FIELDS:
+        entry = LEXICON[lex_id]
+        for term in (entry.id, entry.primary_term, *entry.variants):
+            assert seen.setdefault(_normalise_key(term), lex_id) is lex_id
+
+
+def test_course_form_to_model_maps_course_fields():
+    """Course terms map to course fields, never to other lexicon entries."""
+    model = course_form_to_model({
+        "title": "X",
+        "thematic": "a",
+        "Course Level": "Advanced",
+        "unknown_field": 1,
+    })
+    assert model == {
+        Lex.C_NAME: "X",
+        Lex.C_THEME: "a",
+        Lex.C_LEVEL: "Advanced",
+        "unknown_field": 1,
+    }
+    assert Lex.REF_TITLE not in model
+
+
+def test_course_form_to_model_rejects_colliding_keys():
+    """Two keys for one field must not silently overwrite each other."""
+    with pytest.raises(ValueError):
+        course_form_to_model({"thematic": "a", "category": "b"})
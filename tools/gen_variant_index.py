@@ -0,0 +1,64 @@
+"""
+Variant Index Generator
+
+Regenerates ``src/pcgs_app/logic/_variant_index_generated.py`` from the
+current ``LEXICON`` so the normalised variant -> Lex lookup ships as a literal
+instead of being rebuilt on every interpreter start.
+
+Run from the repository root after editing any lexicon entry:
+
+    python tools/gen_variant_index.py
+"""
+
+import json
+import os
+import sys
+from typing import Dict
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from pcgs_app.logic.lexicon import LEXICON, Lex, _normalise_key  # noqa: E402
+
+OUTPUT_PATH = os.path.join(ROOT, "src", "pcgs_app", "logic", "_variant_index_generated.py")
+
+HEADER = '''"""
+Generated normalised variant -> Lex lookup.
+
+DO NOT EDIT: regenerate with ``python tools/gen_variant_index.py``.
+"""
+
+from typing import Any, Dict
+
+
+def build_variant_index(Lex: Any) -> Dict[str, Any]:
+    """Return the variant index keyed by normalised term."""
+    return {
+'''
+
+
+def build_variant_index() -> Dict[str, Lex]:
+    """Normalise every primary term, variant, and ID in LEXICON."""
+    index: Dict[str, Lex] = {}
+    for lex_id, entry in LEXICON.items():
+        index[_normalise_key(entry.primary_term)] = lex_id
+        for variant in entry.variants:
+            index[_normalise_key(variant)] = lex_id
+        index[_normalise_key(entry.id)] = lex_id
+    return index
+
+
+def render(index: Dict[str, Lex]) -> str:
+    """Render the generated module source."""
+    lines = [f"        {json.dumps(key)}: Lex.{lex_id.name},\n" for key, lex_id in index.items()]
+    return HEADER + "".join(lines) + "    }\n"
+
+
+def main() -> None:
+    with open(OUTPUT_PATH, "w", encoding="utf-8") as handle:
+        handle.write(render(build_variant_index()))
+    print(f"Wrote {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()